@@ -39,7 +39,8 @@ export class MovementAnimator {
       }
 
       if (adjustMoves) {
-        unit.move(prevHex, this.#board.getAdjacentHexes(prevHex));
+        const lastStepCost = this.#board.getMoveCost(path[path.length - 2], prevHex);
+        unit.move(prevHex, this.#board.getAdjacentHexes(prevHex), lastStepCost);
       }
       this.#board.refreshCombat();
       eventBus.emit('redraw');
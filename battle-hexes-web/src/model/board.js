@@ -8,6 +8,7 @@ export class Board {
   #hoverHex;
   #units;
   #roads;
+  #roadMoveCosts = null;
   #players;
   #animator;
   #rows;
@@ -187,11 +188,12 @@ export class Board {
   }
 
   moveUnit(unit, oldHex, newHex) {
-    if (!unit.canEnterHex(newHex)) {
+    const moveCost = this.getMoveCost(oldHex, newHex);
+    if (!unit.canEnterHex(newHex, moveCost)) {
       throw new Error('Unit does not have enough movement points to enter destination hex.');
     }
 
-    unit.move(newHex, this.getAdjacentHexes(newHex));
+    unit.move(newHex, this.getAdjacentHexes(newHex), moveCost);
     oldHex.removeUnit(unit);
     newHex.addUnit(unit);
   }
@@ -215,7 +217,8 @@ export class Board {
 
   // A legal entry requires sufficient movement, no enemy occupants, and staying within the optional friendly stacking cap.
   canUnitLegallyEnterHex(unit, destinationHex) {
-    if (!unit.canEnterHex(destinationHex)) {
+    const moveCost = this.getMoveCost(unit.getContainingHex(), destinationHex);
+    if (!unit.canEnterHex(destinationHex, moveCost)) {
       return false;
     }
 
@@ -375,8 +378,57 @@ export class Board {
     }
   }
 
+  // Mirrors the server's edge costs: a step along a road between adjacent hexes costs the cheaper of the road and the terrain entered.
+  getMoveCost(fromHex, toHex) {
+    const terrainMoveCost = toHex?.getMoveCost?.() ?? 1;
+    if (!fromHex || !toHex) {
+      return terrainMoveCost;
+    }
+
+    const roadMoveCost = this.#getRoadMoveCosts().get(Board.#edgeKey(fromHex, toHex));
+    return roadMoveCost !== undefined && roadMoveCost < terrainMoveCost
+      ? roadMoveCost
+      : terrainMoveCost;
+  }
+
+  #getRoadMoveCosts() {
+    if (this.#roadMoveCosts !== null) {
+      return this.#roadMoveCosts;
+    }
+
+    this.#roadMoveCosts = new Map();
+    for (const road of this.#roads) {
+      const roadMoveCost = road.movementCost;
+      if (!Number.isFinite(roadMoveCost) || roadMoveCost < 0) {
+        continue;
+      }
+
+      for (let index = 0; index < road.path.length - 1; index += 1) {
+        const fromHex = this.getHex(...road.path[index]);
+        const toHex = this.getHex(...road.path[index + 1]);
+        // Consecutive path hexes that do not touch are not joined by the road.
+        if (!fromHex || !toHex || !fromHex.isAdjacent(toHex)) {
+          continue;
+        }
+
+        for (const edgeKey of [Board.#edgeKey(fromHex, toHex), Board.#edgeKey(toHex, fromHex)]) {
+          const knownMoveCost = this.#roadMoveCosts.get(edgeKey);
+          if (knownMoveCost === undefined || roadMoveCost < knownMoveCost) {
+            this.#roadMoveCosts.set(edgeKey, roadMoveCost);
+          }
+        }
+      }
+    }
+    return this.#roadMoveCosts;
+  }
+
+  static #edgeKey(fromHex, toHex) {
+    return `${fromHex.row},${fromHex.column}>${toHex.row},${toHex.column}`;
+  }
+
   addRoad(road) {
     this.#roads.push(road);
+    this.#roadMoveCosts = null;
     console.log("There are " + this.#roads.length + " roads.");
   }
 
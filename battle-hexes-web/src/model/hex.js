@@ -108,6 +108,14 @@ export class Hex {
     return this.#terrain;
   }
 
+  // Cost to enter this hex over its terrain, or 1 when the terrain sets no valid cost.
+  getMoveCost() {
+    const terrainMoveCost = this.#terrain?.moveCost;
+    return Number.isFinite(terrainMoveCost) && terrainMoveCost > 0
+      ? terrainMoveCost
+      : 1;
+  }
+
   addObjective(objective) {
     this.#objectives.push(objective);
   }
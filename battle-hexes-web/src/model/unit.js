@@ -52,7 +52,8 @@ export class Unit {
   getMovePath() { return this.#movePath; }
   hasMovePath() { return this.#movePath.length > 0; }
 
-  move(destinationHex, adjacentHexes) {
+  // moveCost defaults to the destination's terrain cost; the board passes the road-aware cost of the step.
+  move(destinationHex, adjacentHexes, moveCost = terrainMoveCost(destinationHex)) {
     if (this.#movesRemaining <= 0) {
       throw new Error('No movement points remaining!');
     }
@@ -66,11 +67,6 @@ export class Unit {
       return;
     }
 
-    const terrainMoveCost = destinationHex?.getTerrain()?.moveCost;
-    const moveCost = Number.isFinite(terrainMoveCost) && terrainMoveCost > 0
-      ? terrainMoveCost
-      : 1;
-
     this.#movesRemaining = Math.max(0, this.#movesRemaining - moveCost);
     if (this.#movesRemaining <= 1) {
       this.#defensiveFireAvailable = false;
@@ -107,11 +103,7 @@ export class Unit {
     this.#combatOpponents = [];
   }
 
-  canEnterHex(destinationHex) {
-    const terrainMoveCost = destinationHex?.getTerrain()?.moveCost;
-    const moveCost = Number.isFinite(terrainMoveCost) && terrainMoveCost > 0
-      ? terrainMoveCost
-      : 1;
+  canEnterHex(destinationHex, moveCost = terrainMoveCost(destinationHex)) {
     return this.getMovesRemaining() >= moveCost;
   }
 
@@ -144,3 +136,7 @@ export class Unit {
   getCombatOpponents() { return this.#combatOpponents; }
   isOwnedBy(player) { return this.getOwningPlayer() == player; }
 }
+
+function terrainMoveCost(aHex) {
+  return aHex?.getMoveCost?.() ?? 1;
+}
@@ -20,6 +20,7 @@ describe('MovementAnimator', () => {
       updateUnitPosition: jest.fn(),
       refreshCombat: jest.fn(),
       getAdjacentHexes: jest.fn(() => new Set()),
+      getMoveCost: jest.fn(() => 2),
     };
     unit = { move: jest.fn() };
     hexA = { id: 'a' };
@@ -43,7 +44,8 @@ describe('MovementAnimator', () => {
     await jest.runOnlyPendingTimersAsync();
     await promise;
 
-    expect(unit.move).toHaveBeenCalledWith(hexC, new Set());
+    expect(board.getMoveCost).toHaveBeenCalledWith(hexB, hexC);
+    expect(unit.move).toHaveBeenCalledWith(hexC, new Set(), 2);
     expect(board.refreshCombat).toHaveBeenCalled();
     expect(eventBus.emit).toHaveBeenCalledWith('menuUpdate');
   });
@@ -7,6 +7,7 @@ jest.mock('../../src/animation/movement-animator.js', () => ({
 
 import { Board } from '../../src/model/board.js';
 import { Faction } from '../../src/model/faction.js';
+import { Road, RoadType } from '../../src/model/road.js';
 import { Unit } from '../../src/model/unit.js';
 
 describe('addUnit', () => {
@@ -237,6 +238,70 @@ describe('animator integration', () => {
 
     expect(animatorInstance.animate).not.toHaveBeenCalled();
   });
+
+  test('selectHex animates movement when a road makes the destination affordable', () => {
+    const player = { isHuman: () => true };
+    const factions = [new Faction('f1', 'f1', '#f00')];
+    factions[0].setOwningPlayer(player);
+    const board = new Board(1, 2);
+    board.players = { getCurrentPlayer: () => player };
+    board.addRoad(new Road(new RoadType('secondary', 0.5), [[0, 0], [0, 1]]));
+    const unit = new Unit('u1', 'Unit', factions[0], null, 1, 1, 1);
+    board.addUnit(unit, 0, 0);
+
+    const start = board.getHex(0, 0);
+    const end = board.getHex(0, 1);
+    end.setTerrain({ moveCost: 2 });
+
+    const animatorInstance = board.animator;
+    board.selectHex(start);
+    board.selectHex(end);
+
+    expect(animatorInstance.animate).toHaveBeenCalledWith(unit, [start, end], true);
+  });
+});
+
+
+describe('getMoveCost', () => {
+  let board;
+
+  beforeEach(() => {
+    board = new Board(4, 4);
+    for (const aHex of board.getAllHexes()) {
+      aHex.setTerrain({ moveCost: 3 });
+    }
+  });
+
+  test('charges the entered hex terrain cost off the road', () => {
+    expect(board.getMoveCost(board.getHex(1, 1), board.getHex(2, 1))).toBe(3);
+    expect(board.getMoveCost(undefined, board.getHex(2, 1))).toBe(3);
+  });
+
+  test('charges the cheapest road joining two adjacent hexes in either direction', () => {
+    board.addRoad(new Road(new RoadType('track', 2), [[0, 0], [1, 0], [2, 0]]));
+    board.addRoad(new Road(new RoadType('secondary', 0.5), [[2, 0], [1, 0]]));
+
+    expect(board.getMoveCost(board.getHex(0, 0), board.getHex(1, 0))).toBe(2);
+    expect(board.getMoveCost(board.getHex(1, 0), board.getHex(0, 0))).toBe(2);
+    expect(board.getMoveCost(board.getHex(1, 0), board.getHex(2, 0))).toBe(0.5);
+    expect(board.getMoveCost(board.getHex(2, 0), board.getHex(1, 0))).toBe(0.5);
+  });
+
+  test('ignores road segments between hexes that do not touch', () => {
+    board.addRoad(new Road(new RoadType('secondary', 0.5), [[0, 0], [3, 0]]));
+
+    expect(board.getMoveCost(board.getHex(0, 0), board.getHex(3, 0))).toBe(3);
+  });
+
+  test('moveUnit spends the road cost of the step', () => {
+    board.addRoad(new Road(new RoadType('secondary', 0.5), [[0, 0], [1, 0]]));
+    const unit = new Unit('u1', 'Unit', new Faction('f1', 'f1', '#f00'), null, 1, 1, 2);
+    board.addUnit(unit, 0, 0);
+
+    board.moveUnit(unit, board.getHex(0, 0), board.getHex(1, 0));
+
+    expect(unit.getMovesRemaining()).toBe(1.5);
+  });
 });
 
 
@@ -96,6 +96,18 @@ describe('canEnterHex', () => {
 
     expect(unit.canEnterHex(destinationHex)).toBe(false);
   });
+
+  test('uses the step cost given by the board instead of the terrain cost', () => {
+    const unit = new Unit('15', 'Test Unit', friendlyFaction, null, 4, 4, 1);
+    const destinationHex = new Hex(2, 3);
+    destinationHex.setTerrain({ moveCost: 3 });
+
+    expect(unit.canEnterHex(destinationHex, 0.5)).toBe(true);
+
+    unit.move(destinationHex, [], 0.5);
+
+    expect(unit.getMovesRemaining()).toBe(0.5);
+  });
 });
 
 
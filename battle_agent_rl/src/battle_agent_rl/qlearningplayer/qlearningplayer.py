@@ -9,6 +9,7 @@ from pydantic import PrivateAttr
 
 from battle_hexes_core.combat.combatresults import CombatResults
 from battle_hexes_core.game.board import Board
+from battle_hexes_core.game.movement import PathTree
 from battle_hexes_core.game.player import PlayerType
 from battle_hexes_core.game.unitmovementplan import UnitMovementPlan
 from battle_hexes_core.unit.faction import Faction
@@ -20,6 +21,71 @@ from ..rlplayer import RLPlayer
 logger = logging.getLogger(__name__)
 
 
+class _UnitDistances:
+    """Unit-to-unit hex distances for one board state.
+
+    Built once per decision point so that encoding every unit's state
+    does not repeat lookups. Distance rows are computed on first use and
+    nearest units come from the board's ring index, so only the units
+    actually encoded pay for their distances.
+    """
+
+    def __init__(self, board: Board):
+        self.board = board
+        self.units = board.get_units()
+        self._hex_ids = [board.unit_hex_id(unit) for unit in self.units]
+        self._placed_ids = [
+            hex_id for hex_id in self._hex_ids if hex_id is not None
+        ]
+        self._rows: dict[int, list[int | None]] = {}
+        self._index_by_id = {
+            unit.get_id(): index for index, unit in enumerate(self.units)
+        }
+
+    def index(self, unit: Unit) -> int | None:
+        index = self._index_by_id.get(unit.get_id())
+        if index is None or self.units[index] is not unit:
+            return None
+        return index
+
+    def row(self, unit: Unit) -> list[int | None] | None:
+        """Return distances from ``unit`` or ``None`` if it is off-board."""
+        index = self.index(unit)
+        if index is None or unit.get_coords() is None:
+            return None
+        row = self._rows.get(index)
+        if row is None:
+            hex_id = self._hex_ids[index]
+            placed = iter(self.board.geometry.distances_from(
+                hex_id, self._placed_ids
+            ))
+            row = [
+                None if other_id is None else next(placed)
+                for other_id in self._hex_ids
+            ]
+            self._rows[index] = row
+        return row
+
+    def distance(self, from_index: int, to_index: int) -> int | None:
+        """Return the distance between two units, ``None`` if off-board."""
+        from_id = self._hex_ids[from_index]
+        to_id = self._hex_ids[to_index]
+        if from_id is None or to_id is None:
+            return None
+        return self.board.geometry.distance(from_id, to_id)
+
+    def nearest(self, unit: Unit, friend: bool) -> int | None:
+        """Return the index of the nearest same- or other-faction unit.
+
+        Uses :meth:`Board.get_nearest_unit`, including its tie-break on
+        board order.
+        """
+        if self.index(unit) is None or unit.get_coords() is None:
+            return None
+        nearest = self.board.get_nearest_unit(unit, friend)
+        return None if nearest is None else self.index(nearest)
+
+
 class ActionIntent(Enum):
     ADVANCE = "ADVANCE"
     RETREAT = "RETREAT"
@@ -91,6 +157,7 @@ class QLearningPlayer(RLPlayer):
 
     _learn = PrivateAttr()
     _explore = PrivateAttr()
+    _random = PrivateAttr()
 
     def __init__(
         self,
@@ -151,6 +218,10 @@ class QLearningPlayer(RLPlayer):
         self._last_actions = {}
         self._learn = True
         self._explore = True
+        self._random = random
+
+    def use_random(self, rng) -> None:
+        self._random = rng
 
     def disable_learning(self) -> None:
         """Disable learning for the agent."""
@@ -233,25 +304,65 @@ class QLearningPlayer(RLPlayer):
         logger.info("")
         self._last_actions = {}
         plans: List[UnitMovementPlan] = []
+        distances = self._unit_distances()
+        choices = []
         for unit in self.own_units(self._board.get_units()):
-            state = self.encode_unit_state(unit)
+            state = self.encode_unit_state(unit, distances)
             actions = self.available_actions(unit)
             chosen = self.choose_action(unit, state, actions)
             # Store the unit reference so we can update after combat even if it
             # was destroyed.
             self._last_actions[unit.get_id()] = (unit, state, chosen)
-            plan = self.move_plan(unit, chosen[0], chosen[1])
+            choices.append((unit, chosen))
+
+        # Plans do not change the board, so every moving unit's search can
+        # run in one batch once all actions are chosen.
+        path_trees = self._move_path_trees(choices)
+        for unit, chosen in choices:
+            plan = self.move_plan(
+                unit, chosen[0], chosen[1], path_trees.get(unit.get_id())
+            )
             if plan is not None:
                 plans.append(plan)
 
         # self.print_last_actions()
         return plans
 
+    def _move_points(self, unit: Unit, magnitude: ActionMagnitude) -> int:
+        move_points = unit.get_move()
+        if magnitude == ActionMagnitude.HALF:
+            move_points = move_points // 2
+        elif magnitude == ActionMagnitude.NONE:
+            move_points = 0
+        return move_points
+
+    def _move_path_trees(
+            self,
+            choices: List[Tuple[Unit, Tuple[ActionIntent, ActionMagnitude]]],
+            ) -> Dict[str, PathTree]:
+        """Search for every unit that will move, in one batched call."""
+        board = self._board
+        units = []
+        move_points = []
+        for unit, (action, magnitude) in choices:
+            unit_move_points = self._move_points(unit, magnitude)
+            if action == ActionIntent.HOLD or unit_move_points <= 0:
+                continue
+            units.append(unit)
+            move_points.append(unit_move_points)
+        path_trees = board.get_path_trees(units, move_points)
+        return {
+            unit.get_id(): path_tree
+            for unit, path_tree in zip(units, path_trees)
+            if path_tree is not None
+        }
+
     def move_plan(
             self,
             unit: Unit,
             action: ActionIntent,
-            magnitude: ActionMagnitude
+            magnitude: ActionMagnitude,
+            path_tree: PathTree | None = None,
             ) -> UnitMovementPlan:
         """
         Create a movement plan for the unit based on the chosen action and
@@ -263,6 +374,9 @@ class QLearningPlayer(RLPlayer):
 
         ``FULL`` uses all movement points, ``HALF`` uses half (floored) and
         ``NONE`` results in no movement.
+
+        ``path_tree`` may pass in the unit's search from
+        :meth:`_move_path_trees` so it is not repeated.
         """
         board = self._board
         start_coords = unit.get_coords()
@@ -273,12 +387,7 @@ class QLearningPlayer(RLPlayer):
         if start_hex is None:
             return UnitMovementPlan(unit, [])
 
-        move_points = unit.get_move()
-        if magnitude == ActionMagnitude.HALF:
-            move_points = move_points // 2
-        elif magnitude == ActionMagnitude.NONE:
-            move_points = 0
-
+        move_points = self._move_points(unit, magnitude)
         if action == ActionIntent.HOLD or move_points <= 0:
             return UnitMovementPlan(unit, [start_hex])
 
@@ -289,9 +398,13 @@ class QLearningPlayer(RLPlayer):
         enemy_hex = board.get_hex(*enemy.get_coords())
 
         if action == ActionIntent.ADVANCE:
-            path = board.path_towards(unit, enemy_hex, move_points)
+            path = board.path_towards(
+                unit, enemy_hex, move_points, path_tree
+            )
         else:  # RETREAT
-            path = board.path_away_from(unit, enemy_hex, move_points)
+            path = board.path_away_from(
+                unit, enemy_hex, move_points, path_tree
+            )
 
         if not path:
             path = [start_hex]
@@ -318,8 +431,8 @@ class QLearningPlayer(RLPlayer):
     ) -> Tuple[ActionIntent, ActionMagnitude]:
         if not actions:
             return (ActionIntent.HOLD, ActionMagnitude.NONE)
-        if random.random() < self._epsilon:
-            return random.choice(actions)
+        if self._random.random() < self._epsilon:
+            return self._random.choice(actions)
 
         logger.info("Current state for unit %s is: %s", str(unit), state)
         logger.info("Available actions are:")
@@ -346,7 +459,7 @@ class QLearningPlayer(RLPlayer):
         for a in best:
             logger.info("  Action: %s", a)
 
-        selected_action = random.choice(best)
+        selected_action = self._random.choice(best)
         logger.info("Chose action %s", selected_action)
         return selected_action
 
@@ -382,8 +495,12 @@ class QLearningPlayer(RLPlayer):
         extra_turns = (distance - 1) // move
         return min(3, extra_turns)
 
+    def _unit_distances(self) -> "_UnitDistances":
+        """Return unit-to-unit distances for the current board state."""
+        return _UnitDistances(self._board)
+
     def encode_unit_state(
-            self, unit: Unit
+            self, unit: Unit, distances: "_UnitDistances | None" = None
     ) -> Tuple[int, int, int, int, int, int]:
         """Return a 6-tuple state for ``unit``.
 
@@ -395,47 +512,49 @@ class QLearningPlayer(RLPlayer):
         movement factor. ``eta_ally_to_enemy`` uses the nearest ally's
         movement factor to estimate the turns required for that ally to
         reach the unit's nearest enemy.
+
+        Pass ``distances`` from :meth:`_unit_distances` when encoding
+        several units against the same board state.
         """
 
         my_strength = unit.get_strength()
-        coords = unit.get_coords()
-        if coords is None:
-            return (my_strength, 0, 0, 0, 0, 0)
-
-        own_hex = self._board.get_hex(*coords)
-        if own_hex is None:
+        if distances is None:
+            distances = self._unit_distances()
+        row = distances.row(unit)
+        if row is None:
             return (my_strength, 0, 0, 0, 0, 0)
 
         move = unit.get_move()
 
-        nearest_enemy = self._board.get_nearest_enemy_unit(unit)
-        enemy_hex = None
-        if nearest_enemy is None or nearest_enemy.get_coords() is None:
+        enemy_index = distances.nearest(unit, friend=False)
+        if enemy_index is None:
             enemy_strength = 0
             enemy_eta = 0
         else:
-            enemy_hex = self._board.get_hex(*nearest_enemy.get_coords())
-            enemy_strength = nearest_enemy.get_strength()
-            enemy_dist = self._board.hex_distance(own_hex, enemy_hex)
-            enemy_eta = self._distance_to_eta_bin(enemy_dist, move)
+            enemy_strength = distances.units[enemy_index].get_strength()
+            enemy_eta = self._distance_to_eta_bin(row[enemy_index], move)
 
-        nearest_friend = self._board.get_nearest_friendly_unit(unit)
-        if nearest_friend is None or nearest_friend.get_coords() is None:
+        friend_index = distances.nearest(unit, friend=True)
+        if friend_index is None:
             friend_strength = 0
             friend_eta = 0
         else:
+            nearest_friend = distances.units[friend_index]
             friend_strength = nearest_friend.get_strength()
-            if enemy_hex is None:
+            if enemy_index is None:
                 friend_eta = 0
             else:
-                friend_hex = self._board.get_hex(*nearest_friend.get_coords())
-                friend_dist = self._board.hex_distance(friend_hex, enemy_hex)
+                friend_dist = distances.distance(friend_index, enemy_index)
                 friend_eta = self._distance_to_eta_bin(
                     friend_dist, nearest_friend.get_move()
                 )
 
         density = self._ally_density_decayed(
-            unit, radius=8, use_exponential=False, lam=2.0
+            unit,
+            radius=8,
+            use_exponential=False,
+            lam=2.0,
+            distances=distances,
         )
         density_bin = self._bin_ally_density(density)
 
@@ -454,20 +573,23 @@ class QLearningPlayer(RLPlayer):
         radius: int = 2,
         use_exponential: bool = False,
         lam: float = 2.0,
+        distances: "_UnitDistances | None" = None,
     ) -> float:
         """
         Sum over friendly units within `radius` of weight(d) * strength,
         where weight(d) = 1/(1+d)  (or exp(-d/lam) if use_exponential=True).
         Excludes `unit` itself.
         """
-        me_hex = self._board.get_hex(unit.row, unit.column)
+        if distances is None:
+            distances = self._unit_distances()
+        row = distances.row(unit)
+        if row is None:
+            return 0.0
         total = 0.0
 
-        for f in self.own_units(self._board.get_units()):
-            if f is unit:
+        for f, d in zip(distances.units, row):
+            if f is unit or not self.owns(f):
                 continue
-            f_hex = self._board.get_hex(f.row, f.column)
-            d = self._board.hex_distance(me_hex, f_hex)
             if d is None or d > radius:
                 continue
 
@@ -505,12 +627,13 @@ class QLearningPlayer(RLPlayer):
             # self.calculate_reward() - self._turn_penalty * self._turn_count
             self._turn_count * -0.1
         )
+        distances = self._unit_distances()
         for unit, state_action in [
             (record[0], (record[1], record[2]))
             for record in self._last_actions.values()
         ]:
             state, action = state_action
-            next_state = self.encode_unit_state(unit)
+            next_state = self.encode_unit_state(unit, distances)
             next_actions = self.available_actions(unit)
             self.update_q(state, action, reward, next_state, next_actions)
         # Do not clear _last_actions here so combat_results can also use them
@@ -577,11 +700,12 @@ class QLearningPlayer(RLPlayer):
                             battle.get_odds(), has_allies
                         )
 
+        distances = self._unit_distances()
         for unit_id, (unit, state, action) in self._last_actions.items():
             if unit_id not in per_unit_rewards:
                 continue
             reward = per_unit_rewards[unit_id]
-            next_state = self.encode_unit_state(unit)
+            next_state = self.encode_unit_state(unit, distances)
             next_actions = self.available_actions(unit)
             self.update_q(state, action, reward, next_state, next_actions)
 
@@ -594,14 +718,15 @@ class QLearningPlayer(RLPlayer):
         friendly_units = self.own_units(board.get_units())
         enemy_units = [u for u in board.get_units() if u not in friendly_units]
 
+        friendly_ids = [board.unit_hex_id(unit) for unit in friendly_units]
+        enemy_ids = [board.unit_hex_id(unit) for unit in enemy_units]
+        matrix = board.geometry.distance_matrix(friendly_ids, enemy_ids)
+
         reward = 0.0
-        for f_unit in friendly_units:
+        for f_unit, distances in zip(friendly_units, matrix):
             friendly_strength = f_unit.get_attack() + f_unit.get_defense()
-            f_hex = board.get_hex(f_unit.row, f_unit.column)
-            for e_unit in enemy_units:
+            for e_unit, distance in zip(enemy_units, distances):
                 enemy_strength = e_unit.get_attack() + e_unit.get_defense()
-                e_hex = board.get_hex(e_unit.row, e_unit.column)
-                distance = Board.hex_distance(f_hex, e_hex)
                 if distance > 0:
                     reward += (friendly_strength - enemy_strength) / distance
                 else:
@@ -9,6 +9,7 @@ from battle_agent_rl.qlearningplayer import (
     QLearningSettingsLoader,
 )
 from battle_hexes_core.game.gamefactory import GameFactory
+from battle_hexes_core.game.gamerandom import GameRandom
 from battle_hexes_core.game.player import PlayerType
 from battle_hexes_core.game.randomplayer import RandomPlayer
 from battle_hexes_core.gamecreator.gamecreator import GameCreator
@@ -62,7 +63,9 @@ def build_players() -> tuple[
     return scenario, random_player, rl_player, units
 
 
-def main(episodes: int = 5, max_turns: int = 5) -> None:
+def main(
+    episodes: int = 5, max_turns: int = 5, seed: int | None = None
+) -> None:
     """Train the MultiUnit Q-learning player."""
     scenario, random_player, rl_player, units = build_players()
 
@@ -81,7 +84,12 @@ def main(episodes: int = 5, max_turns: int = 5) -> None:
         units=units,
     )
 
-    agent_trainer = AgentTrainer(game_factory, episodes, max_turns=max_turns)
+    agent_trainer = AgentTrainer(
+        game_factory,
+        episodes,
+        max_turns=max_turns,
+        rng=GameRandom(seed),
+    )
     game_results = agent_trainer.train()
     wins = game_results.count_wins()
     losses = game_results.count_losses()
@@ -136,10 +144,16 @@ if __name__ == "__main__":
         default=10,
         help="maximum number of turns per game",
     )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="base seed for reproducible games",
+    )
     args = parser.parse_args()
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s %(levelname)s %(name)s: %(message)s",
     )
     logger.info("Training with args %s", args)
-    main(args.episodes, args.max_turns)
+    main(args.episodes, args.max_turns, args.seed)
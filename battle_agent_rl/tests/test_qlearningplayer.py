@@ -300,6 +300,54 @@ class TestQLearningPlayerMovePlan(unittest.TestCase):
         end_dist = Board.hex_distance(end_hex, enemy_hex)
         self.assertGreaterEqual(end_dist, start_dist)
 
+    def test_batched_path_trees_match_per_unit_searches(self):
+        second = Unit(
+            str(uuid.uuid4()),
+            "F2",
+            self.friendly_faction,
+            self.player,
+            "Inf",
+            2,
+            2,
+            2,
+        )
+        self.board.add_unit(second, 2, 0)
+
+        for action in ActionIntent:
+            for magnitude in ActionMagnitude:
+                choices = [
+                    (self.friend, (action, magnitude)),
+                    (second, (action, magnitude)),
+                ]
+                path_trees = self.player._move_path_trees(choices)
+                for unit, _ in choices:
+                    batched = self.player.move_plan(
+                        unit, action, magnitude,
+                        path_trees.get(unit.get_id()),
+                    )
+                    single = self.player.move_plan(unit, action, magnitude)
+                    self.assertEqual(
+                        single.path, batched.path, (action, magnitude)
+                    )
+
+    def test_encode_unit_state_uses_nearest_units(self):
+        far_enemy = Unit(
+            str(uuid.uuid4()),
+            "E2",
+            self.enemy_faction,
+            self.enemy_player,
+            "Inf",
+            5,
+            5,
+            3,
+        )
+        self.board.add_unit(far_enemy, 0, 2)
+
+        state = self.player.encode_unit_state(self.friend)
+
+        self.assertEqual(self.enemy.get_strength(), state[1])
+        self.assertEqual(0, state[3])
+
     def test_distance_to_eta_bin(self):
         move = 4
         self.assertEqual(self.player._distance_to_eta_bin(3, move), 0)
@@ -71,10 +71,10 @@ class SparseBoard(ApiBaseModel):
 
         start_hex = board.get_hex(*current_coords)
         target_hex = board.get_hex(target_row, target_column)
-        path = board.shortest_path(unit, start_hex, target_hex)
         movement_points_spent = 0
-        for from_hex, to_hex in zip(path, path[1:]):
-            movement_points_spent += movement.move_cost(unit, from_hex, to_hex)
+        if start_hex is not None and target_hex is not None:
+            path_tree = movement.get_path_tree(unit, start_hex)
+            movement_points_spent = path_tree.cost_to(target_hex) or 0
         unit.current_turn_movement_points_remaining = max(
             unit.get_move() - movement_points_spent,
             0,
@@ -105,6 +105,26 @@ class TestSparseBoard(unittest.TestCase):
             self.red_unit.current_turn_movement_points_remaining,
         )
 
+    def test_update_board_spends_nothing_for_off_board_target(self):
+        self.board.add_unit(self.red_unit, 0, 4)
+
+        sparse_board_data = {
+            "units": [
+                {
+                    "id": str(self.red_unit.get_id()),
+                    "row": 7,
+                    "column": 7,
+                },
+            ]
+        }
+
+        SparseBoard(**sparse_board_data).apply_to_board(self.board)
+
+        self.assertEqual(
+            6,
+            self.red_unit.current_turn_movement_points_remaining,
+        )
+
     def test_update_board_ignores_public_defensive_fire_flag(self):
         self.board.add_unit(self.red_unit, 0, 4)
         self.red_unit.record_friendly_turn_end(3, self.blue_player)
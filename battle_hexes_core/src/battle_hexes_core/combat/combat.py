@@ -1,4 +1,3 @@
-from itertools import combinations
 import logging
 
 from battle_hexes_core.game.game import Game
@@ -15,7 +14,9 @@ class Combat:
         self.game = game
         self.board = game.get_board()
         self.attacking_player = game.get_current_player()
-        self.combat_solver = CombatSolver()
+        self.combat_solver = CombatSolver(
+            game.get_random().stream("combat")
+        )
         self.logger = logging.getLogger(__name__)
 
     def resolve_combat(self) -> CombatResults:
@@ -142,62 +143,75 @@ class Combat:
         return removed
 
     def _attackers_to_remove(self, attackers, defense_factor):
-        """Return subset of attackers to remove for an exchange."""
-        best_subset = list(attackers)
-        best_total = sum(u.get_attack() for u in attackers)
-        for size in range(1, len(attackers) + 1):
-            for combo in combinations(attackers, size):
-                total = sum(u.get_attack() for u in combo)
-                if total >= defense_factor:
-                    if (
-                        len(combo) < len(best_subset)
-                        or (
-                            len(combo) == len(best_subset)
-                            and total < best_total
-                        )
-                    ):
-                        best_subset = list(combo)
-                        best_total = total
-            if len(best_subset) == size:
-                break
-        return best_subset
+        """Return subset of attackers to remove for an exchange.
+
+        See :meth:`CombatSolver.exchange_casualties` for how they are
+        chosen.
+        """
+        casualties = CombatSolver.exchange_casualties(
+            [unit.get_attack() for unit in attackers], defense_factor
+        )
+        return [attackers[index] for index in casualties]
 
     def find_combat(self) -> list:
-        results = []
-        units = self.board.get_units()
-        engaged_units = [
-            u for u in units
+        """Group units in contact with the enemy into battles.
+
+        Units are engaged when an enemy shares or neighbors their hex.
+        Engaged units in contact with each other form one battle, found
+        with a depth-first search that looks up contacts through the
+        board's occupancy index, so each unit only visits its own and
+        neighboring hexes. Battles start from engaged units in board
+        order. Within a battle, units are listed in discovery order, and
+        that order picks the lead units used as retreat origins and the
+        attacker order for exchange casualties.
+        """
+        board = self.board
+        neighbor_ids = board.geometry.neighbor_ids
+        engaged_index: dict[int, int] = {}
+        engaged_units = []
+        for unit in board.get_units():
+            hex_id = board.unit_hex_id(unit)
+            if hex_id is None:
+                continue
+            contact_ids = (hex_id, *neighbor_ids[hex_id])
             if any(
-                (
-                    u.get_coords() == other.get_coords()
-                    or u.is_adjacent(other)
-                ) and not u.is_friendly(other)
-                for other in units
-            )
-        ]
-        visited: set[object] = set()
+                not unit.is_friendly(other)
+                for contact_id in contact_ids
+                for other in board.get_units_at_id(contact_id)
+            ):
+                engaged_index[id(unit)] = len(engaged_units)
+                engaged_units.append((unit, contact_ids))
 
-        for unit in engaged_units:
-            if unit in visited:
+        visited = [False] * len(engaged_units)
+        components = []
+        for first_index in range(len(engaged_units)):
+            if visited[first_index]:
                 continue
 
-            stack = [unit]
+            stack = [first_index]
             component = []
             while stack:
-                current = stack.pop()
-                if current in visited:
+                index = stack.pop()
+                if visited[index]:
                     continue
-                visited.add(current)
-                component.append(current)
-                for other in engaged_units:
-                    if other in visited:
-                        continue
-                    if (
-                        current.get_coords() == other.get_coords()
-                        or current.is_adjacent(other)
-                    ):
-                        stack.append(other)
+                visited[index] = True
+                unit, contact_ids = engaged_units[index]
+                component.append(unit)
+                # Contacts are pushed in board order, so the most recently
+                # placed one is explored first.
+                contacts = sorted(
+                    other_index
+                    for contact_id in contact_ids
+                    for other in board.get_units_at_id(contact_id)
+                    if (other_index := engaged_index.get(id(other)))
+                    is not None
+                    and not visited[other_index]
+                )
+                stack.extend(contacts)
+            components.append(component)
 
+        results = []
+        for component in components:
             attackers = [
                 u for u in component
                 if self.attacking_player.has_faction(u.get_faction())
@@ -209,6 +223,7 @@ class Combat:
             if attackers and defenders:
                 results.append((attackers, defenders))
 
+        if self.logger.isEnabledFor(logging.INFO):
             self.logger.info(
                 "find_combat: %d combats -> %s",
                 len(results),
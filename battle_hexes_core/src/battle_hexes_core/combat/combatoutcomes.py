@@ -0,0 +1,175 @@
+from dataclasses import dataclass
+from fractions import Fraction
+from typing import Iterable, Sequence
+
+from battle_hexes_core.combat.combatresult import CombatResult
+from battle_hexes_core.combat.combatsolver import CombatSolver
+
+
+DIE_FACES = 6
+
+
+@dataclass(frozen=True)
+class CombatOutcome:
+    """Exact result probabilities for one attack.
+
+    ``expected_attacker_loss`` and ``expected_defender_loss`` are in combat
+    factors. An exchange eliminates the defenders and costs the attacker the
+    combined attack of the units :meth:`CombatSolver.exchange_casualties`
+    removes. Retreats count as no loss.
+    """
+
+    base_odds: tuple[int, int]
+    final_odds: tuple[int, int]
+    probabilities: dict[CombatResult, Fraction]
+    expected_attacker_loss: float
+    expected_defender_loss: float
+
+    def probability(self, result: CombatResult) -> Fraction:
+        return self.probabilities.get(result, Fraction(0))
+
+
+class CombatOutcomeEngine:
+    """Answer "what can happen if I attack?" without rolling dice.
+
+    Result distributions for every final odds column are computed once from
+    ``CombatSolver.RESULTS_TABLE``, along with the final column for every
+    base column and terrain shift, so each query is a pair of lookups.
+    """
+
+    def __init__(self, solver: CombatSolver | None = None):
+        self._solver = solver if solver is not None else CombatSolver()
+        columns = CombatSolver.STANDARD_ODDS
+        self._column_by_odds = {
+            odds: index for index, odds in enumerate(columns)
+        }
+        self._distributions = tuple(
+            self._column_distribution(odds) for odds in columns
+        )
+        # Shifts beyond the table width clamp to the outer columns, so
+        # this range covers every shift that can change the result.
+        self._max_shift = len(columns) - 1
+        self._final_column = tuple(
+            tuple(
+                self._column_by_odds[self._solver.shift_odds(odds, shift)]
+                for shift in range(-self._max_shift, self._max_shift + 1)
+            )
+            for odds in columns
+        )
+
+    @staticmethod
+    def _column_distribution(
+        odds: tuple[int, int],
+    ) -> dict[CombatResult, Fraction]:
+        if odds == (1, 7):
+            return {CombatResult.ATTACKER_ELIMINATED: Fraction(1)}
+        if odds == (7, 1):
+            return {CombatResult.DEFENDER_ELIMINATED: Fraction(1)}
+
+        distribution: dict[CombatResult, Fraction] = {}
+        for result in CombatSolver.RESULTS_TABLE[f'{odds[0]}:{odds[1]}']:
+            distribution[result] = (
+                distribution.get(result, Fraction(0))
+                + Fraction(1, DIE_FACES)
+            )
+        return distribution
+
+    def final_column(self, base_odds: tuple[int, int], shift: int) -> int:
+        """Return the index of the column ``base_odds`` shifts into."""
+        shift = min(max(shift, -self._max_shift), self._max_shift)
+        base_column = self._column_by_odds[base_odds]
+        return self._final_column[base_column][shift + self._max_shift]
+
+    def outcome(
+        self,
+        attack_factor: int | Sequence[int],
+        defense_factor: int,
+        combat_odds_shift: int = 0,
+    ) -> CombatOutcome:
+        """Return the exact outcome distribution for one attack.
+
+        ``attack_factor`` is either one attacking unit's factor or the
+        factors of every attacker, in attacker order. The attacker order
+        decides which units an exchange removes.
+        """
+        attacks = _attacks(attack_factor)
+        base_odds = self._solver.get_odds(sum(attacks), defense_factor)
+        return self._outcome_for_odds(
+            attacks, defense_factor, base_odds, combat_odds_shift
+        )
+
+    def outcomes(
+        self,
+        attacks: Iterable[Sequence[int]],
+    ) -> list[CombatOutcome]:
+        """Return outcomes for many candidate attacks at once.
+
+        Each entry is ``(attack_factor, defense_factor)`` or
+        ``(attack_factor, defense_factor, combat_odds_shift)``, with
+        ``attack_factor`` as in :meth:`outcome`. Odds for repeated factor
+        pairs are only worked out once.
+        """
+        odds_by_factors: dict[tuple[int, int], tuple[int, int]] = {}
+        results = []
+        for attack in attacks:
+            attack_factors, defense_factor = _attacks(attack[0]), attack[1]
+            combat_odds_shift = attack[2] if len(attack) > 2 else 0
+            factors = (sum(attack_factors), defense_factor)
+            base_odds = odds_by_factors.get(factors)
+            if base_odds is None:
+                base_odds = self._solver.get_odds(*factors)
+                odds_by_factors[factors] = base_odds
+            results.append(
+                self._outcome_for_odds(
+                    attack_factors,
+                    defense_factor,
+                    base_odds,
+                    combat_odds_shift,
+                )
+            )
+        return results
+
+    def _outcome_for_odds(
+        self,
+        attacks: Sequence[int],
+        defense_factor: int,
+        base_odds: tuple[int, int],
+        combat_odds_shift: int,
+    ) -> CombatOutcome:
+        column = self.final_column(base_odds, combat_odds_shift)
+        probabilities = self._distributions[column]
+
+        eliminated = probabilities.get(
+            CombatResult.ATTACKER_ELIMINATED, Fraction(0)
+        )
+        exchange = probabilities.get(CombatResult.EXCHANGE, Fraction(0))
+        defender_eliminated = probabilities.get(
+            CombatResult.DEFENDER_ELIMINATED, Fraction(0)
+        )
+        attack_factor = sum(attacks)
+        exchange_loss = 0
+        if exchange:
+            exchange_loss = sum(
+                attacks[index]
+                for index in CombatSolver.exchange_casualties(
+                    attacks, defense_factor
+                )
+            )
+
+        return CombatOutcome(
+            base_odds=base_odds,
+            final_odds=CombatSolver.STANDARD_ODDS[column],
+            probabilities=dict(probabilities),
+            expected_attacker_loss=float(
+                eliminated * attack_factor + exchange * exchange_loss
+            ),
+            expected_defender_loss=float(
+                (defender_eliminated + exchange) * defense_factor
+            ),
+        )
+
+
+def _attacks(attack_factor: int | Sequence[int]) -> Sequence[int]:
+    if isinstance(attack_factor, int):
+        return (attack_factor,)
+    return attack_factor
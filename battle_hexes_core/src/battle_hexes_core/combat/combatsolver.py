@@ -1,6 +1,8 @@
 import logging
 import random
+from functools import lru_cache
 from math import gcd
+from typing import Sequence
 
 from battle_hexes_core.combat.combatresult import (
     CombatResult,
@@ -119,21 +121,41 @@ class CombatSolver:
         )
     }
 
-    def __init__(self):
+    # Columns past either end of the table resolve without a die roll.
+    AUTOMATIC_RESULTS = {
+        0: CombatResult.ATTACKER_ELIMINATED,
+        len(STANDARD_ODDS) - 1: CombatResult.DEFENDER_ELIMINATED,
+    }
+
+    def __init__(self, rng=None):
         self.static_die_roll = None
+        self.random = rng if rng is not None else random
 
-    def get_odds(self, attack_factor, defense_factor):
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def odds_column(attack_factor: int, defense_factor: int) -> int:
+        """Return the ``STANDARD_ODDS`` index for the given factors."""
         gr_cmn_denom = gcd(attack_factor, defense_factor)
         ratio = (
             attack_factor // gr_cmn_denom
             ) / (
                 defense_factor // gr_cmn_denom
             )
-        closest_ratio_index = min(
+        return min(
             enumerate(CombatSolver.STANDARD_ODDS_RATIOS),
             key=lambda x: abs(ratio - x[1])
         )[0]
-        return CombatSolver.STANDARD_ODDS[closest_ratio_index]
+
+    @staticmethod
+    def shift_column(column: int, combat_odds_shift: int) -> int:
+        """Return ``column`` shifted and clamped to the table."""
+        max_index = len(CombatSolver.STANDARD_ODDS) - 1
+        return min(max(column + combat_odds_shift, 0), max_index)
+
+    def get_odds(self, attack_factor, defense_factor):
+        return CombatSolver.STANDARD_ODDS[
+            self.odds_column(attack_factor, defense_factor)
+        ]
 
     def shift_odds(
         self,
@@ -145,9 +167,7 @@ class CombatSolver:
         except ValueError as exc:
             raise ValueError(f"Unknown odds column: {odds}") from exc
 
-        max_index = len(CombatSolver.STANDARD_ODDS) - 1
-        shifted_index = base_index + combat_odds_shift
-        final_index = min(max(shifted_index, 0), max_index)
+        final_index = self.shift_column(base_index, combat_odds_shift)
         return CombatSolver.STANDARD_ODDS[final_index]
 
     def solve_combat(
@@ -156,38 +176,35 @@ class CombatSolver:
             defense_factor: int,
             combat_odds_shift: int = 0,
     ) -> CombatResultData:
-        base_odds = self.get_odds(attack_factor, defense_factor)
-        final_odds = self.shift_odds(base_odds, combat_odds_shift)
-        odds_label = f'{final_odds[0]}:{final_odds[1]}'
-        logger.info(
-            "Resolving combat with %s against %s at base odds %s, "
-            "shift %s, final odds %s",
-            attack_factor,
-            defense_factor,
-            f'{base_odds[0]}:{base_odds[1]}',
-            combat_odds_shift,
-            odds_label,
-        )
-
-        if odds_label == '1:7':
-            return CombatResultData(
-                final_odds,
-                -1,
-                CombatResult.ATTACKER_ELIMINATED,
-                base_odds=base_odds,
-                final_odds=final_odds,
+        base_column = self.odds_column(attack_factor, defense_factor)
+        final_column = self.shift_column(base_column, combat_odds_shift)
+        base_odds = CombatSolver.STANDARD_ODDS[base_column]
+        final_odds = CombatSolver.STANDARD_ODDS[final_column]
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Resolving combat with %s against %s at base odds %s, "
+                "shift %s, final odds %s",
+                attack_factor,
+                defense_factor,
+                f'{base_odds[0]}:{base_odds[1]}',
+                combat_odds_shift,
+                f'{final_odds[0]}:{final_odds[1]}',
             )
-        if odds_label == '7:1':
+
+        automatic_result = CombatSolver.AUTOMATIC_RESULTS.get(final_column)
+        if automatic_result is not None:
             return CombatResultData(
                 final_odds,
                 -1,
-                CombatResult.DEFENDER_ELIMINATED,
+                automatic_result,
                 base_odds=base_odds,
                 final_odds=final_odds,
             )
 
         die_roll = self._roll_die()
-        combat_result = CombatSolver.RESULTS_TABLE[odds_label][die_roll - 1]
+        combat_result = self.RESULTS_TABLE[_COLUMN_KEYS[final_column]][
+            die_roll - 1
+        ]
         return CombatResultData(
             final_odds,
             die_roll,
@@ -196,10 +213,116 @@ class CombatSolver:
             final_odds=final_odds,
         )
 
+    def solve_combats(
+            self,
+            attack_factors: Sequence[int],
+            defense_factors: Sequence[int],
+            combat_odds_shifts: Sequence[int],
+            die_rolls: Sequence[int],
+    ) -> list[CombatResult]:
+        """Resolve many combats from pre-rolled dice.
+
+        The four sequences are read in parallel; each entry gives the same
+        result :meth:`solve_combat` would with that die roll. Die rolls for
+        automatic results are ignored; any other roll outside the table row
+        raises ``ValueError``. Nothing is logged.
+        """
+        odds_column = self.odds_column
+        shift_column = self.shift_column
+        automatic_results = CombatSolver.AUTOMATIC_RESULTS
+        # Rows are looked up once per call, so changes to RESULTS_TABLE
+        # between calls are honored.
+        results_table = self.RESULTS_TABLE
+        rows_by_column = tuple(
+            None if column in automatic_results
+            else results_table[key]
+            for column, key in enumerate(_COLUMN_KEYS)
+        )
+        results = []
+        for attack_factor, defense_factor, shift, die_roll in zip(
+            attack_factors, defense_factors, combat_odds_shifts, die_rolls
+        ):
+            column = shift_column(
+                odds_column(attack_factor, defense_factor), shift
+            )
+            result = automatic_results.get(column)
+            if result is None:
+                row = rows_by_column[column]
+                if not 1 <= die_roll <= len(row):
+                    raise ValueError(f"Die roll out of range: {die_roll}")
+                result = row[die_roll - 1]
+            results.append(result)
+        return results
+
+    @staticmethod
+    def exchange_casualties(
+        attacks: Sequence[int], defense_factor: int
+    ) -> list[int]:
+        """Return the indices of the attackers an exchange removes.
+
+        ``attacks`` holds each attacker's attack factor. The casualties are
+        the fewest attackers whose combined attack reaches
+        ``defense_factor``, then the lowest such total, then the earliest
+        such combination in attacker order. Every attacker is removed when
+        even all of them together fall short.
+        """
+        count = len(attacks)
+
+        # The strongest ``size`` attackers bound what any ``size`` can reach.
+        strongest = sorted(attacks, reverse=True)
+        running_total = 0
+        size = None
+        for index, attack in enumerate(strongest, start=1):
+            running_total += attack
+            if running_total >= defense_factor:
+                size = index
+                break
+        if size is None:
+            return list(range(count))
+
+        # reachable[i][c] is a bitmask of the totals obtainable by choosing
+        # exactly c attackers from attacks[i:].
+        reachable = [[0] * (size + 1) for _ in range(count + 1)]
+        reachable[count][0] = 1
+        for index in range(count - 1, -1, -1):
+            row = reachable[index]
+            following = reachable[index + 1]
+            attack = attacks[index]
+            row[0] = 1
+            for chosen in range(1, size + 1):
+                row[chosen] = following[chosen] | (
+                    following[chosen - 1] << attack
+                )
+
+        floor = max(defense_factor, 0)
+        totals = reachable[0][size] >> floor
+        remaining = floor + (totals & -totals).bit_length() - 1
+
+        # Take the earliest attacker that still allows an exact finish so
+        # the result matches the first qualifying combination.
+        subset = []
+        needed = size
+        for index, attack in enumerate(attacks):
+            if needed == 0:
+                break
+            if attack > remaining:
+                continue
+            if reachable[index + 1][needed - 1] >> (remaining - attack) & 1:
+                subset.append(index)
+                needed -= 1
+                remaining -= attack
+        return subset
+
     def set_static_die_roll(self, static_roll: int):
         self.static_die_roll = static_roll
 
     def _roll_die(self) -> int:
         if self.static_die_roll:
             return self.static_die_roll
-        return random.randint(1, 6)
+        return self.random.randint(1, 6)
+
+
+# RESULTS_TABLE keys indexed by odds column.
+_COLUMN_KEYS: tuple[str, ...] = tuple(
+    f'{odds[0]}:{odds[1]}' for odds in CombatSolver.STANDARD_ODDS
+)
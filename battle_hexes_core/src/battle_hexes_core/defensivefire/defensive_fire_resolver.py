@@ -6,13 +6,20 @@ from battle_hexes_core.defensivefire.defensive_fire import (
     DefensiveFireResult,
     DefensiveFireSettings,
 )
+from battle_hexes_core.game.events import UnitMoved, UnitPlaced, UnitRemoved
 
 
 class DefensiveFireResolver:
-    def __init__(self, board, settings: Any = None):
+    def __init__(self, board, settings: Any = None, rng=None):
         self.board = board
+        self.random = rng if rng is not None else random
         self.logger = logging.getLogger(__name__)
         self.settings = self._coerce_settings(settings)
+        # Units on the hexes around each hex ID, sorted by ID. An entry is
+        # dropped when a unit enters or leaves one of those hexes.
+        self._neighbors_by_id: dict[int, tuple] = {}
+        for event_type in (UnitPlaced, UnitMoved, UnitRemoved):
+            board.events.subscribe(event_type, self._unit_changed)
 
     def set_settings(self, settings: Any = None) -> None:
         self.settings = self._coerce_settings(settings)
@@ -52,20 +59,53 @@ class DefensiveFireResolver:
         return results
 
     def _eligible_defenders(self, mover, current_player) -> list:
-        return sorted(
-            [
-                unit
-                for unit in self.board.get_units()
-                if self._is_eligible_defender(unit, mover, current_player)
-            ],
-            key=lambda unit: str(unit.get_id()),
-        )
+        """Return units that may fire on ``mover``, ordered by ID.
 
-    def _is_eligible_defender(self, unit, mover, current_player) -> bool:
+        Only the units on the mover's neighboring hexes are examined, in
+        an order cached until a unit enters or leaves those hexes.
+        """
+        mover_hex_id = self.board.unit_hex_id(mover)
+        if mover_hex_id is None:
+            return []
+        return [
+            unit
+            for unit in self._neighbor_units(mover_hex_id)
+            if self.can_fire_defensively(unit, current_player)
+        ]
+
+    def _neighbor_units(self, hex_id: int) -> tuple:
+        neighbors = self._neighbors_by_id.get(hex_id)
+        if neighbors is None:
+            board = self.board
+            neighbors = tuple(sorted(
+                (
+                    unit
+                    for neighbor_id in board.geometry.neighbor_ids[hex_id]
+                    for unit in board.get_units_at_id(neighbor_id)
+                ),
+                key=lambda unit: str(unit.get_id()),
+            ))
+            self._neighbors_by_id[hex_id] = neighbors
+        return neighbors
+
+    def _unit_changed(self, event) -> None:
+        if not self._neighbors_by_id:
+            return
+        geometry = self.board.geometry
+        for coords in (event.previous_coords, event.coords):
+            if coords is None:
+                continue
+            hex_id = geometry.hex_id(*coords)
+            if hex_id is None:
+                continue
+            for neighbor_id in geometry.neighbor_ids[hex_id]:
+                self._neighbors_by_id.pop(neighbor_id, None)
+
+    def can_fire_defensively(self, unit, current_player) -> bool:
+        """Return whether ``unit`` may fire on a unit of ``current_player``
+        that moves next to it."""
         return (
-            unit.get_coords() is not None
-            and not current_player.owns(unit)
-            and unit.is_adjacent(mover)
+            not current_player.owns(unit)
             and unit.has_defensive_fire(current_player)
         )
 
@@ -84,7 +124,7 @@ class DefensiveFireResolver:
         probability = self._clamp_probability(
             components["unclamped_probability"]
         )
-        roll = random.random()
+        roll = self.random.random()
         defender.spend_defensive_fire(current_player)
         outcome, retreat_destination = self._resolve_outcome(
             defender,
@@ -0,0 +1,110 @@
+from battle_hexes_core.defensivefire.defensive_fire_resolver import (
+    DefensiveFireResolver,
+)
+from battle_hexes_core.game.events import (
+    DefensiveFireChanged,
+    UnitEvent,
+    UnitMoved,
+    UnitPlaced,
+    UnitRemoved,
+)
+
+
+class DefensiveFireRiskMap:
+    """Per-hex, per-player chance of being fired on and forced back.
+
+    ``risk(player, hex_id)`` is the probability that a unit of ``player``
+    entering the hex is forced to retreat by defensive fire: one minus the
+    chance that every eligible adjacent enemy misses. Values are computed on
+    first use and cached. On each board unit event (a unit placed, moved,
+    removed or changing defensive fire status) only the hexes around that
+    unit are recomputed; terrain or resolver settings changes clear the
+    whole map.
+    """
+
+    def __init__(self, board, resolver: DefensiveFireResolver):
+        self.board = board
+        self.resolver = resolver
+        self._risk_by_player: list[tuple[object, list[float | None]]] = []
+        self._terrain_version = board.layers.terrain_version
+        self._settings = resolver.settings
+        for event_type in (
+            UnitPlaced, UnitMoved, UnitRemoved, DefensiveFireChanged
+        ):
+            board.events.subscribe(event_type, self._unit_changed)
+
+    def risk(self, player, hex_id: int) -> float:
+        """Return the chance a unit of ``player`` entering ``hex_id`` is
+        forced back by defensive fire."""
+        self._check_global_changes()
+        layer = self._player_layer(player)
+        value = layer[hex_id]
+        if value is None:
+            value = self._compute_risk(player, hex_id)
+            layer[hex_id] = value
+        return value
+
+    def risk_at(self, player, row: int, column: int) -> float:
+        """Return :meth:`risk` for ``(row, column)``; 0.0 off the board."""
+        hex_id = self.board.hex_id(row, column)
+        if hex_id is None:
+            return 0.0
+        return self.risk(player, hex_id)
+
+    def risk_layer(self, player) -> list[float]:
+        """Return the risk of every hex for ``player``, indexed by hex ID."""
+        return [
+            self.risk(player, hex_id)
+            for hex_id in range(self.board.geometry.size)
+        ]
+
+    def invalidate(self) -> None:
+        """Forget every cached value, e.g. after editing unit modifiers."""
+        self._risk_by_player = []
+
+    def _check_global_changes(self) -> None:
+        terrain_version = self.board.layers.terrain_version
+        if (
+            terrain_version != self._terrain_version
+            or self.resolver.settings is not self._settings
+        ):
+            self._terrain_version = terrain_version
+            self._settings = self.resolver.settings
+            self.invalidate()
+
+    def _player_layer(self, player) -> list[float | None]:
+        for owner, layer in self._risk_by_player:
+            if owner is player or owner == player:
+                return layer
+        layer = [None] * self.board.geometry.size
+        self._risk_by_player.append((player, layer))
+        return layer
+
+    def _compute_risk(self, player, hex_id: int) -> float:
+        board = self.board
+        target_hex = board.hexes[hex_id]
+        resolver = self.resolver
+        miss_probability = 1.0
+        for neighbor_id in board.geometry.neighbor_ids[hex_id]:
+            for unit in board.get_units_at_id(neighbor_id):
+                if not resolver.can_fire_defensively(unit, player):
+                    continue
+                miss_probability *= 1.0 - resolver.defensive_fire_probability(
+                    unit, target_hex
+                )
+        return 1.0 - miss_probability
+
+    def _unit_changed(self, event: UnitEvent) -> None:
+        if not self._risk_by_player:
+            return
+        geometry = self.board.geometry
+        stale_ids = set()
+        for coords in (event.previous_coords, event.coords):
+            if coords is None:
+                continue
+            hex_id = geometry.hex_id(*coords)
+            if hex_id is not None:
+                stale_ids.update(geometry.neighbor_ids[hex_id])
+        for _, layer in self._risk_by_player:
+            for hex_id in stale_ids:
+                layer[hex_id] = None
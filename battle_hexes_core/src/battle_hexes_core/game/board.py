@@ -1,38 +1,51 @@
+from bisect import insort
 from collections.abc import Iterable
+from heapq import merge
+from itertools import count
 from typing import List, Set, Tuple
 
+from battle_hexes_core.game.boardlayers import BoardLayers
+from battle_hexes_core.game.distancefields import DistanceFields
+from battle_hexes_core.game.events import (
+    EventBus,
+    UnitMoved,
+    UnitPlaced,
+    UnitRemoved,
+)
 from battle_hexes_core.game.hex import Hex
-from battle_hexes_core.game.movement import MovementCalculator
+from battle_hexes_core.game.hexgeometry import (
+    EVEN_COLUMN_DIRECTIONS,
+    ODD_COLUMN_DIRECTIONS,
+    HexGeometry,
+    cube_distance,
+    offset_distance,
+    offset_distances,
+    to_cube,
+)
+from battle_hexes_core.game.movement import MovementCalculator, PathTree
 from battle_hexes_core.game.objective import Objective
+from battle_hexes_core.game.routeplanner import RoutePlanner
 from battle_hexes_core.unit.unit import Unit
 
 
 class Board:
-    # Directions for even-numbered rows (0, 2, 4, ...)
-    EVEN_R_DIRECTIONS = [
-        (-1, 0),   # North
-        (-1, +1),  # Northeast
-        (0, +1),   # Southeast
-        (+1, 0),   # South
-        (0, -1),   # Southwest
-        (-1, -1),  # Northwest
-    ]
-
-    # Directions for odd-numbered rows (1, 3, 5, ...)
-    ODD_R_DIRECTIONS = [
-        (-1, 0),   # North
-        (0, +1),   # Northeast
-        (+1, +1),  # Southeast
-        (+1, 0),   # South
-        (+1, -1),  # Southwest
-        (0, -1),   # Northwest
-    ]
+    # Directions for even-numbered columns (0, 2, 4, ...)
+    EVEN_R_DIRECTIONS = list(EVEN_COLUMN_DIRECTIONS)
+
+    # Directions for odd-numbered columns (1, 3, 5, ...)
+    ODD_R_DIRECTIONS = list(ODD_COLUMN_DIRECTIONS)
 
     def __init__(self, rows: int, columns: int):
         self.rows = rows
         self.columns = columns
         self.stacking_limit: int | None = None
+        self.movement_engine = MovementCalculator.HEAP_ENGINE
         self.units: dict[str, Unit] = {}
+        self._unit_rank: dict[str, int] = {}
+        # Units per faction in board order, so per-player queries do not
+        # scan the whole board.
+        self._units_by_faction: dict[object, list[Unit]] = {}
+        self._rank_counter = count()
         self.road_types: dict[str, float] = {}
         self.road_paths: tuple[
             tuple[str, tuple[tuple[int, int], ...]],
@@ -42,6 +55,32 @@ class Board:
         for row in range(rows):
             for column in range(columns):
                 self.hexes.append(Hex(row, column))
+        self.geometry = HexGeometry.for_shape(rows, columns)
+        # Occupancy index: hex ID -> units on that hex, kept in board
+        # insertion order and updated whenever a unit changes hex. Units
+        # placed off the grid are not indexed.
+        self._units_by_hex_id: list[list[Unit]] = [
+            [] for _ in range(self.geometry.size)
+        ]
+        self._neighbor_hexes: list[tuple[Hex, ...]] = [
+            tuple(self.hexes[neighbor_id] for neighbor_id in neighbor_ids)
+            for neighbor_ids in self.geometry.neighbor_ids
+        ]
+        # Zone-of-control counts: for every hex, how many units are adjacent
+        # to it in total and per owning player. A hex is in enemy ZOC for a
+        # player when the total exceeds that player's own count.
+        self._adjacent_unit_counts = [0] * self.geometry.size
+        self._adjacent_unit_counts_by_player: list[
+            tuple[object, list[int]]
+        ] = []
+        self.layers = BoardLayers(self)
+        # Unit events for caches built on top of the board; see
+        # battle_hexes_core.game.events.
+        self.events = EventBus()
+        self._route_planner: RoutePlanner | None = None
+        self._distance_fields: DistanceFields | None = None
+        for hex_tile in self.hexes:
+            hex_tile._on_change = self._hex_changed
 
     def get_rows(self) -> int:
         return self.rows
@@ -52,6 +91,7 @@ class Board:
     def set_road_types(self, road_types: dict[str, float] | None) -> None:
         """Store movement costs keyed by road type name."""
         self.road_types = dict(road_types or {})
+        self.layers.roads_changed()
 
     def get_road_types(self) -> dict[str, float]:
         """Return a copy of board road type movement costs."""
@@ -64,11 +104,11 @@ class Board:
         """Store road paths as ``(type, path_coords)`` entries."""
         if road_paths is None:
             self.road_paths = tuple()
-            return
-
-        self.road_paths = tuple(
-            (road_type, tuple(path)) for road_type, path in road_paths
-        )
+        else:
+            self.road_paths = tuple(
+                (road_type, tuple(path)) for road_type, path in road_paths
+            )
+        self.layers.roads_changed()
 
     def get_road_paths(
         self,
@@ -90,12 +130,45 @@ class Board:
         """Set optional scenario-level friendly stacking limit."""
         self.stacking_limit = stacking_limit
 
+    def set_movement_engine(self, engine: str) -> None:
+        """Choose the search engine used for this board's movement.
+
+        See :class:`MovementCalculator` for the available engines.
+        """
+        if engine not in MovementCalculator.ENGINES:
+            raise ValueError(f"Unknown movement engine: {engine}")
+        self.movement_engine = engine
+
     def add_unit(self, unit: Unit, row: int, column: int) -> None:
         if not (0 <= row < self.rows) or not (0 <= column < self.columns):
             raise ValueError("Unit is out of bounds")
 
+        existing = self.units.get(unit.get_id())
+        if existing is unit:
+            unit.set_coords(row, column)
+            return
+        if existing is not None:
+            self._unindex_unit(existing, existing.get_coords())
+            self._units_by_faction[existing.get_faction()].remove(existing)
+            existing._board = None
+            self.events.publish(
+                UnitRemoved(existing, existing.get_coords(), None)
+            )
+
+        unit._board = None
         unit.set_coords(row, column)
         self.units[unit.get_id()] = unit
+        if existing is None:
+            # A replacement keeps its predecessor's place in board order.
+            self._unit_rank[unit.get_id()] = next(self._rank_counter)
+        unit._board = self
+        self._index_unit(unit)
+        insort(
+            self._units_by_faction.setdefault(unit.get_faction(), []),
+            unit,
+            key=self._rank_of,
+        )
+        self.events.publish(UnitPlaced(unit, None, unit.get_coords()))
 
     def remove_units(self, units) -> None:
         if isinstance(units, Iterable):
@@ -105,22 +178,113 @@ class Board:
             self._remove_single_unit(units)
 
     def _remove_single_unit(self, unit: Unit):
-        del self.units[unit.get_id()]
+        stored = self.units.pop(unit.get_id())
+        self._units_by_faction[stored.get_faction()].remove(stored)
+        previous_coords = stored.get_coords()
+        self._unindex_unit(stored, previous_coords)
+        stored._board = None
+        unit._board = None
         unit.set_coords(None, None)
+        del self._unit_rank[unit.get_id()]
+        self.events.publish(UnitRemoved(stored, previous_coords, None))
+
+    def _reindex_unit(
+        self,
+        unit: Unit,
+        previous_coords: tuple[int, int] | None,
+    ) -> None:
+        """Move ``unit`` between occupancy buckets after a coords change."""
+        if previous_coords == unit.get_coords():
+            return
+        self._unindex_unit(unit, previous_coords)
+        self._index_unit(unit)
+        self.events.publish(
+            UnitMoved(unit, previous_coords, unit.get_coords())
+        )
+
+    def _index_unit(self, unit: Unit) -> None:
+        coords = unit.get_coords()
+        if coords is None:
+            return
+        hex_id = self.geometry.hex_id(*coords)
+        if hex_id is None:
+            return
+        bucket = self._units_by_hex_id[hex_id]
+        insort(bucket, unit, key=self._rank_of)
+        self._adjust_zone_of_control(unit, hex_id, 1)
+        self.layers.occupancy_changed(hex_id, bucket)
+
+    def _unindex_unit(
+        self,
+        unit: Unit,
+        coords: tuple[int, int] | None,
+    ) -> None:
+        if coords is None:
+            return
+        hex_id = self.geometry.hex_id(*coords)
+        if hex_id is None:
+            return
+        bucket = self._units_by_hex_id[hex_id]
+        if unit not in bucket:
+            return
+        bucket.remove(unit)
+        self._adjust_zone_of_control(unit, hex_id, -1)
+        self.layers.occupancy_changed(hex_id, bucket)
+
+    def _hex_changed(self, hex_tile: Hex) -> None:
+        del hex_tile
+        self.layers.hex_changed()
+
+    def _adjust_zone_of_control(
+        self,
+        unit: Unit,
+        hex_id: int,
+        delta: int,
+    ) -> None:
+        player_counts = self._player_adjacent_unit_counts(unit.player)
+        if player_counts is None:
+            player_counts = [0] * self.geometry.size
+            self._adjacent_unit_counts_by_player.append(
+                (unit.player, player_counts)
+            )
+
+        total_counts = self._adjacent_unit_counts
+        for neighbor_id in self.geometry.neighbor_ids[hex_id]:
+            total_counts[neighbor_id] += delta
+            player_counts[neighbor_id] += delta
+
+    def _player_adjacent_unit_counts(self, player) -> list[int] | None:
+        for owner, counts in self._adjacent_unit_counts_by_player:
+            if owner is player or owner == player:
+                return counts
+        return None
+
+    def _rank_of(self, unit: Unit) -> int:
+        return self._unit_rank[unit.get_id()]
 
     def get_units(self) -> List[Unit]:
         return list(self.units.values())
 
     def get_units_for_player(self, player) -> List[Unit]:
-        """Return all board units owned by ``player``."""
-        return [unit for unit in self.get_units() if player.owns(unit)]
+        """Return all board units owned by ``player``, in board order."""
+        buckets = [
+            self._units_by_faction.get(faction, ())
+            for faction in dict.fromkeys(player.factions)
+        ]
+        if len(buckets) == 1:
+            return list(buckets[0])
+        return list(merge(*buckets, key=self._rank_of))
+
+    def hex_id(self, row: int, column: int) -> int | None:
+        """Return the integer ID of ``(row, column)`` or ``None``."""
+        return self.geometry.hex_id(row, column)
 
     def get_unit_at(self, row: int, column: int) -> Unit | None:
         """Return the unit occupying ``(row, column)`` if one exists."""
-        for unit in self.units.values():
-            if unit.get_coords() == (row, column):
-                return unit
-        return None
+        hex_id = self.geometry.hex_id(row, column)
+        if hex_id is None or not self._units_by_hex_id[hex_id]:
+            return None
+        return self._units_by_hex_id[hex_id][0]
 
     def get_units_at(
         self,
@@ -129,13 +293,23 @@ class Board:
         exclude_unit: Unit | None = None,
     ) -> List[Unit]:
         """Return all units occupying ``(row, column)``."""
+        hex_id = self.geometry.hex_id(row, column)
+        if hex_id is None:
+            return []
         return [
             unit
-            for unit in self.units.values()
+            for unit in self._units_by_hex_id[hex_id]
             if unit is not exclude_unit
-            and unit.get_coords() == (row, column)
         ]
 
+    def get_units_at_id(self, hex_id: int) -> List[Unit]:
+        """Return the units on ``hex_id``.
+
+        The returned list is the live occupancy bucket and must not be
+        mutated.
+        """
+        return self._units_by_hex_id[hex_id]
+
     def can_unit_enter_hex(
         self,
         unit: Unit,
@@ -143,25 +317,24 @@ class Board:
         column: int,
     ) -> bool:
         """Return whether ``unit`` may legally enter ``(row, column)``."""
-        if not self.is_in_bounds(row, column):
+        hex_id = self.geometry.hex_id(row, column)
+        if hex_id is None:
             return False
+        return self.can_unit_enter_hex_id(unit, hex_id)
 
-        occupying_units = self.get_units_at(
-            row,
-            column,
-            exclude_unit=unit,
-        )
-        if any(not occupant.is_friendly(unit) for occupant in occupying_units):
-            return False
+    def can_unit_enter_hex_id(self, unit: Unit, hex_id: int) -> bool:
+        """Return whether ``unit`` may legally enter the hex ``hex_id``."""
+        friendly_count = 0
+        for occupant in self._units_by_hex_id[hex_id]:
+            if occupant is unit:
+                continue
+            if not occupant.is_friendly(unit):
+                return False
+            friendly_count += 1
 
         if self.stacking_limit is None:
             return True
 
-        friendly_count = sum(
-            1
-            for occupant in occupying_units
-            if occupant.is_friendly(unit)
-        )
         return friendly_count + 1 <= self.stacking_limit
 
     def get_unit_by_id(self, unit_id: str) -> Unit:
@@ -183,22 +356,46 @@ class Board:
             if unit.get_faction() == factions
         ]
 
-    def get_neighboring_hexes(self, hex: Hex) -> List[Hex]:
-        neighbors = []
+    def get_neighboring_hexes(self, hex: Hex) -> tuple[Hex, ...]:
+        """Return the on-board neighbors of ``hex``.
+
+        The returned tuple is shared between calls and must not be mutated.
+        """
+        row = hex.row
+        column = hex.column
+        if 0 <= row < self.rows and 0 <= column < self.columns:
+            return self._neighbor_hexes[row * self.columns + column]
+
         directions = (
-            self.EVEN_R_DIRECTIONS
-            if hex.column % 2 == 0
-            else self.ODD_R_DIRECTIONS
+            EVEN_COLUMN_DIRECTIONS
+            if column % 2 == 0
+            else ODD_COLUMN_DIRECTIONS
         )
-
+        neighbors = []
         for dr, dq in directions:
-            r = hex.row + dr
-            q = hex.column + dq
-            neighbor = self.get_hex(r, q)
+            neighbor = self.get_hex(row + dr, column + dq)
             if neighbor:
                 neighbors.append(neighbor)
+        return tuple(neighbors)
+
+    def get_path_tree(
+            self, unit: Unit, start: Hex, move_points: int = None
+    ) -> PathTree:
+        """Run one movement search that answers reachability and paths."""
+        movement = MovementCalculator(self)
+        return movement.get_path_tree(unit, start, move_points)
 
-        return neighbors
+    def get_path_trees(
+            self,
+            units: List[Unit],
+            move_points: List[float] | None = None,
+    ) -> List[PathTree | None]:
+        """Run the movement searches for several units in one batch.
+
+        See :meth:`MovementCalculator.get_path_trees`.
+        """
+        movement = MovementCalculator(self)
+        return movement.get_path_trees(units, move_points)
 
     def get_reachable_hexes(
             self, unit: Unit, start: Hex, move_points: int = None
@@ -214,35 +411,102 @@ class Board:
 
     def enemy_adjacent(self, unit: Unit, hex: Hex) -> bool:
         """Check if there are any enemy units adjacent to the given hex."""
-        neighbor_hexes = self.get_neighboring_hexes(hex)
-        neighbor_units = self.get_units_for_hexes(neighbor_hexes)
+        hex_id = self.geometry.hex_id(hex.row, hex.column)
+        if hex_id is None:
+            return any(
+                not neighbor_unit.is_friendly(unit)
+                for neighbor_unit in self.get_units_for_hexes(
+                    self.get_neighboring_hexes(hex)
+                )
+            )
+        return self.enemy_adjacent_id(unit, hex_id)
 
-        for neighbor_unit in neighbor_units:
-            if not neighbor_unit.is_friendly(unit):
-                return True
+    def enemy_adjacent_id(self, unit: Unit, hex_id: int) -> bool:
+        """Return whether an enemy of ``unit`` is adjacent to ``hex_id``."""
+        adjacent_count = self._adjacent_unit_counts[hex_id]
+        if not adjacent_count:
+            return False
+        player_counts = self._player_adjacent_unit_counts(unit.player)
+        if player_counts is None:
+            return True
+        return adjacent_count > player_counts[hex_id]
+
+    def adjacent_unit_counts(self, player=None) -> list[int]:
+        """Return how many units neighbor each hex, indexed by hex ID.
 
-        return False
+        With ``player`` only that player's units are counted. These are
+        the zone of control counts behind :meth:`enemy_adjacent_id`; the
+        list is shared with the board's index, so it must not be
+        modified.
+        """
+        if player is None:
+            return self._adjacent_unit_counts
+        player_counts = self._player_adjacent_unit_counts(player)
+        if player_counts is None:
+            return [0] * self.geometry.size
+        return player_counts
 
     @classmethod
     def to_cube_coords(cls, hex_obj: Hex) -> Tuple[int, int, int]:
         """Convert offset coordinates to cube coordinates (odd-q)."""
-        col = hex_obj.column
-        row = hex_obj.row
-        x_coord = col
-        z_coord = row - (col - (col & 1)) // 2
-        y_coord = -x_coord - z_coord
-        return x_coord, y_coord, z_coord
+        return to_cube(hex_obj.row, hex_obj.column)
 
     @classmethod
     def hex_distance(cls, friendly_hex, enemy_hex) -> int:
-        """Calculate the distance between two hexes on an even-r grid."""
+        """Calculate the distance between two hexes on an odd-q grid."""
         if friendly_hex is None or enemy_hex is None:
             raise ValueError("hex arguments must not be None")
 
-        ax, ay, az = cls.to_cube_coords(friendly_hex)
-        bx, by, bz = cls.to_cube_coords(enemy_hex)
+        return offset_distance(
+            (friendly_hex.row, friendly_hex.column),
+            (enemy_hex.row, enemy_hex.column),
+        )
+
+    @classmethod
+    def hex_distances(
+        cls,
+        origin: Hex,
+        hexes: Iterable[Hex],
+    ) -> list[int]:
+        """Return the distance from ``origin`` to each of ``hexes``."""
+        return offset_distances(
+            (origin.row, origin.column),
+            [(hex_tile.row, hex_tile.column) for hex_tile in hexes],
+        )
+
+    def unit_hex_id(self, unit: Unit) -> int | None:
+        """Return the hex ID occupied by ``unit`` or ``None``."""
+        coords = unit.get_coords()
+        if coords is None:
+            return None
+        return self.geometry.hex_id(*coords)
 
-        return max(abs(ax - bx), abs(ay - by), abs(az - bz))
+    def unit_distance_matrix(
+        self, units: List[Unit] | None = None
+    ) -> list[list[int | None]]:
+        """Return hex distances between every pair of ``units``.
+
+        ``matrix[i][j]`` is the distance from ``units[i]`` to ``units[j]``,
+        computed in one batch. Rows and columns for units that are not on
+        the board hold ``None``. Defaults to every unit on the board.
+        """
+        if units is None:
+            units = self.get_units()
+        hex_ids = [self.unit_hex_id(unit) for unit in units]
+        placed_ids = [hex_id for hex_id in hex_ids if hex_id is not None]
+        distances_from = self.geometry.distances_from
+
+        matrix: list[list[int | None]] = []
+        for hex_id in hex_ids:
+            if hex_id is None:
+                matrix.append([None] * len(units))
+                continue
+            placed = iter(distances_from(hex_id, placed_ids))
+            matrix.append([
+                None if other_id is None else next(placed)
+                for other_id in hex_ids
+            ])
+        return matrix
 
     def get_nearest_unit(self, unit: Unit, friend: bool) -> Unit | None:
         """Return the closest unit to ``unit`` based on faction.
@@ -251,41 +515,85 @@ class Board:
         opposing-faction units. Returns ``None`` if no matching unit is found
         or the starting hex is invalid.
         """
-        if unit is None or unit.get_coords() is None:
-            return None
-
-        own_faction = unit.get_faction()
-        row, column = unit.get_coords()
-        start_hex = self.get_hex(row, column)
-        if start_hex is None:
-            return None
-
-        min_distance = float("inf")
-        nearest_match: Unit | None = None
-
-        for other in self.get_units():
-            if other is unit:
-                continue
-            if other.get_coords() is None:
-                continue
+        nearest = self.get_nearest_units(unit, friend, 1)
+        return nearest[0] if nearest else None
 
-            # Filter by friend/foe
-            same_faction = other.get_faction() == own_faction
-            if friend and not same_faction:
-                continue
-            if not friend and same_faction:
-                continue
+    def get_nearest_units(
+        self, unit: Unit, friend: bool, count: int
+    ) -> List[Unit]:
+        """Return up to ``count`` same- or opposing-faction units nearest
+        to ``unit``, closest first.
 
-            other_hex = self.get_hex(*other.get_coords())
-            if other_hex is None:
-                continue
+        Hex rings around the unit are searched outward through the
+        occupancy index, so only units near the answer are examined. Units
+        at equal distance are returned in board order.
+        """
+        if unit is None or count <= 0:
+            return []
+        start_id = self.unit_hex_id(unit)
+        if start_id is None:
+            return []
 
-            distance = self.hex_distance(start_hex, other_hex)
-            if distance < min_distance:
-                min_distance = distance
-                nearest_match = other
+        own_faction = unit.get_faction()
+        nearest: List[Unit] = []
+        for _, ring_units in self._iter_rings(start_id):
+            for other in ring_units:
+                if other is unit:
+                    continue
+                same_faction = other.get_faction() == own_faction
+                if same_faction == friend:
+                    nearest.append(other)
+            if len(nearest) >= count:
+                break
+        return nearest[:count]
+
+    def get_units_within(
+        self, unit: Unit, radius: int, friend: bool | None = None
+    ) -> List[Tuple[Unit, int]]:
+        """Return ``(unit, distance)`` pairs within ``radius`` of ``unit``.
+
+        ``friend`` limits the result to same-faction (True) or
+        opposing-faction (False) units; ``None`` returns both. Pairs are
+        ordered by distance, then board order.
+        """
+        start_id = self.unit_hex_id(unit)
+        if start_id is None:
+            return []
 
-        return nearest_match
+        own_faction = unit.get_faction()
+        within = []
+        for distance, ring_units in self._iter_rings(start_id, radius):
+            for other in ring_units:
+                if other is unit:
+                    continue
+                if friend is not None:
+                    same_faction = other.get_faction() == own_faction
+                    if same_faction != friend:
+                        continue
+                within.append((other, distance))
+        return within
+
+    def _iter_rings(self, start_id: int, max_radius: int | None = None):
+        """Yield ``(distance, units)`` for each hex ring around ``start_id``.
+
+        Units in each ring are sorted into board order; empty rings are
+        skipped.
+        """
+        furthest = self.geometry.max_distance_from(start_id)
+        if max_radius is not None:
+            furthest = min(furthest, max_radius)
+
+        units_by_hex_id = self._units_by_hex_id
+        ring_ids = self.geometry.ring_ids
+        for radius in range(furthest + 1):
+            ring_units = [
+                ring_unit
+                for ring_id in ring_ids(start_id, radius)
+                for ring_unit in units_by_hex_id[ring_id]
+            ]
+            if ring_units:
+                ring_units.sort(key=self._rank_of)
+                yield radius, ring_units
 
     def get_nearest_friendly_unit(self, unit: Unit) -> Unit | None:
         """Return the closest same-faction unit to `unit` (or None if none)."""
@@ -295,90 +603,184 @@ class Board:
         """Return the closest opposing-faction unit to ``unit`` or ``None``."""
         return self.get_nearest_unit(unit, friend=False)
 
+    def get_route_planner(self) -> RoutePlanner:
+        """Return this board's multi-turn route planner.
+
+        The planner is created on first use and caches routes across
+        turns; see :class:`RoutePlanner`.
+        """
+        if self._route_planner is None:
+            self._route_planner = RoutePlanner(self)
+        return self._route_planner
+
+    def get_distance_fields(self) -> DistanceFields:
+        """Return this board's cached movement distance fields.
+
+        The fields are created on first use and rebuilt only when the
+        units or terrain they depend on change; see
+        :class:`DistanceFields`.
+        """
+        if self._distance_fields is None:
+            self._distance_fields = DistanceFields(self)
+        return self._distance_fields
+
     def path_towards(
-        self, unit: Unit, target_hex: Hex, max_steps: int
+        self,
+        unit: Unit,
+        target_hex: Hex,
+        max_steps: int,
+        path_tree: PathTree | None = None,
     ) -> List[Hex]:
-        """Return a truncated shortest path from the unit to ``target_hex``."""
-        if unit.get_coords() is None:
-            return []
+        """Return a truncated shortest path from the unit to ``target_hex``.
 
-        start_hex = self.get_hex(*unit.get_coords())
-        if start_hex is None:
+        Candidates are the hexes reachable within ``max_steps`` movement
+        points that the unit can also reach with its own allowance.
+        ``path_tree`` may supply the ``max_steps`` search from the unit's
+        hex, for instance from a batched :meth:`get_path_trees` call.
+        """
+        trees = self._path_trees_for_steps(unit, max_steps, path_tree)
+        if trees is None:
             return []
+        candidate_tree, route_tree = trees
 
-        reachable = self.get_reachable_hexes(
-            unit, start_hex, move_points=max_steps
-        )
-        if not reachable:
-            return [start_hex]
-
+        start_hex = candidate_tree.start
         start_cube = self.to_cube_coords(start_hex)
         target_cube = self.to_cube_coords(target_hex)
         target_vector = tuple(
             tc - sc for sc, tc in zip(start_cube, target_cube)
         )
-
-        candidate_paths: List[Tuple[int, int, int, List[Hex]]] = []
-        for candidate in reachable:
-            path = self.shortest_path(unit, start_hex, candidate)
-            if not path:
+        tx, ty, tz = target_cube
+        cube_coords = self.geometry.cube_coords
+        columns = self.columns
+
+        best_key: Tuple[int, int, int] | None = None
+        best_candidate: Hex | None = None
+        for candidate in candidate_tree.reachable_hexes():
+            path_length = route_tree.path_length_to(candidate)
+            if not path_length:
                 continue
-            distance = self.hex_distance(candidate, target_hex)
-            candidate_cube = self.to_cube_coords(candidate)
-            candidate_vector = tuple(
-                cc - sc for sc, cc in zip(start_cube, candidate_cube)
-            )
+            candidate_id = candidate.row * columns + candidate.column
+            cx, cy, cz = cube_coords[candidate_id]
+            distance = max(abs(cx - tx), abs(cy - ty), abs(cz - tz))
             dot_product = sum(
-                a * b for a, b in zip(candidate_vector, target_vector)
+                (cc - sc) * tv
+                for sc, cc, tv in zip(start_cube, (cx, cy, cz), target_vector)
             )
-            candidate_paths.append((distance, len(path), -dot_product, path))
+            key = (distance, path_length, -dot_product)
+            if best_key is None or key < best_key:
+                best_key = key
+                best_candidate = candidate
 
-        if not candidate_paths:
+        if best_candidate is None:
             return [start_hex]
 
-        _, _, _, best_path = min(
-            candidate_paths, key=lambda item: (item[0], item[1], item[2])
-        )
-
-        return best_path[: max_steps + 1]
+        return route_tree.path_to(best_candidate)[: max_steps + 1]
 
     def path_away_from(
-        self, unit: Unit, threat_hex: Hex, max_steps: int
+        self,
+        unit: Unit,
+        threat_hex: Hex,
+        max_steps: int,
+        path_tree: PathTree | None = None,
     ) -> List[Hex]:
-        """Return a path that increases distance from ``threat_hex``."""
-        if unit.get_coords() is None:
-            return []
+        """Return a path that increases distance from ``threat_hex``.
 
-        start_hex = self.get_hex(*unit.get_coords())
-        if start_hex is None:
+        The farthest hex is chosen among those reachable within
+        ``max_steps`` movement points; when the unit's own allowance
+        cannot reach it, the unit stays put. ``path_tree`` is used as in
+        :meth:`path_towards`.
+        """
+        trees = self._path_trees_for_steps(unit, max_steps, path_tree)
+        if trees is None:
             return []
+        candidate_tree, route_tree = trees
 
-        reachable = self.get_reachable_hexes(
-            unit, start_hex, move_points=max_steps
-        )
-        if not reachable:
-            return [start_hex]
-
+        threat_cube = self.to_cube_coords(threat_hex)
+        cube_coords = self.geometry.cube_coords
+        columns = self.columns
         farthest = max(
-            reachable, key=lambda h: self.hex_distance(h, threat_hex)
+            candidate_tree.reachable_hexes(),
+            key=lambda h: cube_distance(
+                cube_coords[h.row * columns + h.column], threat_cube
+            ),
         )
 
-        path = self.shortest_path(unit, start_hex, farthest)
+        path = route_tree.path_to(farthest)
         if not path:
-            return [start_hex]
+            return [candidate_tree.start]
 
         return path[: max_steps + 1]
 
+    def _path_trees_for_steps(
+        self,
+        unit: Unit,
+        max_steps: int,
+        candidate_tree: PathTree | None = None,
+    ) -> tuple[PathTree, PathTree] | None:
+        """Return the candidate and route searches for ``path_towards``/
+        ``away``.
+
+        Candidates come from a search with ``max_steps`` movement points
+        and routes from one with the unit's own allowance. With
+        non-negative costs a smaller allowance yields the same routes to
+        the hexes it reaches, so one search serves both unless
+        ``max_steps`` exceeds the unit's allowance.
+        """
+        if unit.get_coords() is None:
+            return None
+
+        start_hex = self.get_hex(*unit.get_coords())
+        if start_hex is None:
+            return None
+
+        if candidate_tree is None:
+            candidate_tree = self.get_path_tree(
+                unit, start_hex, move_points=max_steps
+            )
+        if max_steps <= unit.get_move():
+            return candidate_tree, candidate_tree
+        return candidate_tree, self.get_path_tree(unit, start_hex)
+
     def get_units_for_hexes(self, hexes: List[Hex]) -> List[Unit]:
-        units = []
-        for unit in self.units.values():
-            if unit.get_coords() in hexes:
-                units.append(unit)
+        hex_ids = {
+            self.geometry.hex_id(hex_tile.row, hex_tile.column)
+            for hex_tile in hexes
+        }
+        hex_ids.discard(None)
+        units = [
+            unit
+            for hex_id in hex_ids
+            for unit in self._units_by_hex_id[hex_id]
+        ]
+        units.sort(key=self._rank_of)
         return units
 
     def get_objectives(self) -> list[Objective]:
         """Return all objectives currently stored on the board."""
-        objectives: list[Objective] = []
-        for hex_tile in self.hexes:
-            objectives.extend(hex_tile.objectives)
-        return objectives
+        hexes = self.hexes
+        return [
+            objective
+            for hex_id in self.layers.objective_hex_ids
+            for objective in hexes[hex_id].objectives
+        ]
+
+    def get_objective_occupants(
+        self,
+    ) -> list[tuple[Objective, List[Unit]]]:
+        """Return each objective paired with the units on its coordinates.
+
+        Objectives come in :meth:`get_objectives` order and occupants in
+        board order. Occupants are read from the occupancy index, so the
+        cost grows with the number of objectives rather than units. The
+        occupant lists are live and must not be mutated.
+        """
+        hex_id_of = self.geometry.hex_id
+        units_by_hex_id = self._units_by_hex_id
+        occupants = []
+        for objective in self.get_objectives():
+            hex_id = hex_id_of(*objective.coords)
+            occupants.append((
+                objective,
+                [] if hex_id is None else units_by_hex_id[hex_id],
+            ))
+        return occupants
@@ -0,0 +1,232 @@
+"""Struct-of-arrays views of a board for batch analysis.
+
+Every layer is a flat list indexed by hex ID (see
+:mod:`battle_hexes_core.game.hexgeometry`), so AI and analysis code can
+sweep the whole board with list operations instead of walking ``Hex`` and
+``Terrain`` objects one attribute at a time.
+"""
+
+from fractions import Fraction
+from math import isfinite, lcm
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from battle_hexes_core.game.board import Board
+
+
+# Largest fixed-point scale used for integer edge costs; boards whose costs
+# need a finer grid keep float costs only.
+MAX_FIXED_POINT_SCALE = 64
+
+
+class BoardLayers:
+    """Per-hex arrays kept consistent with a board's object model.
+
+    Terrain, road and objective layers are rebuilt lazily the first time
+    they are read after any hex changes terrain or objectives or the board's
+    roads change. Occupancy and owner layers are updated by the board as
+    units move.
+    """
+
+    def __init__(self, board: "Board"):
+        self._board = board
+        size = board.geometry.size
+        self.unit_count: list[int] = [0] * size
+        self.owner: list[object | None] = [None] * size
+        self._terrain_version = 0
+        self._cached: dict[str, tuple[int, list]] = {}
+
+    @property
+    def terrain_version(self) -> int:
+        """Counter bumped whenever terrain, objectives or roads change."""
+        return self._terrain_version
+
+    def hex_changed(self) -> None:
+        """Mark the terrain and objective layers as stale."""
+        self._terrain_version += 1
+
+    def roads_changed(self) -> None:
+        """Mark the edge cost layer as stale."""
+        self._terrain_version += 1
+
+    def occupancy_changed(self, hex_id: int, units: list) -> None:
+        """Refresh the occupancy layers for ``hex_id`` from its units."""
+        self.unit_count[hex_id] = len(units)
+        self.owner[hex_id] = units[0].player if units else None
+
+    @property
+    def move_cost(self) -> list[int]:
+        """Cost to enter each hex, ``1`` where no terrain is set."""
+        return self._terrain_layer("move_cost", 1)
+
+    @property
+    def edge_move_cost(self) -> list[tuple[float, ...]]:
+        """Cost of every move between neighboring hexes.
+
+        ``edge_move_cost[hex_id][i]`` is the cost of entering
+        ``geometry.neighbor_ids[hex_id][i]`` from ``hex_id``: the entered
+        hex's terrain cost, or the cost of a road joining the two hexes
+        when that is cheaper.
+        """
+        return self._layer("edge_move_cost", self._build_edge_move_cost)
+
+    @property
+    def fixed_point_edge_move_cost(
+        self,
+    ) -> tuple[int, list[tuple[int, ...]]] | None:
+        """``edge_move_cost`` on an integer grid, for bucket-queue searches.
+
+        Returns ``(scale, table)`` where every cost in ``table`` is the
+        matching :attr:`edge_move_cost` multiplied by ``scale``, the
+        smallest factor that makes them all integers. ``None`` when a cost
+        is negative or not finite, or needs a scale above
+        ``MAX_FIXED_POINT_SCALE``.
+        """
+        return self._layer(
+            "fixed_point_edge_move_cost",
+            self._build_fixed_point_edge_move_cost,
+        )
+
+    @property
+    def combat_odds_shift(self) -> list[int]:
+        """Odds column shift granted to defenders in each hex."""
+        return self._terrain_layer("combat_odds_shift", 0)
+
+    @property
+    def defensive_fire_modifier(self) -> list[float]:
+        """Defensive fire probability multiplier for each hex."""
+        return self._terrain_layer("defensive_fire_modifier", 1.0)
+
+    @property
+    def objective_mask(self) -> list[bool]:
+        """True for every hex holding at least one objective."""
+        return self._layer(
+            "objective_mask",
+            lambda hexes: [bool(hex_tile.objectives) for hex_tile in hexes],
+        )
+
+    @property
+    def objective_hex_ids(self) -> list[int]:
+        """IDs of the hexes holding objectives, in ascending order."""
+        return self._layer(
+            "objective_hex_ids",
+            lambda hexes: [
+                hex_id
+                for hex_id, hex_tile in enumerate(hexes)
+                if hex_tile.objectives
+            ],
+        )
+
+    def occupied_mask(self, player) -> list[bool]:
+        """Return True for every hex holding units owned by ``player``."""
+        return [
+            owner is not None and (owner is player or owner == player)
+            for owner in self.owner
+        ]
+
+    def enterable_mask(self, player) -> list[bool]:
+        """Return True for every hex a unit of ``player`` may enter.
+
+        A hex is closed when it holds a unit of another player or its
+        stack of ``player``'s units is already at the board's stacking
+        limit.
+        """
+        board = self._board
+        stacking_limit = board.stacking_limit
+        mask = [True] * len(self.unit_count)
+        for hex_id, unit_count in enumerate(self.unit_count):
+            if not unit_count:
+                continue
+            friendly_count = 0
+            for unit in board.get_units_at_id(hex_id):
+                if not (unit.player is player or unit.player == player):
+                    mask[hex_id] = False
+                    break
+                friendly_count += 1
+            else:
+                if stacking_limit is not None:
+                    mask[hex_id] = friendly_count + 1 <= stacking_limit
+        return mask
+
+    def zone_of_control_mask(self, player) -> list[bool]:
+        """Return True for every hex adjacent to an enemy of ``player``."""
+        board = self._board
+        total_counts = board.adjacent_unit_counts()
+        own_counts = board.adjacent_unit_counts(player)
+        return [
+            total > own for total, own in zip(total_counts, own_counts)
+        ]
+
+    def _build_edge_move_cost(self, hexes) -> list[tuple[float, ...]]:
+        del hexes
+        board = self._board
+        geometry = board.geometry
+        neighbor_ids = geometry.neighbor_ids
+        road_costs: dict[tuple[int, int], float] = {}
+        for road_type, path in board.road_paths:
+            cost = board.road_types.get(road_type)
+            if cost is None:
+                continue
+            for start, end in zip(path, path[1:]):
+                start_id = geometry.hex_id(*start)
+                end_id = geometry.hex_id(*end)
+                if start_id is None or end_id is None:
+                    continue
+                if end_id not in neighbor_ids[start_id]:
+                    # Consecutive path hexes that do not touch are not
+                    # joined by the road.
+                    continue
+                for edge in ((start_id, end_id), (end_id, start_id)):
+                    road_costs[edge] = min(cost, road_costs.get(edge, cost))
+
+        move_cost = self.move_cost
+        return [
+            tuple(
+                min(
+                    move_cost[neighbor_id],
+                    road_costs.get(
+                        (hex_id, neighbor_id), move_cost[neighbor_id]
+                    ),
+                )
+                for neighbor_id in neighbors
+            )
+            for hex_id, neighbors in enumerate(neighbor_ids)
+        ]
+
+    def _build_fixed_point_edge_move_cost(
+        self, hexes
+    ) -> tuple[int, list[tuple[int, ...]]] | None:
+        del hexes
+        edge_move_cost = self.edge_move_cost
+        costs = {cost for step_costs in edge_move_cost for cost in step_costs}
+        scale = 1
+        for cost in costs:
+            if not isfinite(cost) or cost < 0:
+                return None
+            scale = lcm(scale, Fraction(cost).denominator)
+            if scale > MAX_FIXED_POINT_SCALE:
+                return None
+        scaled = {cost: int(Fraction(cost) * scale) for cost in costs}
+        return scale, [
+            tuple(scaled[cost] for cost in step_costs)
+            for step_costs in edge_move_cost
+        ]
+
+    def _terrain_layer(self, attribute: str, default) -> list:
+        def build(hexes):
+            return [
+                default
+                if hex_tile.terrain is None
+                else getattr(hex_tile.terrain, attribute)
+                for hex_tile in hexes
+            ]
+
+        return self._layer(attribute, build)
+
+    def _layer(self, name: str, build) -> list:
+        cached = self._cached.get(name)
+        if cached is not None and cached[0] == self._terrain_version:
+            return cached[1]
+        layer = build(self._board.hexes)
+        self._cached[name] = (self._terrain_version, layer)
+        return layer
@@ -0,0 +1,163 @@
+"""Whole-board movement distance fields ("Dijkstra maps").
+
+A distance field holds, for every hex, the movement cost of the cheapest
+way from that hex to the nearest hex of a target set. One multi-source
+search fills the whole field, after which any unit reads its distance to
+the targets with a single list lookup.
+"""
+
+import heapq
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from battle_hexes_core.game.events import UnitMoved, UnitPlaced, UnitRemoved
+from battle_hexes_core.unit.faction import Faction
+from battle_hexes_core.unit.unit import Unit
+
+if TYPE_CHECKING:
+    from battle_hexes_core.game.board import Board
+
+
+class DistanceFields:
+    """Cached distance fields towards faction units and objectives.
+
+    Costs come from the board's edge cost table, so terrain and roads are
+    priced exactly as in a movement search. Occupancy, zones of control
+    and the per-turn allowance are ignored: a field answers "how far by
+    terrain", not "where can this unit go this turn". Hexes that cannot
+    reach any target hold ``inf``.
+
+    A faction field is kept until a unit of one of its factions is placed,
+    moves or is removed. The objective field, like every field, is rebuilt
+    after terrain, roads or objectives change.
+    """
+
+    def __init__(self, board: "Board"):
+        self.board = board
+        self._fields: dict[frozenset[Faction], list[float]] = {}
+        self._objective_field: list[float] | None = None
+        self._incoming_edges: list[tuple[tuple[int, float], ...]] | None = (
+            None
+        )
+        self._terrain_version = board.layers.terrain_version
+        for event_type in (UnitPlaced, UnitMoved, UnitRemoved):
+            board.events.subscribe(event_type, self._unit_changed)
+
+    def faction_field(
+        self, factions: Faction | Iterable[Faction]
+    ) -> list[float]:
+        """Return the distance from every hex to a unit of ``factions``.
+
+        The list is indexed by hex ID and shared with the cache, so it must
+        not be modified.
+        """
+        self._check_terrain()
+        key = _faction_key(factions)
+        field = self._fields.get(key)
+        if field is None:
+            source_ids = {
+                hex_id
+                for unit in self.board.get_units()
+                if unit.get_faction() in key
+                and (hex_id := self.board.unit_hex_id(unit)) is not None
+            }
+            field = self._sweep(source_ids)
+            self._fields[key] = field
+        return field
+
+    def objective_field(self) -> list[float]:
+        """Return the distance from every hex to the nearest objective."""
+        self._check_terrain()
+        if self._objective_field is None:
+            self._objective_field = self._sweep(
+                self.board.layers.objective_hex_ids
+            )
+        return self._objective_field
+
+    def distance_to_factions(
+        self, unit: Unit, factions: Faction | Iterable[Faction]
+    ) -> float | None:
+        """Return ``unit``'s distance to the nearest unit of ``factions``.
+
+        ``None`` when ``unit`` is off the board. A unit of one of
+        ``factions`` counts itself, so its own faction is at distance 0.
+        """
+        hex_id = self.board.unit_hex_id(unit)
+        if hex_id is None:
+            return None
+        return self.faction_field(factions)[hex_id]
+
+    def distance_to_objective(self, unit: Unit) -> float | None:
+        """Return ``unit``'s distance to the nearest objective.
+
+        ``None`` when ``unit`` is off the board.
+        """
+        hex_id = self.board.unit_hex_id(unit)
+        if hex_id is None:
+            return None
+        return self.objective_field()[hex_id]
+
+    def invalidate(self) -> None:
+        """Forget every cached field."""
+        self._fields.clear()
+        self._objective_field = None
+
+    def _sweep(self, source_ids: Iterable[int]) -> list[float]:
+        """Run one multi-source search backwards from ``source_ids``.
+
+        Edge costs depend on the hex entered, so the search walks edges in
+        reverse: settling a hex relaxes the neighbors that step into it.
+        """
+        incoming_edges = self._incoming()
+        distances = [float("inf")] * len(incoming_edges)
+        queue = []
+        for hex_id in source_ids:
+            distances[hex_id] = 0
+            queue.append((0, hex_id))
+        heapq.heapify(queue)
+        while queue:
+            distance, hex_id = heapq.heappop(queue)
+            if distance > distances[hex_id]:
+                continue
+            for from_id, step_cost in incoming_edges[hex_id]:
+                new_distance = distance + step_cost
+                if new_distance < distances[from_id]:
+                    distances[from_id] = new_distance
+                    heapq.heappush(queue, (new_distance, from_id))
+        return distances
+
+    def _incoming(self) -> list[tuple[tuple[int, float], ...]]:
+        """Return ``(from_id, cost)`` for every move into each hex."""
+        if self._incoming_edges is None:
+            neighbor_ids = self.board.geometry.neighbor_ids
+            edge_costs = self.board.layers.edge_move_cost
+            incoming: list[list[tuple[int, float]]] = [
+                [] for _ in neighbor_ids
+            ]
+            for from_id, step_costs in enumerate(edge_costs):
+                for index, to_id in enumerate(neighbor_ids[from_id]):
+                    incoming[to_id].append((from_id, step_costs[index]))
+            self._incoming_edges = [tuple(edges) for edges in incoming]
+        return self._incoming_edges
+
+    def _check_terrain(self) -> None:
+        terrain_version = self.board.layers.terrain_version
+        if terrain_version != self._terrain_version:
+            self._terrain_version = terrain_version
+            self._incoming_edges = None
+            self.invalidate()
+
+    def _unit_changed(self, event) -> None:
+        if not self._fields:
+            return
+        faction = event.unit.get_faction()
+        for key in [key for key in self._fields if faction in key]:
+            del self._fields[key]
+
+
+def _faction_key(
+    factions: Faction | Iterable[Faction],
+) -> frozenset[Faction]:
+    if isinstance(factions, Faction):
+        return frozenset((factions,))
+    return frozenset(factions)
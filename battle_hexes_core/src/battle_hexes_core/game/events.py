@@ -0,0 +1,103 @@
+"""Typed game events and the bus that delivers them.
+
+The board owns an :class:`EventBus` (``board.events``) and publishes an
+event whenever a unit is placed, moves, leaves the board or has its
+defensive fire status changed; the game adds turn changes. Indexes and
+caches built on top of the board subscribe to the events they depend on
+and update only what an event touches, instead of recomputing from
+scratch.
+
+Handlers run synchronously, in subscription order, after the board's own
+indexes (occupancy, zones of control) reflect the change.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class UnitEvent:
+    """Something happened to a unit that may affect board-derived data.
+
+    ``previous_coords`` is where the unit stood before the event and
+    ``coords`` where it stands after; either is ``None`` when the unit is
+    not on the board.
+    """
+
+    unit: object
+    previous_coords: tuple[int, int] | None
+    coords: tuple[int, int] | None
+
+
+@dataclass(frozen=True, slots=True)
+class UnitPlaced(UnitEvent):
+    """A unit was added to the board."""
+
+
+@dataclass(frozen=True, slots=True)
+class UnitMoved(UnitEvent):
+    """A unit on the board changed hex, including forced retreats."""
+
+
+@dataclass(frozen=True, slots=True)
+class UnitRemoved(UnitEvent):
+    """A unit was taken off the board."""
+
+
+@dataclass(frozen=True, slots=True)
+class DefensiveFireChanged(UnitEvent):
+    """A unit's defensive fire availability or eligibility changed."""
+
+
+@dataclass(frozen=True, slots=True)
+class DefensiveFireSpent:
+    """A unit used its defensive fire for the current off turn."""
+
+    unit: object
+
+
+@dataclass(frozen=True, slots=True)
+class TurnAdvanced:
+    """Play passed from ``previous_player`` to ``player``."""
+
+    previous_player: object
+    player: object
+    turn_number: int
+
+
+class EventBus:
+    """Deliver published events to the handlers subscribed to their type.
+
+    Subscribing to a base class such as :class:`UnitEvent` receives every
+    subclass. The handler list for each concrete event type is resolved
+    once and cached, so publishing costs one dictionary lookup plus the
+    handler calls.
+    """
+
+    def __init__(self):
+        self._subscriptions: list[tuple[type, Callable]] = []
+        self._dispatch: dict[type, tuple[Callable, ...]] = {}
+
+    def subscribe(self, event_type: type, handler: Callable) -> None:
+        """Call ``handler(event)`` for every published ``event_type``."""
+        self._subscriptions.append((event_type, handler))
+        self._dispatch.clear()
+
+    def unsubscribe(self, event_type: type, handler: Callable) -> None:
+        """Stop calling ``handler`` for ``event_type``."""
+        self._subscriptions.remove((event_type, handler))
+        self._dispatch.clear()
+
+    def publish(self, event) -> None:
+        """Deliver ``event`` to its subscribers."""
+        event_type = type(event)
+        handlers = self._dispatch.get(event_type)
+        if handlers is None:
+            handlers = tuple(
+                handler
+                for subscribed_type, handler in self._subscriptions
+                if issubclass(event_type, subscribed_type)
+            )
+            self._dispatch[event_type] = handlers
+        for handler in handlers:
+            handler(event)
@@ -2,13 +2,19 @@ import uuid
 from typing import List
 
 from battle_hexes_core.game.board import Board
+from battle_hexes_core.game.events import TurnAdvanced, UnitEvent
+from battle_hexes_core.game.gamerandom import GameRandom
 from battle_hexes_core.defensivefire.defensive_fire import (
     MovementResolutionResult,
 )
 from battle_hexes_core.defensivefire.defensive_fire_resolver import (
     DefensiveFireResolver,
 )
+from battle_hexes_core.defensivefire.defensive_fire_risk import (
+    DefensiveFireRiskMap,
+)
 from battle_hexes_core.game.movement import MovementCalculator
+from battle_hexes_core.game.objectivetracker import ObjectiveTracker
 from battle_hexes_core.game.player import Player
 from battle_hexes_core.game.scoretracker import ScoreTracker
 from battle_hexes_core.game.unitmovementplan import UnitMovementPlan
@@ -21,6 +27,7 @@ class Game:
         players: list,
         board: Board,
         turn_limit: int | None = None,
+        rng: GameRandom | None = None,
     ):
         self.id = uuid.uuid4()
         self.players = players
@@ -34,8 +41,25 @@ class Game:
             else None
         )
         self.turn_number = 1
-        self.defensive_fire_resolver = DefensiveFireResolver(board)
-        self._refresh_defensive_fire_availability()
+        self.random = rng if rng is not None else GameRandom()
+        self.defensive_fire_resolver = DefensiveFireResolver(
+            board, rng=self.random.stream("defensive_fire")
+        )
+        self.defensive_fire_risk = DefensiveFireRiskMap(
+            board, self.defensive_fire_resolver
+        )
+        self.objective_tracker = ObjectiveTracker(board)
+        # Players outlive games, so always rebind them to this game's
+        # streams rather than keep whatever the previous game handed out.
+        for index, player in enumerate(players):
+            if hasattr(player, "use_random"):
+                player.use_random(self.random.stream(f"player:{index}"))
+        # Units whose defensive fire availability may be stale: those
+        # placed, moved, retreated or whose fire status changed since the
+        # last refresh. Keyed by object identity, in the order reported.
+        self._dirty_units: dict[int, object] = {}
+        board.events.subscribe(UnitEvent, self._mark_unit_dirty)
+        self._refresh_defensive_fire_availability(board.get_units())
 
     def get_id(self):
         return self.id
@@ -52,6 +76,15 @@ class Game:
     def get_score_tracker(self) -> ScoreTracker:
         return self.score_tracker
 
+    def get_defensive_fire_risk(self) -> DefensiveFireRiskMap:
+        return self.defensive_fire_risk
+
+    def get_objective_tracker(self) -> ObjectiveTracker:
+        return self.objective_tracker
+
+    def get_random(self) -> GameRandom:
+        return self.random
+
     def set_defensive_fire_settings(self, settings) -> None:
         self.defensive_fire_resolver.set_settings(settings)
 
@@ -137,6 +170,11 @@ class Game:
         self.current_player = self.players[next_idx]
         self._reset_defensive_fire_off_turn_usage(self.current_player)
         self._refresh_defensive_fire_availability()
+        self.board.events.publish(
+            TurnAdvanced(
+                previous_player, self.current_player, self.turn_number
+            )
+        )
         return self.current_player
 
     def _snapshot_defensive_fire_eligibility(
@@ -148,14 +186,33 @@ class Game:
                 unit.current_turn_movement_points_remaining,
                 self.current_player,
             )
+            self._dirty_units[id(unit)] = unit
 
     def _reset_defensive_fire_off_turn_usage(self, player: Player) -> None:
         for unit in self.get_board().get_units_for_player(player):
             unit.reset_defensive_fire_for_new_turn(self.current_player)
-
-    def _refresh_defensive_fire_availability(self) -> None:
-        for unit in self.get_board().get_units():
+            self._dirty_units[id(unit)] = unit
+
+    def _mark_unit_dirty(self, event: UnitEvent) -> None:
+        self._dirty_units[id(event.unit)] = event.unit
+
+    def _refresh_defensive_fire_availability(self, units=None) -> None:
+        """Recompute availability for ``units`` or every dirty unit.
+
+        Availability only depends on a unit's own state and on whether its
+        owner is the current player. The outgoing and incoming players'
+        units are marked dirty when turns change (snapshot and reset), so
+        the dirty set covers every unit whose availability can differ.
+        """
+        if units is None:
+            board_units = self.get_board().units
+            units = [
+                unit for unit in self._dirty_units.values()
+                if board_units.get(unit.get_id()) is unit
+            ]
+        for unit in units:
             unit.update_defensive_fire_available(self.current_player)
+        self._dirty_units.clear()
 
     def get_opposing_factions(self, faction: Faction) -> List[Faction]:
         owning_player = self.get_player_for_faction(faction)
@@ -2,6 +2,7 @@ from random import choice
 
 from battle_hexes_core.game.board import Board
 from battle_hexes_core.game.game import Game
+from battle_hexes_core.game.gamerandom import GameRandom
 from battle_hexes_core.game.player import Player
 from battle_hexes_core.unit.unit import Unit
 
@@ -27,8 +28,13 @@ class GameFactory:
             unit: unit.get_coords() for unit in units
         }
 
-    def create_game(self) -> Game:
-        """Create a ``Game`` using the stored board size, players and units."""
+    def create_game(self, rng: GameRandom | None = None) -> Game:
+        """Create a ``Game`` using the stored board size, players and units.
+
+        ``rng`` supplies the new game's random streams, including the
+        ``"setup"`` stream used to randomize unit positions; without it the
+        game draws from the global ``random`` module.
+        """
         rows, cols = self.board_size
         # Always create a fresh board for a new game and assign it to players
         board = Board(rows, cols)
@@ -36,8 +42,9 @@ class GameFactory:
             if hasattr(player, "_board"):
                 player._board = board
 
-        game = Game(self.players, board)
+        game = Game(self.players, board, rng=rng)
 
+        setup_random = rng.stream("setup") if rng is not None else None
         used_coords = set()
         for unit in self.units:
             coords = self._unit_start_positions.get(unit)
@@ -45,20 +52,31 @@ class GameFactory:
                 continue
 
             if self.randomize_positions:
-                coords = self._random_coords(rows, cols, used_coords)
+                coords = self._random_coords(
+                    rows, cols, used_coords, setup_random
+                )
             board.add_unit(unit, coords[0], coords[1])
             used_coords.add(coords)
 
         return game
 
     def _random_coords(
-        self, rows: int, cols: int, used: set[tuple[int, int]]
+        self,
+        rows: int,
+        cols: int,
+        used: set[tuple[int, int]],
+        setup_random=None,
     ) -> tuple[int, int]:
-        """Return random board coordinates not already used."""
+        """Return random board coordinates not already used.
+
+        Draws from ``setup_random`` when given, else from ``random``.
+        """
         available = [
             (r, c)
             for r in range(rows)
             for c in range(cols)
             if (r, c) not in used
         ]
+        if setup_random is not None:
+            return setup_random.choice(available)
         return choice(available)
@@ -0,0 +1,46 @@
+"""Reproducible random number streams for a game.
+
+A seeded :class:`GameRandom` hands out one independent ``random.Random``
+per named consumer (combat, defensive fire, each player), so the draws of
+one consumer never shift another's. Child seeds are derived by hashing,
+which lets separate processes build reproducible, non-overlapping games
+from a shared base seed and a game counter without coordinating.
+"""
+
+import hashlib
+import random
+
+
+def derive_seed(seed: int, *path) -> int:
+    """Return a 64-bit seed derived from ``seed`` and a name path."""
+    key = ":".join(str(part) for part in (seed, *path))
+    digest = hashlib.sha256(key.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+class GameRandom:
+    """Source of the random streams used by one game.
+
+    Without a seed every stream is the global ``random`` module, which keeps
+    the behaviour of code that seeds or patches ``random`` directly.
+    """
+
+    def __init__(self, seed: int | None = None):
+        self.seed = seed
+        self._streams: dict[str, random.Random] = {}
+
+    def spawn(self, index: int) -> "GameRandom":
+        """Return the ``index``-th child, e.g. one per simulated game."""
+        if self.seed is None:
+            return GameRandom()
+        return GameRandom(derive_seed(self.seed, "game", index))
+
+    def stream(self, name: str):
+        """Return the random stream reserved for ``name``."""
+        if self.seed is None:
+            return random
+        stream = self._streams.get(name)
+        if stream is None:
+            stream = random.Random(derive_seed(self.seed, "stream", name))
+            self._streams[name] = stream
+        return stream
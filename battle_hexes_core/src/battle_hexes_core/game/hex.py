@@ -1,7 +1,58 @@
+from collections.abc import Callable
+
 from battle_hexes_core.game.terrain import Terrain
 from battle_hexes_core.game.objective import Objective
 
 
+class _ObjectiveList(list):
+    """List of objectives that tells its hex whenever it is modified."""
+
+    def __init__(self, hex_tile: "Hex", objectives=()):
+        super().__init__(objectives)
+        self._hex = hex_tile
+
+    def _changed(self) -> None:
+        self._hex._notify_changed()
+
+    def append(self, objective) -> None:
+        super().append(objective)
+        self._changed()
+
+    def extend(self, objectives) -> None:
+        super().extend(objectives)
+        self._changed()
+
+    def insert(self, index, objective) -> None:
+        super().insert(index, objective)
+        self._changed()
+
+    def remove(self, objective) -> None:
+        super().remove(objective)
+        self._changed()
+
+    def pop(self, index=-1):
+        objective = super().pop(index)
+        self._changed()
+        return objective
+
+    def clear(self) -> None:
+        super().clear()
+        self._changed()
+
+    def __setitem__(self, index, value) -> None:
+        super().__setitem__(index, value)
+        self._changed()
+
+    def __delitem__(self, index) -> None:
+        super().__delitem__(index)
+        self._changed()
+
+    def __iadd__(self, objectives):
+        result = super().__iadd__(objectives)
+        self._changed()
+        return result
+
+
 class Hex:
     def __init__(
         self,
@@ -13,7 +64,10 @@ class Hex:
         self._row = row
         self._column = column
         self._terrain = terrain
-        self._objectives = list(objectives) if objectives else []
+        self._objectives = _ObjectiveList(self, objectives or ())
+        # Called with this hex whenever its terrain or objectives change;
+        # set by the owning board so it can keep derived data current.
+        self._on_change: Callable[["Hex"], None] | None = None
 
     @property
     def row(self) -> int:
@@ -33,6 +87,11 @@ class Hex:
 
     def set_terrain(self, terrain: Terrain | None) -> None:
         self._terrain = terrain
+        self._notify_changed()
+
+    def _notify_changed(self) -> None:
+        if self._on_change is not None:
+            self._on_change(self)
 
     def __eq__(self, other):
         if isinstance(other, tuple):
@@ -0,0 +1,201 @@
+"""Shared hex-grid geometry for Battle Hexes boards.
+
+Boards use an odd-q offset layout: odd columns are shifted half a hex
+down. Each on-board hex also has a dense integer ID in row-major order
+(``row * columns + column``), which is its index in ``Board.hexes``.
+"""
+
+from functools import lru_cache
+
+
+# Directions for even-numbered columns (0, 2, 4, ...)
+EVEN_COLUMN_DIRECTIONS = (
+    (-1, 0),   # North
+    (-1, +1),  # Northeast
+    (0, +1),   # Southeast
+    (+1, 0),   # South
+    (0, -1),   # Southwest
+    (-1, -1),  # Northwest
+)
+
+# Directions for odd-numbered columns (1, 3, 5, ...)
+ODD_COLUMN_DIRECTIONS = (
+    (-1, 0),   # North
+    (0, +1),   # Northeast
+    (+1, +1),  # Southeast
+    (+1, 0),   # South
+    (+1, -1),  # Southwest
+    (0, -1),   # Northwest
+)
+
+# Cube-coordinate steps that walk once around a hex ring.
+CUBE_RING_DIRECTIONS = (
+    (+1, -1, 0),
+    (0, -1, +1),
+    (-1, 0, +1),
+    (-1, +1, 0),
+    (0, +1, -1),
+    (+1, 0, -1),
+)
+
+
+def to_cube(row: int, column: int) -> tuple[int, int, int]:
+    """Convert odd-q offset coordinates to cube coordinates."""
+    x_coord = column
+    z_coord = row - (column - (column & 1)) // 2
+    y_coord = -x_coord - z_coord
+    return x_coord, y_coord, z_coord
+
+
+def to_offset(x_coord: int, y_coord: int, z_coord: int) -> tuple[int, int]:
+    """Convert cube coordinates back to odd-q offset coordinates."""
+    del y_coord
+    column = x_coord
+    row = z_coord + (column - (column & 1)) // 2
+    return row, column
+
+
+def cube_distance(
+    a: tuple[int, int, int],
+    b: tuple[int, int, int],
+) -> int:
+    """Return the hex distance between two cube coordinates."""
+    return max(abs(a[0] - b[0]), abs(a[1] - b[1]), abs(a[2] - b[2]))
+
+
+def offset_distance(a: tuple[int, int], b: tuple[int, int]) -> int:
+    """Return the hex distance between two ``(row, column)`` pairs."""
+    return cube_distance(to_cube(*a), to_cube(*b))
+
+
+def offset_distances(
+    origin: tuple[int, int],
+    coords: list[tuple[int, int]],
+) -> list[int]:
+    """Return the hex distance from ``origin`` to every pair in ``coords``."""
+    ox, oy, oz = to_cube(*origin)
+    distances = []
+    for row, column in coords:
+        z_coord = row - (column - (column & 1)) // 2
+        distances.append(
+            max(
+                abs(ox - column),
+                abs(oy + column + z_coord),
+                abs(oz - z_coord),
+            )
+        )
+    return distances
+
+
+def are_adjacent(a: tuple[int, int], b: tuple[int, int]) -> bool:
+    """Return True when two ``(row, column)`` pairs are neighbors."""
+    return offset_distance(a, b) == 1
+
+
+class HexGeometry:
+    """Static adjacency data for a ``rows`` x ``columns`` board.
+
+    Hexes are identified by their row-major index
+    (``row * columns + column``), matching the layout of ``Board.hexes``.
+    Instances are immutable and shared between every board of the same
+    shape; use :meth:`for_shape` rather than constructing them directly.
+    """
+
+    def __init__(self, rows: int, columns: int):
+        self.rows = rows
+        self.columns = columns
+        self.size = rows * columns
+        self.cube_coords: tuple[tuple[int, int, int], ...] = tuple(
+            to_cube(row, column)
+            for row in range(rows)
+            for column in range(columns)
+        )
+        self.neighbor_ids: tuple[tuple[int, ...], ...] = tuple(
+            self._build_neighbor_ids(row, column)
+            for row in range(rows)
+            for column in range(columns)
+        )
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def for_shape(cls, rows: int, columns: int) -> "HexGeometry":
+        """Return the shared geometry for a ``rows`` x ``columns`` board."""
+        return cls(rows, columns)
+
+    def hex_id(self, row: int, column: int) -> int | None:
+        """Return the ID of ``(row, column)`` or ``None`` if off the board."""
+        if 0 <= row < self.rows and 0 <= column < self.columns:
+            return row * self.columns + column
+        return None
+
+    def coords(self, hex_id: int) -> tuple[int, int]:
+        """Return the ``(row, column)`` pair for ``hex_id``."""
+        return divmod(hex_id, self.columns)
+
+    def distance(self, a_id: int, b_id: int) -> int:
+        """Return the hex distance between two hex IDs."""
+        return cube_distance(self.cube_coords[a_id], self.cube_coords[b_id])
+
+    def distances_from(self, hex_id: int, hex_ids: list[int]) -> list[int]:
+        """Return the distance from ``hex_id`` to each of ``hex_ids``."""
+        cube_coords = self.cube_coords
+        ox, oy, oz = cube_coords[hex_id]
+        distances = []
+        for other_id in hex_ids:
+            x, y, z = cube_coords[other_id]
+            distances.append(max(abs(ox - x), abs(oy - y), abs(oz - z)))
+        return distances
+
+    def distance_matrix(
+        self,
+        row_ids: list[int],
+        column_ids: list[int],
+    ) -> list[list[int]]:
+        """Return ``matrix[i][j]``, the distance between two ID lists."""
+        return [
+            self.distances_from(hex_id, column_ids) for hex_id in row_ids
+        ]
+
+    def max_distance_from(self, hex_id: int) -> int:
+        """Return the distance from ``hex_id`` to the farthest board hex."""
+        last_row = self.rows - 1
+        last_column = self.columns - 1
+        corners = (
+            self.hex_id(0, 0),
+            self.hex_id(0, last_column),
+            self.hex_id(last_row, 0),
+            self.hex_id(last_row, last_column),
+        )
+        return max(self.distances_from(hex_id, corners))
+
+    def ring_ids(self, hex_id: int, radius: int) -> list[int]:
+        """Return the on-board hex IDs exactly ``radius`` from ``hex_id``."""
+        if radius == 0:
+            return [hex_id]
+
+        x, y, z = self.cube_coords[hex_id]
+        dx, dy, dz = CUBE_RING_DIRECTIONS[4]
+        x, y, z = x + dx * radius, y + dy * radius, z + dz * radius
+        ring_ids = []
+        for dx, dy, dz in CUBE_RING_DIRECTIONS:
+            for _ in range(radius):
+                row, column = to_offset(x, y, z)
+                ring_id = self.hex_id(row, column)
+                if ring_id is not None:
+                    ring_ids.append(ring_id)
+                x, y, z = x + dx, y + dy, z + dz
+        return ring_ids
+
+    def _build_neighbor_ids(self, row: int, column: int) -> tuple[int, ...]:
+        directions = (
+            EVEN_COLUMN_DIRECTIONS
+            if column % 2 == 0
+            else ODD_COLUMN_DIRECTIONS
+        )
+        neighbor_ids = []
+        for dr, dq in directions:
+            r = row + dr
+            q = column + dq
+            if 0 <= r < self.rows and 0 <= q < self.columns:
+                neighbor_ids.append(r * self.columns + q)
+        return tuple(neighbor_ids)
@@ -1,6 +1,10 @@
 import heapq
+from collections.abc import Callable
+from fractions import Fraction
+from functools import partial
 from itertools import count
-from typing import TYPE_CHECKING, List, Set
+from math import isfinite
+from typing import TYPE_CHECKING, List, Sequence, Set
 
 from battle_hexes_core.game.hex import Hex
 from battle_hexes_core.unit.unit import Unit
@@ -9,152 +13,441 @@ if TYPE_CHECKING:
     from battle_hexes_core.game.board import Board
 
 
+NO_PREDECESSOR = -1
+
+
+class PathTree:
+    """Result of one movement search from ``start``.
+
+    Holds the cheapest known cost to every reachable hex together with the
+    predecessor of each hex on its cheapest path, so paths to any number of
+    destinations can be rebuilt without searching again. Hexes are tracked
+    by their board hex ID; ``reached_ids`` lists them in the order the
+    search first reached them.
+    """
+
+    def __init__(
+            self,
+            start: Hex,
+            move_points: float,
+            hexes: Sequence[Hex],
+            columns: int,
+            cost_by_id: list[float],
+            predecessor_by_id: list[int],
+            reached_ids: list[int],
+    ):
+        self.start = start
+        self.move_points = move_points
+        self.hexes = hexes
+        self.columns = columns
+        self.cost_by_id = cost_by_id
+        self.predecessor_by_id = predecessor_by_id
+        self.reached_ids = reached_ids
+        self._length_by_id: dict[int, int] = {}
+
+    def _hex_id(self, hex: Hex) -> int | None:
+        row = hex.row
+        column = hex.column
+        if 0 <= row and 0 <= column < self.columns:
+            hex_id = row * self.columns + column
+            if hex_id < len(self.hexes):
+                return hex_id
+        return None
+
+    def reachable_hexes(self) -> Set[Hex]:
+        """Return every hex the unit can reach, including ``start``."""
+        hexes = self.hexes
+        return {hexes[hex_id] for hex_id in self.reached_ids}
+
+    def is_reachable(self, hex: Hex) -> bool:
+        return self.cost_to(hex) is not None
+
+    def cost_to(self, hex: Hex) -> float | None:
+        """Return the movement cost to reach ``hex`` or ``None``."""
+        hex_id = self._hex_id(hex)
+        if hex_id is None:
+            return None
+        return self.cost_to_id(hex_id)
+
+    def cost_to_id(self, hex_id: int) -> float | None:
+        cost = self.cost_by_id[hex_id]
+        if cost == float("inf"):
+            return None
+        return cost
+
+    def path_length_to(self, end: Hex) -> int:
+        """Return the number of hexes on the path to ``end`` or ``0``."""
+        hex_id = self._hex_id(end)
+        if hex_id is None or self.cost_to_id(hex_id) is None:
+            return 0
+
+        length_by_id = self._length_by_id
+        predecessor_by_id = self.predecessor_by_id
+        pending: list[int] = []
+        while hex_id != NO_PREDECESSOR and hex_id not in length_by_id:
+            pending.append(hex_id)
+            hex_id = predecessor_by_id[hex_id]
+
+        length = 0 if hex_id == NO_PREDECESSOR else length_by_id[hex_id]
+        for pending_id in reversed(pending):
+            length += 1
+            length_by_id[pending_id] = length
+        return length
+
+    def path_ids_to(self, hex_id: int) -> List[int]:
+        """Return the hex IDs on the cheapest path to ``hex_id``."""
+        if self.cost_to_id(hex_id) is None:
+            return []
+
+        predecessor_by_id = self.predecessor_by_id
+        path_ids: list[int] = []
+        while hex_id != NO_PREDECESSOR:
+            path_ids.append(hex_id)
+            hex_id = predecessor_by_id[hex_id]
+
+        path_ids.reverse()
+        return path_ids
+
+    def path_to(self, end: Hex) -> List[Hex]:
+        """Return the cheapest path from ``start`` to ``end``.
+
+        An empty list is returned when ``end`` is not reachable.
+        """
+        hex_id = self._hex_id(end)
+        if hex_id is None:
+            return []
+        hexes = self.hexes
+        return [hexes[path_id] for path_id in self.path_ids_to(hex_id)]
+
+
 class MovementCalculator:
-    def __init__(self, board: "Board"):
+    """Movement costs and reachability searches over a board.
+
+    Two interchangeable search engines are available. ``"heap"`` is a
+    binary-heap Dijkstra search. ``"dial"`` uses a bucket queue over the
+    board's fixed-point edge costs; it falls back to the heap search when
+    the costs need too fine a grid or the allowance needs more than
+    ``MAX_BUCKETS`` buckets. Both return identical trees. The engine
+    defaults to the board's ``movement_engine``.
+    """
+
+    HEAP_ENGINE = "heap"
+    DIAL_ENGINE = "dial"
+    ENGINES = (HEAP_ENGINE, DIAL_ENGINE)
+    MAX_BUCKETS = 4096
+
+    def __init__(self, board: "Board", engine: str | None = None):
         self.board = board
+        if engine is None:
+            # Board.set_movement_engine validates the board's choice.
+            engine = board.movement_engine
+        elif engine not in self.ENGINES:
+            raise ValueError(f"Unknown movement engine: {engine}")
+        self.engine = engine
+
+    def move_cost(self, unit: Unit, from_hex: Hex, to_hex: Hex) -> float:
+        """Return movement cost for entering ``to_hex`` from ``from_hex``.
 
-    def move_cost(self, unit: Unit, from_hex: Hex, to_hex: Hex) -> int:
-        """Return movement cost for entering ``to_hex`` from ``from_hex``."""
-        del unit, from_hex
+        Moves between neighboring board hexes are priced from the board's
+        edge cost layer, so a road joining the two hexes is used when it
+        is cheaper than the terrain.
+        """
+        del unit
+        board = self.board
+        from_id = board.hex_id(from_hex.row, from_hex.column)
+        to_id = board.hex_id(to_hex.row, to_hex.column)
+        if from_id is not None and to_id is not None:
+            neighbor_ids = board.geometry.neighbor_ids[from_id]
+            if to_id in neighbor_ids:
+                return board.layers.edge_move_cost[from_id][
+                    neighbor_ids.index(to_id)
+                ]
         if to_hex.terrain is None:
             return 1
         return to_hex.terrain.move_cost
 
-    def get_reachable_hexes(
+    def get_path_tree(
             self, unit: Unit, start: Hex, move_points: int = None
-    ) -> Set[Hex]:
-        """Get all hexes reachable by the unit from the start hex."""
+    ) -> PathTree:
+        """Search every hex reachable by the unit from the start hex."""
         if move_points is None:
             move_points = unit.get_move()
 
-        min_cost_by_coord: dict[tuple[int, int], float] = {
-            (start.row, start.column): 0,
-        }
-        reachable_hexes = {start}
+        board = self.board
+        return self._search(
+            unit,
+            start,
+            move_points,
+            partial(board.enemy_adjacent_id, unit),
+            partial(board.can_unit_enter_hex_id, unit),
+        )
+
+    def get_path_trees(
+            self,
+            units: Sequence[Unit],
+            move_points: Sequence[float] | None = None,
+    ) -> List[PathTree | None]:
+        """Search from the hex of every unit in ``units`` in one batch.
+
+        Returns one tree per unit, in order, matching what
+        :meth:`get_path_tree` returns from the unit's hex; ``None`` for a
+        unit that is off the board. ``move_points`` optionally gives each
+        unit's allowance, otherwise its full movement is used.
+
+        Zones of control and enterable hexes depend only on a unit's
+        player, so they are computed once per player as board-wide masks
+        and shared by every search. Units of one player that start on the
+        same hex with the same allowance share a single tree.
+        """
+        board = self.board
+        geometry = board.geometry
+        layers = board.layers
+        hexes = board.hexes
+        # (player, (zone of control mask, enterable mask)) pairs.
+        masks_by_player: list[tuple[object, tuple[list, list]]] = []
+        trees: dict[tuple, PathTree] = {}
+        results: List[PathTree | None] = []
+        for index, unit in enumerate(units):
+            coords = unit.get_coords()
+            start_id = None if coords is None else geometry.hex_id(*coords)
+            if start_id is None:
+                results.append(None)
+                continue
+
+            player = unit.player
+            for player_index, (owner, masks) in enumerate(masks_by_player):
+                if owner is player or owner == player:
+                    break
+            else:
+                player_index = len(masks_by_player)
+                masks = (
+                    layers.zone_of_control_mask(player),
+                    layers.enterable_mask(player),
+                )
+                masks_by_player.append((player, masks))
+
+            allowance = (
+                unit.get_move() if move_points is None
+                else move_points[index]
+            )
+            key = (player_index, start_id, allowance)
+            tree = trees.get(key)
+            if tree is None:
+                zone_of_control, enterable = masks
+                # A unit's own hex counts it in the stack, but the search
+                # never re-enters its start hex, so the shared mask is
+                # exact for every unit of the player.
+                tree = self._search(
+                    unit,
+                    hexes[start_id],
+                    allowance,
+                    zone_of_control.__getitem__,
+                    enterable.__getitem__,
+                )
+                trees[key] = tree
+            results.append(tree)
+        return results
+
+    def _search(
+            self,
+            unit: Unit,
+            start: Hex,
+            move_points: float,
+            stops_at: Callable[[int], bool],
+            can_enter: Callable[[int], bool],
+    ) -> PathTree:
+        """Run the configured engine from ``start``.
+
+        ``stops_at(hex_id)`` is true where movement must end because an
+        enemy is adjacent, and ``can_enter(hex_id)`` where the unit may
+        legally enter.
+        """
+        board = self.board
+        hexes = board.hexes
+        start_id = board.geometry.hex_id(start.row, start.column)
+        tree = PathTree(
+            start,
+            move_points,
+            hexes,
+            board.columns,
+            [float("inf")] * len(hexes),
+            [NO_PREDECESSOR] * len(hexes),
+            [],
+        )
+        if start_id is None:
+            return tree
+
+        tree.cost_by_id[start_id] = 0
+        tree.reached_ids.append(start_id)
+        # Step costs come straight from the board's edge cost table, indexed
+        # like neighbor_ids, unless a subclass prices moves differently.
+        edge_costs = None
+        if type(self).move_cost is MovementCalculator.move_cost:
+            edge_costs = board.layers.edge_move_cost
+            if self.engine == self.DIAL_ENGINE and self._search_buckets(
+                tree, start_id, edge_costs, stops_at, can_enter
+            ):
+                return tree
+
+        self._search_heap(
+            unit, tree, start_id, edge_costs, stops_at, can_enter
+        )
+        return tree
+
+    def _search_heap(
+            self,
+            unit: Unit,
+            tree: PathTree,
+            start_id: int,
+            edge_costs: list[tuple[float, ...]] | None,
+            stops_at: Callable[[int], bool],
+            can_enter: Callable[[int], bool],
+    ) -> None:
+        board = self.board
+        hexes = board.hexes
+        neighbor_ids = board.geometry.neighbor_ids
+        move_cost = self.move_cost
+        move_points = tree.move_points
+        cost_by_id = tree.cost_by_id
+        predecessor_by_id = tree.predecessor_by_id
+        reached_ids = tree.reached_ids
+
         queue_counter = count()
-        queue: list[tuple[float, int, Hex]] = [(0, next(queue_counter), start)]
+        queue: list[tuple[float, int, int]] = [
+            (0, next(queue_counter), start_id),
+        ]
 
         while queue:
-            current_cost, _, current_hex = heapq.heappop(queue)
-            current_coord = (current_hex.row, current_hex.column)
-            if current_cost > min_cost_by_coord[current_coord]:
+            current_cost, _, current_id = heapq.heappop(queue)
+            if current_cost > cost_by_id[current_id]:
                 continue
 
             if current_cost >= move_points:
                 continue
 
-            if self.board.enemy_adjacent(unit, current_hex):
+            if stops_at(current_id):
                 # Movement must stop when entering a hex adjacent to an enemy
                 # unit, so do not expand further from this hex.
                 continue
 
-            for neighbor in self.board.get_neighboring_hexes(current_hex):
-                if not self.board.can_unit_enter_hex(
-                    unit,
-                    neighbor.row,
-                    neighbor.column,
-                ):
+            current_hex = hexes[current_id]
+            step_costs = (
+                edge_costs[current_id] if edge_costs is not None else None
+            )
+            for index, neighbor_id in enumerate(neighbor_ids[current_id]):
+                if not can_enter(neighbor_id):
                     continue
 
-                step_cost = self.move_cost(unit, current_hex, neighbor)
+                if step_costs is not None:
+                    step_cost = step_costs[index]
+                else:
+                    step_cost = move_cost(
+                        unit, current_hex, hexes[neighbor_id]
+                    )
                 new_cost = current_cost + step_cost
                 if new_cost > move_points:
                     continue
 
-                coord = (neighbor.row, neighbor.column)
-                prior_cost = min_cost_by_coord.get(coord, float("inf"))
+                prior_cost = cost_by_id[neighbor_id]
                 if new_cost < prior_cost:
-                    min_cost_by_coord[coord] = new_cost
-                    reachable_hexes.add(neighbor)
+                    if prior_cost == float("inf"):
+                        reached_ids.append(neighbor_id)
+                    cost_by_id[neighbor_id] = new_cost
+                    predecessor_by_id[neighbor_id] = current_id
                     heapq.heappush(
                         queue,
-                        (new_cost, next(queue_counter), neighbor),
+                        (new_cost, next(queue_counter), neighbor_id),
                     )
 
-        return reachable_hexes
-
-    def shortest_path(
-            self, unit: Unit, start: Hex, end: Hex
-    ) -> List[Hex]:
-        """Find the shortest path from start to end hex for the unit."""
-        move_points = unit.get_move()
-        reachable_hexes = self.get_reachable_hexes(unit, start, move_points)
-
-        if end not in reachable_hexes:
-            return []
-
-        min_cost_by_coord: dict[tuple[int, int], float] = {
-            (start.row, start.column): 0,
-        }
-        predecessor_by_coord: dict[tuple[int, int], tuple[int, int] | None] = {
-            (start.row, start.column): None,
-        }
-        hex_by_coord: dict[tuple[int, int], Hex] = {
-            (start.row, start.column): start,
-        }
-        queue_counter = count()
-        queue: list[tuple[float, int, Hex]] = [(0, next(queue_counter), start)]
-
-        while queue:
-            current_cost, _, current_hex = heapq.heappop(queue)
-            current_coord = (current_hex.row, current_hex.column)
-            if current_cost > min_cost_by_coord[current_coord]:
-                continue
+    def _search_buckets(
+            self,
+            tree: PathTree,
+            start_id: int,
+            edge_costs: list[tuple[float, ...]],
+            stops_at: Callable[[int], bool],
+            can_enter: Callable[[int], bool],
+    ) -> bool:
+        """Run the search with a bucket queue (Dial's algorithm).
 
-            if current_hex == end:
-                return self._build_path(
-                    end,
-                    predecessor_by_coord,
-                    hex_by_coord,
-                )
+        Costs are tracked on the board's fixed-point grid, with one FIFO
+        bucket per integer cost up to the movement allowance. Hexes are
+        expanded in the same order as the heap search (by cost, then by
+        when they were queued), so both produce the same tree. Returns
+        ``False`` without searching when the costs or allowance do not fit
+        the grid.
+        """
+        board = self.board
+        fixed_point = board.layers.fixed_point_edge_move_cost
+        if fixed_point is None:
+            return False
+        scale, scaled_edge_costs = fixed_point
+        move_points = tree.move_points
+        if not isfinite(move_points):
+            return False
+        scaled_limit = Fraction(move_points) * scale
+        if (
+            scaled_limit.denominator != 1
+            or scaled_limit > self.MAX_BUCKETS
+        ):
+            return False
+        limit = int(scaled_limit)
 
-            if self.board.enemy_adjacent(unit, current_hex):
-                # Cannot continue moving once adjacent to an enemy unit
-                continue
+        neighbor_ids = board.geometry.neighbor_ids
+        cost_by_id = tree.cost_by_id
+        predecessor_by_id = tree.predecessor_by_id
+        reached_ids = tree.reached_ids
+        unreached = limit + 1
+        scaled_cost_by_id = [unreached] * len(cost_by_id)
+        scaled_cost_by_id[start_id] = 0
 
-            for neighbor in self.board.get_neighboring_hexes(current_hex):
-                if neighbor not in reachable_hexes:
+        buckets: list[list[int]] = [[] for _ in range(limit + 1)]
+        buckets[0].append(start_id)
+        for bucket_cost, bucket in enumerate(buckets):
+            # Zero-cost steps append to the bucket being drained.
+            index = 0
+            while index < len(bucket):
+                current_id = bucket[index]
+                index += 1
+                if bucket_cost > scaled_cost_by_id[current_id]:
                     continue
 
-                if not self.board.can_unit_enter_hex(
-                    unit,
-                    neighbor.row,
-                    neighbor.column,
-                ):
+                if bucket_cost >= limit:
                     continue
 
-                step_cost = self.move_cost(unit, current_hex, neighbor)
-                new_cost = current_cost + step_cost
-                if new_cost > move_points:
+                if stops_at(current_id):
                     continue
 
-                coord = (neighbor.row, neighbor.column)
-                prior_cost = min_cost_by_coord.get(coord, float("inf"))
-                if new_cost < prior_cost:
-                    min_cost_by_coord[coord] = new_cost
-                    predecessor_by_coord[coord] = current_coord
-                    hex_by_coord[coord] = neighbor
-                    heapq.heappush(
-                        queue,
-                        (new_cost, next(queue_counter), neighbor),
-                    )
+                current_cost = cost_by_id[current_id]
+                step_costs = edge_costs[current_id]
+                scaled_step_costs = scaled_edge_costs[current_id]
+                for step, neighbor_id in enumerate(neighbor_ids[current_id]):
+                    if not can_enter(neighbor_id):
+                        continue
 
-        return []
+                    new_scaled_cost = bucket_cost + scaled_step_costs[step]
+                    if new_scaled_cost > limit:
+                        continue
 
-    def _build_path(
-            self,
-            end: Hex,
-            predecessor_by_coord: dict[
-                tuple[int, int],
-                tuple[int, int] | None,
-            ],
-            hex_by_coord: dict[tuple[int, int], Hex],
+                    prior_scaled_cost = scaled_cost_by_id[neighbor_id]
+                    if new_scaled_cost < prior_scaled_cost:
+                        if prior_scaled_cost == unreached:
+                            reached_ids.append(neighbor_id)
+                        scaled_cost_by_id[neighbor_id] = new_scaled_cost
+                        cost_by_id[neighbor_id] = (
+                            current_cost + step_costs[step]
+                        )
+                        predecessor_by_id[neighbor_id] = current_id
+                        buckets[new_scaled_cost].append(neighbor_id)
+        return True
+
+    def get_reachable_hexes(
+            self, unit: Unit, start: Hex, move_points: int = None
+    ) -> Set[Hex]:
+        """Get all hexes reachable by the unit from the start hex."""
+        return self.get_path_tree(unit, start, move_points).reachable_hexes()
+
+    def shortest_path(
+            self, unit: Unit, start: Hex, end: Hex
     ) -> List[Hex]:
-        coord = (end.row, end.column)
-        path: list[Hex] = []
-        while coord is not None:
-            path.append(hex_by_coord[coord])
-            coord = predecessor_by_coord[coord]
-
-        path.reverse()
-        return path
+        """Find the shortest path from start to end hex for the unit."""
+        return self.get_path_tree(unit, start).path_to(end)
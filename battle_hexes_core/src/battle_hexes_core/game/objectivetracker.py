@@ -0,0 +1,160 @@
+from battle_hexes_core.game.events import (
+    UnitEvent,
+    UnitMoved,
+    UnitPlaced,
+    UnitRemoved,
+)
+from battle_hexes_core.game.objective import Objective
+
+
+class ObjectiveTracker:
+    """Objective control kept up to date as units move.
+
+    For every objective the tracker records which players have a unit on
+    it, and which of those have a unit there that is not engaged (see
+    :meth:`is_engaged`). Per-player totals are adjusted as those
+    records change, so score reads are constant time. A board unit event
+    only refreshes the objectives on or next to the hexes the unit left or
+    entered. Adding or removing objectives rebuilds the index on next use.
+    """
+
+    def __init__(self, board):
+        self.board = board
+        self._terrain_version: int | None = None
+        self._objectives: list[Objective] = []
+        self._hex_ids: list[int | None] = []
+        self._indexes_by_hex_id: dict[int, list[int]] = {}
+        self._holders: list[list] = []
+        self._free_holders: list[list] = []
+        # (player, [objectives held, hold points]) pairs.
+        self._totals: list[tuple[object, list[int]]] = []
+        for event_type in (UnitPlaced, UnitMoved, UnitRemoved):
+            board.events.subscribe(event_type, self._unit_changed)
+
+    @property
+    def objective_count(self) -> int:
+        """Number of objectives on the board."""
+        self._sync()
+        return len(self._objectives)
+
+    def held_count(self, player) -> int:
+        """Return how many objectives have a unit of ``player`` on them."""
+        self._sync()
+        return self._player_totals(player)[0]
+
+    def hold_points(self, player) -> int:
+        """Return the points for ``"hold"`` objectives ``player`` holds
+        with at least one unit that is not engaged."""
+        self._sync()
+        return self._player_totals(player)[1]
+
+    def held_hold_objectives(self, player) -> list[Objective]:
+        """Return the objectives counted by :meth:`hold_points`."""
+        self._sync()
+        return [
+            objective
+            for objective, free_holders in zip(
+                self._objectives, self._free_holders
+            )
+            if objective.type == "hold"
+            and _contains(free_holders, player)
+        ]
+
+    def is_engaged(self, unit) -> bool:
+        """Return whether an enemy shares or neighbors ``unit``'s hex.
+
+        Enemies are units of another player (:meth:`Unit.is_friendly`),
+        the test :meth:`Combat.find_combat` uses to pick engaged units.
+        This assumes a two-player game: there every engaged unit fights
+        in the current player's battles, while with more players a unit
+        facing only a third player counts as engaged without fighting.
+        """
+        board = self.board
+        hex_id = board.unit_hex_id(unit)
+        if hex_id is None:
+            return False
+        if board.enemy_adjacent_id(unit, hex_id):
+            return True
+        return any(
+            not other.is_friendly(unit)
+            for other in board.get_units_at_id(hex_id)
+        )
+
+    def _sync(self) -> None:
+        terrain_version = self.board.layers.terrain_version
+        if terrain_version == self._terrain_version:
+            return
+        self._terrain_version = terrain_version
+        self._objectives = self.board.get_objectives()
+        hex_id_of = self.board.geometry.hex_id
+        self._hex_ids = [
+            hex_id_of(*objective.coords) for objective in self._objectives
+        ]
+        self._indexes_by_hex_id = {}
+        for index, hex_id in enumerate(self._hex_ids):
+            if hex_id is not None:
+                self._indexes_by_hex_id.setdefault(hex_id, []).append(index)
+        self._holders = [[] for _ in self._objectives]
+        self._free_holders = [[] for _ in self._objectives]
+        self._totals = []
+        for index in range(len(self._objectives)):
+            self._refresh(index)
+
+    def _unit_changed(self, event: UnitEvent) -> None:
+        if self._terrain_version != self.board.layers.terrain_version:
+            # The index is rebuilt from the board on the next read.
+            return
+        if not self._indexes_by_hex_id:
+            return
+        geometry = self.board.geometry
+        stale_ids = set()
+        for coords in (event.previous_coords, event.coords):
+            if coords is None:
+                continue
+            hex_id = geometry.hex_id(*coords)
+            if hex_id is not None:
+                stale_ids.add(hex_id)
+                stale_ids.update(geometry.neighbor_ids[hex_id])
+        for hex_id in stale_ids:
+            for index in self._indexes_by_hex_id.get(hex_id, ()):
+                self._refresh(index)
+
+    def _refresh(self, index: int) -> None:
+        hex_id = self._hex_ids[index]
+        holders = []
+        free_holders = []
+        if hex_id is not None:
+            for unit in self.board.get_units_at_id(hex_id):
+                player = unit.player
+                if not _contains(holders, player):
+                    holders.append(player)
+                if (
+                    not _contains(free_holders, player)
+                    and not self.is_engaged(unit)
+                ):
+                    free_holders.append(player)
+
+        objective = self._objectives[index]
+        points = objective.points if objective.type == "hold" else 0
+        for player in self._holders[index]:
+            self._player_totals(player)[0] -= 1
+        for player in self._free_holders[index]:
+            self._player_totals(player)[1] -= points
+        for player in holders:
+            self._player_totals(player)[0] += 1
+        for player in free_holders:
+            self._player_totals(player)[1] += points
+        self._holders[index] = holders
+        self._free_holders[index] = free_holders
+
+    def _player_totals(self, player) -> list[int]:
+        for owner, totals in self._totals:
+            if owner is player or owner == player:
+                return totals
+        totals = [0, 0]
+        self._totals.append((player, totals))
+        return totals
+
+
+def _contains(players: list, player) -> bool:
+    return any(owner is player or owner == player for owner in players)
@@ -37,6 +37,11 @@ class Player:
         """Return a list of movement plans for the player's units."""
         raise NotImplementedError("Subclasses must implement movement")
 
+    def use_random(self, rng) -> None:
+        """Called by the game with the random stream this player should
+        draw from."""
+        pass
+
     def movement_cb(self) -> None:
         """
         Called after the player's unit plan has been applied to the board.
@@ -1,4 +1,4 @@
-from random import choice
+import random
 from typing import List, Set
 from battle_hexes_core.combat.combatresults import CombatResults
 from battle_hexes_core.game.board import Board
@@ -13,25 +13,17 @@ class RandomPlayer(Player):
     def __init__(self, name: str, type, factions, board: Board):
         super().__init__(name=name, type=type, factions=factions)
         self._board = board
+        self._random = random
 
     def movement(self) -> List[UnitMovementPlan]:
         plans = []
-        for unit in self._board.get_units_for_player(self):
-            starting_hex = self._board.get_hex(unit.row, unit.column)
-            reachable_hexes = self._board.get_reachable_hexes(
-                unit,
-                starting_hex
-            )
-            selected_hex = self.random_hex(reachable_hexes)
-            # print(
-            #     f"Unit {unit.name} is moving from {starting_hex} to "
-            #     f"{selected_hex}"
-            # )
-            path = self._board.shortest_path(
-                unit,
-                starting_hex,
-                selected_hex
-            )
+        units = self._board.get_units_for_player(self)
+        path_trees = self._board.get_path_trees(units)
+        for unit, path_tree in zip(units, path_trees):
+            if path_tree is None:
+                continue
+            selected_hex = self.random_hex(path_tree.reachable_hexes())
+            path = path_tree.path_to(selected_hex)
             if path:
                 plans.append(UnitMovementPlan(unit, path))
         return plans
@@ -40,7 +32,10 @@ class RandomPlayer(Player):
         """Select a random hex from the given set of hexes."""
         if not hexes:
             return None
-        return choice(list(hexes))
+        return self._random.choice(list(hexes))
+
+    def use_random(self, rng) -> None:
+        self._random = rng
 
     def combat_results(self, combat_results: CombatResults) -> None:
         # RandomPlayer does not handle combat results.
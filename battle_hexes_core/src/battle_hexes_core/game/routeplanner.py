@@ -0,0 +1,307 @@
+"""Multi-turn route planning across the whole board.
+
+``Board.shortest_path`` only searches within one turn's movement
+allowance. :class:`RoutePlanner` runs an A* search over the same movement
+rules without that limit, then splits the route into the legs a unit can
+cover turn by turn.
+"""
+
+import heapq
+from dataclasses import dataclass
+from itertools import count
+from typing import TYPE_CHECKING
+
+from battle_hexes_core.game.events import UnitMoved, UnitPlaced, UnitRemoved
+from battle_hexes_core.game.hex import Hex
+from battle_hexes_core.unit.unit import Unit
+
+if TYPE_CHECKING:
+    from battle_hexes_core.game.board import Board
+
+
+@dataclass(frozen=True)
+class Route:
+    """A planned route and its split into per-turn legs.
+
+    ``path`` starts on the unit's hex. Each leg starts where the previous
+    one ended and can be covered with one turn's full movement allowance,
+    so ``legs[0]`` can be used directly as a ``UnitMovementPlan`` path.
+    """
+
+    path: tuple[Hex, ...]
+    legs: tuple[tuple[Hex, ...], ...]
+    cost: float
+
+    @property
+    def turns(self) -> int:
+        """Number of turns needed to follow the route."""
+        return len(self.legs)
+
+
+@dataclass(frozen=True)
+class _PlannedRoute:
+    hex_ids: tuple[int, ...]
+    step_costs: tuple[float, ...]
+    watched_ids: frozenset[int]
+
+
+class RoutePlanner:
+    """Plan routes with A* and keep them until the board changes near them.
+
+    Step costs come from the board's edge cost table, so roads are used.
+    Hexes a unit may not enter are avoided, and so are hexes next to an
+    enemy, since movement ends there; such a hex can only be the end of a
+    route. The heuristic is the hex distance to the goal times the
+    cheapest step cost on the board, which never overestimates.
+
+    Routes are cached per unit and goal. A cached route is dropped when a
+    unit other than the planned one is placed, moves or is removed on or
+    next to the route, or when terrain or roads change. While the planned
+    unit stays on its route, later requests reuse the remaining part.
+    """
+
+    def __init__(self, board: "Board"):
+        self.board = board
+        self._routes: dict[tuple, _PlannedRoute] = {}
+        self._keys_by_hex_id: dict[int, set[tuple]] = {}
+        self._terrain_version = board.layers.terrain_version
+        self._min_step_cost = None
+        for event_type in (UnitPlaced, UnitMoved, UnitRemoved):
+            board.events.subscribe(event_type, self._unit_changed)
+
+    def plan_route(self, unit: Unit, destination: Hex) -> Route | None:
+        """Return the cheapest route from ``unit``'s hex to ``destination``.
+
+        ``None`` when the unit is off the board or cannot get there.
+        """
+        board = self.board
+        destination_id = board.hex_id(destination.row, destination.column)
+        if destination_id is None:
+            return None
+        return self._route(
+            unit, ("hex", destination_id), (destination_id,), ()
+        )
+
+    def plan_route_to_unit(self, unit: Unit, target: Unit) -> Route | None:
+        """Return the cheapest route that ends next to ``target``.
+
+        ``None`` when either unit is off the board or no hex next to
+        ``target`` can be reached.
+        """
+        target_id = self.board.unit_hex_id(target)
+        if target_id is None:
+            return None
+        goal_ids = self.board.geometry.neighbor_ids[target_id]
+        return self._route(
+            unit, ("unit", target.get_id()), goal_ids, (target_id,)
+        )
+
+    def invalidate(self) -> None:
+        """Forget every cached route."""
+        self._routes.clear()
+        self._keys_by_hex_id.clear()
+
+    def _route(
+        self,
+        unit: Unit,
+        goal_key: tuple,
+        goal_ids: tuple[int, ...],
+        extra_watched_ids: tuple[int, ...],
+    ) -> Route | None:
+        self._check_terrain()
+        start_id = self.board.unit_hex_id(unit)
+        if start_id is None:
+            return None
+
+        key = (unit.get_id(), goal_key)
+        planned = self._routes.get(key)
+        if planned is not None and start_id in planned.hex_ids:
+            index = planned.hex_ids.index(start_id)
+            return self._to_route(
+                unit,
+                planned.hex_ids[index:],
+                planned.step_costs[index:],
+            )
+
+        self._forget(key)
+        found = self._search(unit, start_id, frozenset(goal_ids))
+        if found is None:
+            return None
+        hex_ids, step_costs = found
+        neighbor_ids = self.board.geometry.neighbor_ids
+        watched_ids = set(extra_watched_ids)
+        for hex_id in hex_ids:
+            watched_ids.add(hex_id)
+            watched_ids.update(neighbor_ids[hex_id])
+        planned = _PlannedRoute(hex_ids, step_costs, frozenset(watched_ids))
+        self._routes[key] = planned
+        for hex_id in planned.watched_ids:
+            self._keys_by_hex_id.setdefault(hex_id, set()).add(key)
+        return self._to_route(unit, hex_ids, step_costs)
+
+    def _search(
+        self,
+        unit: Unit,
+        start_id: int,
+        goal_ids: frozenset[int],
+    ) -> tuple[tuple[int, ...], tuple[float, ...]] | None:
+        if start_id in goal_ids:
+            return (start_id,), ()
+        allowance = unit.get_move()
+        if allowance <= 0:
+            return None
+
+        board = self.board
+        geometry = board.geometry
+        neighbor_ids = geometry.neighbor_ids
+        edge_costs = board.layers.edge_move_cost
+        enemy_adjacent_id = board.enemy_adjacent_id
+        can_unit_enter_hex_id = board.can_unit_enter_hex_id
+        min_step_cost = self._cheapest_step_cost()
+        goals = tuple(goal_ids)
+
+        def estimate(hex_id: int) -> float:
+            if not min_step_cost:
+                return 0
+            return min_step_cost * min(
+                geometry.distance(hex_id, goal_id) for goal_id in goals
+            )
+
+        cost_by_id: dict[int, float] = {start_id: 0}
+        predecessor_by_id: dict[int, int] = {}
+        step_cost_by_id: dict[int, float] = {}
+        closed: set[int] = set()
+        queue_counter = count()
+        queue = [(estimate(start_id), next(queue_counter), start_id)]
+        while queue:
+            _, _, current_id = heapq.heappop(queue)
+            if current_id in closed:
+                continue
+            if current_id in goal_ids:
+                return self._unwind(
+                    current_id, predecessor_by_id, step_cost_by_id
+                )
+            closed.add(current_id)
+
+            if enemy_adjacent_id(unit, current_id):
+                # Movement stops next to an enemy and a unit starting its
+                # turn there cannot move, so routes never pass through.
+                continue
+
+            current_cost = cost_by_id[current_id]
+            step_costs = edge_costs[current_id]
+            for index, neighbor_id in enumerate(neighbor_ids[current_id]):
+                if neighbor_id in closed:
+                    continue
+                step_cost = step_costs[index]
+                if step_cost > allowance:
+                    continue
+                if not can_unit_enter_hex_id(unit, neighbor_id):
+                    continue
+                new_cost = current_cost + step_cost
+                if new_cost < cost_by_id.get(neighbor_id, float("inf")):
+                    cost_by_id[neighbor_id] = new_cost
+                    predecessor_by_id[neighbor_id] = current_id
+                    step_cost_by_id[neighbor_id] = step_cost
+                    heapq.heappush(
+                        queue,
+                        (
+                            new_cost + estimate(neighbor_id),
+                            next(queue_counter),
+                            neighbor_id,
+                        ),
+                    )
+        return None
+
+    @staticmethod
+    def _unwind(
+        hex_id: int,
+        predecessor_by_id: dict[int, int],
+        step_cost_by_id: dict[int, float],
+    ) -> tuple[tuple[int, ...], tuple[float, ...]]:
+        hex_ids = [hex_id]
+        step_costs = []
+        while hex_id in predecessor_by_id:
+            step_costs.append(step_cost_by_id[hex_id])
+            hex_id = predecessor_by_id[hex_id]
+            hex_ids.append(hex_id)
+        hex_ids.reverse()
+        step_costs.reverse()
+        return tuple(hex_ids), tuple(step_costs)
+
+    def _to_route(
+        self,
+        unit: Unit,
+        hex_ids: tuple[int, ...],
+        step_costs: tuple[float, ...],
+    ) -> Route:
+        """Split the route greedily into legs of one turn's allowance."""
+        hexes = self.board.hexes
+        allowance = unit.get_move()
+        legs: list[tuple[Hex, ...]] = []
+        leg = [hexes[hex_ids[0]]]
+        leg_cost = 0
+        for hex_id, step_cost in zip(hex_ids[1:], step_costs):
+            # Mirrors the movement search: no step may start once the
+            # allowance is used up or take the total past it.
+            if leg_cost >= allowance or leg_cost + step_cost > allowance:
+                legs.append(tuple(leg))
+                leg = [leg[-1]]
+                leg_cost = 0
+            leg.append(hexes[hex_id])
+            leg_cost += step_cost
+        if len(leg) > 1:
+            legs.append(tuple(leg))
+        return Route(
+            path=tuple(hexes[hex_id] for hex_id in hex_ids),
+            legs=tuple(legs),
+            cost=sum(step_costs),
+        )
+
+    def _cheapest_step_cost(self) -> float:
+        if self._min_step_cost is None:
+            self._min_step_cost = min(
+                (
+                    cost
+                    for step_costs in self.board.layers.edge_move_cost
+                    for cost in step_costs
+                ),
+                default=0,
+            )
+        return self._min_step_cost
+
+    def _check_terrain(self) -> None:
+        terrain_version = self.board.layers.terrain_version
+        if terrain_version != self._terrain_version:
+            self._terrain_version = terrain_version
+            self._min_step_cost = None
+            self.invalidate()
+
+    def _forget(self, key: tuple) -> None:
+        planned = self._routes.pop(key, None)
+        if planned is None:
+            return
+        for hex_id in planned.watched_ids:
+            keys = self._keys_by_hex_id.get(hex_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_hex_id[hex_id]
+
+    def _unit_changed(self, event) -> None:
+        if not self._routes:
+            return
+        geometry = self.board.geometry
+        unit_id = event.unit.get_id()
+        stale_keys = set()
+        for coords in (event.previous_coords, event.coords):
+            if coords is None:
+                continue
+            hex_id = geometry.hex_id(*coords)
+            if hex_id is None:
+                continue
+            for key in self._keys_by_hex_id.get(hex_id, ()):
+                if key[0] != unit_id:
+                    stale_keys.add(key)
+        for key in stale_keys:
+            self._forget(key)
@@ -1,6 +1,5 @@
 import logging
 
-from battle_hexes_core.combat.combat import Combat
 from battle_hexes_core.combat.combatresult import CombatResult
 from battle_hexes_core.combat.combatresults import CombatResults
 from battle_hexes_core.game.game import Game
@@ -22,17 +21,15 @@ class ObjectiveScorer:
             return scenario_points
 
         current_player = game.get_current_player()
-        score_tracker = game.get_score_tracker()
-        engaged_unit_ids = self._get_engaged_unit_ids(game, current_player)
-        held_objectives = self._get_held_objectives(
-            game, current_player, engaged_unit_ids
-        )
-        total_points = sum(objective.points for objective in held_objectives)
+        objective_tracker = game.get_objective_tracker()
+        total_points = objective_tracker.hold_points(current_player)
 
         if total_points:
-            score_tracker.add_points(current_player, total_points)
+            game.get_score_tracker().add_points(current_player, total_points)
             self._log_awarded_points(
-                current_player.name, total_points, held_objectives
+                current_player.name,
+                total_points,
+                objective_tracker.held_hold_objectives(current_player),
             )
 
         return total_points
@@ -71,13 +68,9 @@ class ObjectiveScorer:
         if scoring_player is None:
             return None
 
-        objectives = game.get_board().get_objectives()
-        occupied_count = self._count_objectives_occupied_by_player(
-            game,
-            objectives,
-            scoring_player,
-        )
-        opponent_score = len(objectives) - occupied_count
+        objective_tracker = game.get_objective_tracker()
+        occupied_count = objective_tracker.held_count(scoring_player)
+        opponent_score = objective_tracker.objective_count - occupied_count
 
         score_tracker = game.get_score_tracker()
         score_tracker.set_score(scoring_player, occupied_count)
@@ -87,23 +80,6 @@ class ObjectiveScorer:
 
         return occupied_count
 
-    def _count_objectives_occupied_by_player(
-        self,
-        game: Game,
-        objectives: list,
-        player,
-    ) -> int:
-        board = game.get_board()
-        occupied_count = 0
-        for objective in objectives:
-            row, column = objective.coords
-            if any(
-                unit.get_coords() == (row, column)
-                for unit in board.get_units_for_player(player)
-            ):
-                occupied_count += 1
-        return occupied_count
-
     def _get_scoring_player(self, game: Game, scoring_side: str):
         for player in game.get_players():
             for faction in player.factions:
@@ -132,60 +108,18 @@ class ObjectiveScorer:
         self, game: Game, eligible_attacker_ids: set[str]
     ) -> list:
         """Return hold objectives occupied by surviving attackers."""
-        board = game.get_board()
         held_objectives = []
-        for objective in board.get_objectives():
+        for objective, occupants in (
+            game.get_board().get_objective_occupants()
+        ):
             if objective.type != "hold":
                 continue
-            row, column = objective.coords
             if any(
-                unit.get_id() in eligible_attacker_ids
-                and unit.get_coords() == (row, column)
-                for unit in board.get_units()
+                unit.get_id() in eligible_attacker_ids for unit in occupants
             ):
                 held_objectives.append(objective)
         return held_objectives
 
-    def _get_engaged_unit_ids(self, game: Game, current_player) -> set[str]:
-        """Return IDs for the current player's units engaged in combat."""
-        combat = Combat(game)
-        current_player_unit_ids = {
-            unit.get_id()
-            for unit in game.get_board().get_units_for_player(current_player)
-        }
-        return {
-            unit.get_id()
-            for attackers, defenders in combat.find_combat()
-            for unit in attackers + defenders
-            if unit.get_id() in current_player_unit_ids
-        }
-
-    def _get_held_objectives(
-        self, game: Game, current_player, engaged_unit_ids: set[str]
-    ) -> list:
-        """Return hold objectives occupied by eligible current-player units."""
-        board = game.get_board()
-        held_objectives = []
-        for objective in board.get_objectives():
-            if objective.type != "hold":
-                continue
-            if self._objective_is_held(
-                board, objective, current_player, engaged_unit_ids
-            ):
-                held_objectives.append(objective)
-        return held_objectives
-
-    def _objective_is_held(
-        self, board, objective, current_player, engaged_unit_ids: set[str]
-    ) -> bool:
-        """Return True when the objective is held by eligible units."""
-        row, column = objective.coords
-        return any(
-            unit.get_coords() == (row, column)
-            and unit.get_id() not in engaged_unit_ids
-            for unit in board.get_units_for_player(current_player)
-        )
-
     def _log_awarded_points(
         self, player_name: str, total_points: int, held_objectives: list
     ) -> None:
@@ -4,6 +4,7 @@ import logging
 
 from battle_hexes_core.game.gamefactory import GameFactory
 from battle_hexes_core.game.gameplayer import GamePlayer
+from battle_hexes_core.game.gamerandom import GameRandom
 
 
 logger = logging.getLogger(__name__)
@@ -15,16 +16,20 @@ class AgentTrainer:
         gamefactory: GameFactory,
         episodes: int = 100,
         max_turns: int | None = None,
+        rng: GameRandom | None = None,
     ):
         self.gamefactory = gamefactory
         self.episodes = episodes
         self.max_turns = max_turns
+        self.random = rng if rng is not None else GameRandom()
 
     def train(self) -> GameResults:
         # TODO turn counting not supported
         results = GameResults()
         for episode in range(self.episodes):
-            game = self.gamefactory.create_game()
+            game = self.gamefactory.create_game(
+                rng=self.random.spawn(episode)
+            )
             logger.info("")
             logger.info(
                 "Starting game %d/%d", episode + 1, self.episodes
@@ -1,3 +1,12 @@
+from battle_hexes_core.game.events import (
+    DefensiveFireChanged,
+    DefensiveFireSpent,
+)
+from battle_hexes_core.game.hexgeometry import (
+    are_adjacent,
+    to_cube,
+    to_offset,
+)
 from battle_hexes_core.game.player import Player
 from battle_hexes_core.unit.faction import Faction
 
@@ -30,9 +39,12 @@ class Unit:
         self.forced_to_retreat_since_last_friendly_turn = False
         self.defensive_fire_spent_this_off_turn = False
         self.defensive_fire_available = True
+        self._off_turn_defensive_fire = True
         self.defensive_fire_modifier = 1.0
         self.row = row
         self.column = column
+        # Board whose occupancy index tracks this unit, set by Board.add_unit.
+        self._board = None
 
     @property
     def player(self) -> Player:
@@ -68,6 +80,9 @@ class Unit:
             return self.defensive_fire_available
         if current_player.owns(self):
             return False
+        return self._off_turn_defensive_fire_status()
+
+    def _off_turn_defensive_fire_status(self) -> bool:
         return (
             self.ended_last_friendly_turn_with_defensive_fire_eligibility
             and not self.forced_to_retreat_since_last_friendly_turn
@@ -97,9 +112,25 @@ class Unit:
             self,
             current_player: Player | None = None,
     ) -> bool:
+        previous_status = (
+            self.defensive_fire_available,
+            self._off_turn_defensive_fire,
+        )
         self.defensive_fire_available = self.public_defensive_fire_status(
             current_player
         )
+        # Enemies check off-turn eligibility whoever is moving, so a change
+        # there is reported even when the public status stays the same.
+        self._off_turn_defensive_fire = self._off_turn_defensive_fire_status()
+        status = (
+            self.defensive_fire_available,
+            self._off_turn_defensive_fire,
+        )
+        if self._board is not None and status != previous_status:
+            coords = self.get_coords()
+            self._board.events.publish(
+                DefensiveFireChanged(self, coords, coords)
+            )
         return self.defensive_fire_available
 
     def record_friendly_turn_end(
@@ -130,6 +161,8 @@ class Unit:
     ) -> None:
         self.defensive_fire_spent_this_off_turn = True
         self.update_defensive_fire_available(current_player)
+        if self._board is not None:
+            self._board.events.publish(DefensiveFireSpent(self))
 
     def record_forced_retreat(
             self,
@@ -139,8 +172,11 @@ class Unit:
         self.update_defensive_fire_available(current_player)
 
     def set_coords(self, row: int, column: int):
+        previous_coords = self.get_coords()
         self.row = row
         self.column = column
+        if self._board is not None:
+            self._board._reindex_unit(self, previous_coords)
 
     def get_coords(self) -> tuple:
         if self.row is None and self.column is None:
@@ -152,19 +188,11 @@ class Unit:
         return self.player == other_unit.player
 
     def is_adjacent(self, other_unit) -> bool:
-        # Even-Q Offset rules
-        # https://www.redblobgames.com/grids/hexagons/
-        even_q_offsets = [(-1, 0), (-1, 1), (0, 1), (1, 0), (0, -1), (-1, -1)]
-        odd_q_offsets = [(1, 0), (1, 1), (0, 1), (-1, 0), (0, -1), (1, -1)]
-
-        offsets = even_q_offsets if self.column % 2 == 0 else odd_q_offsets
-        return any(
-            (
-                self.row + dr == other_unit.row and
-                self.column + dc == other_unit.column
-            )
-            for dr, dc in offsets
-        )
+        coords = self.get_coords()
+        other_coords = other_unit.get_coords()
+        if coords is None or other_coords is None:
+            return False
+        return are_adjacent(coords, other_coords)
 
     def forced_move(
             self,
@@ -176,29 +204,12 @@ class Unit:
 
         Returns ``True`` when the retreat completes successfully.
 
-        If the path is blocked by an enemy unit or leaves the board, the unit's
-        coordinates are restored and ``False`` is returned.
+        If the path is blocked by an enemy unit or leaves the board, the unit
+        stays where it is and ``False`` is returned.
         """
         if from_hex is None or self.row is None or self.column is None:
             return True
 
-        original_position = (self.row, self.column)
-
-        def to_cube(row: int, col: int) -> tuple[int, int, int]:
-            x_coord = col
-            z_coord = row - (col - (col & 1)) // 2
-            y_coord = -x_coord - z_coord
-            return x_coord, y_coord, z_coord
-
-        def to_offset(
-                x_coord: int,
-                y_coord: int,
-                z_coord: int,
-        ) -> tuple[int, int]:
-            column = x_coord
-            row = z_coord + (column - (column & 1)) // 2
-            return row, column
-
         origin_cube = to_cube(*from_hex)
         current_cube = to_cube(self.row, self.column)
         direction = tuple(
@@ -208,13 +219,13 @@ class Unit:
 
         step_magnitude = max(abs(component) for component in direction)
         if step_magnitude == 0:
-            self.row, self.column = original_position
             return False
 
         direction = tuple(
             component // step_magnitude for component in direction
         )
 
+        next_row, next_col = self.row, self.column
         for _ in range(distance):
             next_cube = tuple(
                 current + delta
@@ -223,16 +234,14 @@ class Unit:
             next_row, next_col = to_offset(*next_cube)
 
             if not board.is_in_bounds(next_row, next_col):
-                self.row, self.column = original_position
                 return False
 
             if not board.can_unit_enter_hex(self, next_row, next_col):
-                self.row, self.column = original_position
                 return False
 
-            self.row, self.column = next_row, next_col
             current_cube = next_cube
 
+        self.set_coords(next_row, next_col)
         return True
 
     def __str__(self):
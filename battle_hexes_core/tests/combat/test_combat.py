@@ -212,6 +212,95 @@ class TestCombat(unittest.TestCase):
         self.assertCountEqual(attackers, [self.red_unit])
         self.assertCountEqual(defenders, [self.blue_unit])
 
+    def _infantry(self, name, faction, player):
+        return Unit(
+            id=str(uuid.uuid4()), name=name, faction=faction,
+            player=player, type='Infantry', attack=1, defense=1, move=1,
+        )
+
+    def test_find_combat_orders_battles_by_board_order(self):
+        far_red = self._infantry('Far Red', self.red_faction, self.red_player)
+        far_blue = self._infantry(
+            'Far Blue', self.blue_faction, self.blue_player
+        )
+        chained_blue = self._infantry(
+            'Chained Blue', self.blue_faction, self.blue_player
+        )
+
+        self.board.add_unit(far_red, 0, 0)
+        self.board.add_unit(chained_blue, 5, 5)
+        self.board.add_unit(self.red_unit, 6, 4)
+        self.board.add_unit(self.blue_unit, 6, 5)
+        self.board.add_unit(far_blue, 1, 0)
+
+        battles = self.combat.find_combat()
+
+        self.assertEqual(
+            [
+                ([far_red], [far_blue]),
+                ([self.red_unit], [chained_blue, self.blue_unit]),
+            ],
+            battles,
+        )
+
+    def test_find_combat_lists_chained_units_in_discovery_order(self):
+        red = [
+            self._infantry(f'Red {n}', self.red_faction, self.red_player)
+            for n in range(3)
+        ]
+        blue = [
+            self._infantry(f'Blue {n}', self.blue_faction, self.blue_player)
+            for n in range(3)
+        ]
+        # A chain down column 0 with a branch at (0, 1), placed out of
+        # chain order so board order and discovery order differ.
+        self.board.add_unit(red[0], 0, 0)
+        self.board.add_unit(red[2], 4, 0)
+        self.board.add_unit(blue[1], 3, 0)
+        self.board.add_unit(red[1], 2, 0)
+        self.board.add_unit(blue[0], 1, 0)
+        self.board.add_unit(blue[2], 0, 1)
+
+        battles = self.combat.find_combat()
+
+        self.assertEqual(
+            [([red[0], red[1], red[2]], [blue[2], blue[0], blue[1]])],
+            battles,
+        )
+
+    def _attackers_with(self, attacks):
+        return [
+            Unit(
+                id=str(uuid.uuid4()), name=f'Red {index}',
+                faction=self.red_faction, player=self.red_player,
+                type='Infantry', attack=attack, defense=1, move=1,
+            )
+            for index, attack in enumerate(attacks)
+        ]
+
+    def test_attackers_to_remove_prefers_fewest_then_lowest_total(self):
+        attackers = self._attackers_with([2, 5, 3, 4, 1])
+
+        removed = self.combat._attackers_to_remove(attackers, 6)
+
+        # Two units are needed; 2 + 4 is the earliest pair totalling 6.
+        self.assertEqual([attackers[0], attackers[3]], removed)
+
+    def test_attackers_to_remove_all_when_defense_not_reached(self):
+        attackers = self._attackers_with([1, 2])
+
+        self.assertEqual(
+            attackers, self.combat._attackers_to_remove(attackers, 10)
+        )
+
+    def test_attackers_to_remove_large_stack(self):
+        attackers = self._attackers_with([3] * 30 + [7, 8])
+
+        removed = self.combat._attackers_to_remove(attackers, 14)
+
+        # 7 + 8 is the only pair reaching 14; any trio would need 3 units.
+        self.assertEqual([attackers[30], attackers[31]], removed)
+
     def test_a_back_2_from_lower_left_moves_attacker(self):
         self.board.add_unit(self.red_unit, 4, 4)
         self.board.add_unit(self.blue_unit, 3, 5)
@@ -0,0 +1,93 @@
+import unittest
+from fractions import Fraction
+
+from battle_hexes_core.combat.combatoutcomes import CombatOutcomeEngine
+from battle_hexes_core.combat.combatresult import CombatResult
+from battle_hexes_core.combat.combatsolver import CombatSolver
+
+
+class TestCombatOutcomeEngine(unittest.TestCase):
+    def setUp(self):
+        self.engine = CombatOutcomeEngine()
+
+    def test_probabilities_match_results_table(self):
+        outcome = self.engine.outcome(12, 5)
+
+        self.assertEqual((2, 1), outcome.final_odds)
+        self.assertEqual(
+            Fraction(1, 3), outcome.probability(CombatResult.EXCHANGE)
+        )
+        self.assertEqual(
+            Fraction(1, 6),
+            outcome.probability(CombatResult.ATTACKER_ELIMINATED),
+        )
+        self.assertEqual(1, sum(outcome.probabilities.values()))
+
+    def test_probabilities_match_every_die_roll(self):
+        solver = CombatSolver()
+        for attack, defense, shift in ((1, 3, 0), (4, 2, -1), (9, 2, 2)):
+            outcome = self.engine.outcome(attack, defense, shift)
+            counts: dict[CombatResult, int] = {}
+            for roll in range(1, 7):
+                solver.set_static_die_roll(roll)
+                result = solver.solve_combat(
+                    attack, defense, shift
+                ).get_combat_result()
+                counts[result] = counts.get(result, 0) + 1
+
+            self.assertEqual(
+                {result: Fraction(n, 6) for result, n in counts.items()},
+                outcome.probabilities,
+            )
+
+    def test_automatic_results(self):
+        self.assertEqual(
+            {CombatResult.ATTACKER_ELIMINATED: 1},
+            self.engine.outcome(1, 7).probabilities,
+        )
+        outcome = self.engine.outcome(6, 1, combat_odds_shift=3)
+        self.assertEqual((7, 1), outcome.final_odds)
+        self.assertEqual(1.0, outcome.expected_defender_loss)
+        self.assertEqual(0.0, outcome.expected_attacker_loss)
+
+    def test_expected_losses(self):
+        outcome = self.engine.outcome(3, 3)
+
+        # 1:1 -> AE on 5-6, EX on 2, DE on 1.
+        self.assertAlmostEqual(2 / 6 * 3 + 1 / 6 * 3,
+                               outcome.expected_attacker_loss)
+        self.assertAlmostEqual(2 / 6 * 3, outcome.expected_defender_loss)
+
+    def test_exchange_costs_the_attackers_an_exchange_removes(self):
+        # 10:5 -> 2:1, AE on one roll and EX on two. The cheapest pair
+        # reaching 5 is 3 + 3, so an exchange costs 6 of the 10 factors.
+        outcome = self.engine.outcome((4, 3, 3), 5)
+
+        self.assertEqual([1, 2], CombatSolver.exchange_casualties(
+            (4, 3, 3), 5
+        ))
+        self.assertEqual((2, 1), outcome.final_odds)
+        self.assertAlmostEqual(1 / 6 * 10 + 2 / 6 * 6,
+                               outcome.expected_attacker_loss)
+        self.assertAlmostEqual(
+            1 / 6 * 12 + 2 / 6 * 12,
+            self.engine.outcome(12, 5).expected_attacker_loss,
+        )
+        self.assertEqual(
+            self.engine.outcome([4, 3, 3], 5),
+            self.engine.outcomes([((4, 3, 3), 5)])[0],
+        )
+
+    def test_large_shifts_clamp(self):
+        self.assertEqual(
+            (1, 7), self.engine.outcome(4, 4, -50).final_odds
+        )
+
+    def test_batched_outcomes_match_single_queries(self):
+        attacks = [(2, 4), (7, 3, -1), (2, 4, 0), (10, 1, 1)]
+
+        batched = self.engine.outcomes(attacks)
+
+        self.assertEqual(
+            [self.engine.outcome(*attack) for attack in attacks], batched
+        )
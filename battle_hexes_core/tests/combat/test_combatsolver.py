@@ -1,4 +1,5 @@
 import unittest
+from unittest.mock import patch
 from battle_hexes_core.combat.combatsolver import CombatSolver
 from battle_hexes_core.combat.combatresult import CombatResult
 
@@ -55,3 +56,54 @@ class TestCombatSolver(unittest.TestCase):
     def test_shift_odds_clamps_right_boundary(self):
         shifted = self.combat_solver.shift_odds((6, 1), 99)
         assert shifted == (7, 1)
+
+    def test_solve_combats_matches_solve_combat(self):
+        attacks = [12, 1, 7, 4, 3, 20]
+        defenses = [5, 7, 3, 4, 9, 2]
+        shifts = [0, 0, -1, 2, 0, 1]
+        rolls = [5, 3, 3, 1, 6, 2]
+
+        results = self.combat_solver.solve_combats(
+            attacks, defenses, shifts, rolls
+        )
+
+        expected = []
+        for attack, defense, shift, roll in zip(
+            attacks, defenses, shifts, rolls
+        ):
+            self.combat_solver.set_static_die_roll(roll)
+            expected.append(
+                self.combat_solver.solve_combat(
+                    attack, defense, shift
+                ).get_combat_result()
+            )
+        assert results == expected
+
+    def test_results_follow_changes_to_the_results_table(self):
+        variant = (CombatResult.EXCHANGE,) * 6
+        with patch.dict(CombatSolver.RESULTS_TABLE, {'1:1': variant}):
+            self.combat_solver.set_static_die_roll(1)
+            single = self.combat_solver.solve_combat(3, 3)
+            batched = self.combat_solver.solve_combats([3], [3], [0], [1])
+
+        self.assertEqual(CombatResult.EXCHANGE, single.get_combat_result())
+        self.assertEqual([CombatResult.EXCHANGE], batched)
+        self.assertEqual(
+            [CombatResult.DEFENDER_ELIMINATED],
+            self.combat_solver.solve_combats([3], [3], [0], [1]),
+        )
+
+    def test_solve_combats_rejects_out_of_range_die_rolls(self):
+        for roll in (0, 7):
+            with self.assertRaises(ValueError):
+                self.combat_solver.solve_combats([3], [3], [0], [roll])
+        # Automatic results ignore the roll.
+        self.assertEqual(
+            [CombatResult.ATTACKER_ELIMINATED],
+            self.combat_solver.solve_combats([1], [7], [0], [0]),
+        )
+
+    def test_odds_column_indexes_standard_odds(self):
+        column = self.combat_solver.odds_column(7, 3)
+        assert CombatSolver.STANDARD_ODDS[column] == (2, 1)
+        assert self.combat_solver.shift_column(column, -20) == 0
@@ -115,6 +115,66 @@ class TestDefensiveFireResolver(unittest.TestCase):
         )
         self.assertEqual(mover.get_coords(), (0, 0))
 
+    def test_eligible_defenders_are_adjacent_enemies_with_fire(self):
+        mover = self._add_unit("mover", self.faction1, self.player1, 2, 2)
+        eligible = []
+        for unit_id, row, column in (("c", 1, 2), ("a", 3, 2), ("b", 2, 3)):
+            unit = self._add_unit(
+                unit_id, self.faction2, self.player2, row, column
+            )
+            unit.record_friendly_turn_end(unit.get_move(), self.player1)
+            eligible.append(unit)
+        far = self._add_unit("far", self.faction2, self.player2, 4, 4)
+        far.record_friendly_turn_end(far.get_move(), self.player1)
+        spent = self._add_unit("spent", self.faction2, self.player2, 2, 1)
+        spent.spend_defensive_fire(self.player1)
+        self._add_unit("friend", self.faction1, self.player1, 1, 1)
+
+        defenders = self.resolver._eligible_defenders(mover, self.player1)
+
+        self.assertFalse(spent.has_defensive_fire(self.player1))
+        self.assertEqual(
+            ["a", "b", "c"], [unit.get_id() for unit in defenders]
+        )
+
+    def test_cached_defender_order_follows_unit_moves(self):
+        mover = self._add_unit("mover", self.faction1, self.player1, 2, 2)
+        first = self._add_unit("b", self.faction2, self.player2, 1, 2)
+        first.record_friendly_turn_end(first.get_move(), self.player1)
+        self.assertEqual(
+            [first], self.resolver._eligible_defenders(mover, self.player1)
+        )
+
+        second = self._add_unit("a", self.faction2, self.player2, 4, 4)
+        second.record_friendly_turn_end(second.get_move(), self.player1)
+        second.set_coords(3, 2)
+        self.assertEqual(
+            [second, first],
+            self.resolver._eligible_defenders(mover, self.player1),
+        )
+
+        first.set_coords(0, 0)
+        self.board.remove_units(second)
+        self.assertEqual(
+            [], self.resolver._eligible_defenders(mover, self.player1)
+        )
+
+    def test_can_fire_defensively_needs_an_enemy_with_fire(self):
+        ready = self._add_unit("ready", self.faction2, self.player2, 1, 1)
+        ready.record_friendly_turn_end(ready.get_move(), self.player1)
+        spent = self._add_unit("spent", self.faction2, self.player2, 1, 2)
+        spent.spend_defensive_fire(self.player1)
+
+        self.assertTrue(
+            self.resolver.can_fire_defensively(ready, self.player1)
+        )
+        self.assertFalse(
+            self.resolver.can_fire_defensively(ready, self.player2)
+        )
+        self.assertFalse(
+            self.resolver.can_fire_defensively(spent, self.player1)
+        )
+
     def test_defensive_fire_probability_clamps_unit_and_terrain_modifiers(
         self,
     ):
@@ -0,0 +1,95 @@
+import unittest
+
+from battle_hexes_core.defensivefire.defensive_fire import (
+    DefensiveFireSettings,
+)
+from battle_hexes_core.defensivefire.defensive_fire_resolver import (
+    DefensiveFireResolver,
+)
+from battle_hexes_core.defensivefire.defensive_fire_risk import (
+    DefensiveFireRiskMap,
+)
+from battle_hexes_core.game.board import Board
+from battle_hexes_core.game.player import Player, PlayerType
+from battle_hexes_core.game.terrain import Terrain
+from battle_hexes_core.unit.faction import Faction
+from battle_hexes_core.unit.unit import Unit
+
+
+class TestDefensiveFireRiskMap(unittest.TestCase):
+    def setUp(self):
+        self.board = Board(5, 5)
+        self.faction1 = Faction(id="f1", name="f1", color="#fff")
+        self.faction2 = Faction(id="f2", name="f2", color="#000")
+        self.player1 = Player(
+            name="P1",
+            type=PlayerType.HUMAN,
+            factions=[self.faction1],
+        )
+        self.player2 = Player(
+            name="P2",
+            type=PlayerType.CPU,
+            factions=[self.faction2],
+        )
+        self.resolver = DefensiveFireResolver(
+            self.board,
+            DefensiveFireSettings(
+                base_probability=0.5,
+                minimum=0.0,
+                maximum=1.0,
+            ),
+        )
+        self.risk_map = DefensiveFireRiskMap(self.board, self.resolver)
+
+    def _add_unit(self, unit_id, faction, player, row, column):
+        unit = Unit(unit_id, unit_id, faction, player, "Infantry", 1, 1, 3)
+        self.board.add_unit(unit, row, column)
+        return unit
+
+    def test_combines_adjacent_defenders(self):
+        self._add_unit("a", self.faction2, self.player2, 1, 2)
+        self._add_unit("b", self.faction2, self.player2, 3, 2)
+
+        self.assertAlmostEqual(
+            0.75, self.risk_map.risk_at(self.player1, 2, 2)
+        )
+        self.assertAlmostEqual(
+            0.5, self.risk_map.risk_at(self.player1, 0, 2)
+        )
+        self.assertEqual(0.0, self.risk_map.risk_at(self.player1, 4, 4))
+        self.assertEqual(0.0, self.risk_map.risk_at(self.player2, 2, 2))
+
+    def test_updates_when_defender_spends_fire(self):
+        defender = self._add_unit("a", self.faction2, self.player2, 1, 2)
+        self.assertAlmostEqual(
+            0.5, self.risk_map.risk_at(self.player1, 2, 2)
+        )
+
+        defender.spend_defensive_fire(self.player1)
+
+        self.assertEqual(0.0, self.risk_map.risk_at(self.player1, 2, 2))
+
+    def test_updates_when_defender_moves(self):
+        defender = self._add_unit("a", self.faction2, self.player2, 1, 2)
+        self.assertAlmostEqual(
+            0.5, self.risk_map.risk_at(self.player1, 2, 2)
+        )
+
+        defender.set_coords(4, 4)
+
+        self.assertEqual(0.0, self.risk_map.risk_at(self.player1, 2, 2))
+        self.assertAlmostEqual(
+            0.5, self.risk_map.risk_at(self.player1, 3, 4)
+        )
+
+    def test_uses_target_terrain_modifier(self):
+        self._add_unit("a", self.faction2, self.player2, 1, 2)
+        self.risk_map.risk_at(self.player1, 2, 2)
+
+        self.board.get_hex(2, 2).set_terrain(
+            Terrain("forest", "#0a0", defensive_fire_modifier=0.5)
+        )
+
+        self.assertAlmostEqual(
+            0.25, self.risk_map.risk_at(self.player1, 2, 2)
+        )
@@ -1,6 +1,7 @@
 import unittest
 import uuid
 from battle_hexes_core.game.board import Board
+from battle_hexes_core.game.movement import MovementCalculator
 from battle_hexes_core.game.objective import Objective
 from battle_hexes_core.game.player import Player, PlayerType
 from battle_hexes_core.game.terrain import Terrain
@@ -107,6 +108,39 @@ class TestBoard(unittest.TestCase):
 
         self.assertCountEqual(objectives, [objective_one, objective_two])
 
+    def test_get_objectives_follows_objective_changes(self):
+        objective = Objective(coords=(0, 1), points=1, type="hold")
+        self.assertEqual([], self.board.get_objectives())
+
+        self.board.get_hex(0, 1).objectives.append(objective)
+        self.assertEqual([objective], self.board.get_objectives())
+
+        self.board.get_hex(0, 1).objectives.remove(objective)
+        self.assertEqual([], self.board.get_objectives())
+
+    def test_get_objective_occupants_tracks_units(self):
+        objective_one = Objective(coords=(0, 1), points=1, type="hold")
+        objective_two = Objective(coords=(2, 3), points=3, type="hold")
+        self.board.get_hex(0, 1).objectives.append(objective_one)
+        self.board.get_hex(2, 3).objectives.append(objective_two)
+        self.board.add_unit(self.red_unit, 0, 1)
+
+        self.assertEqual(
+            [(objective_one, [self.red_unit]), (objective_two, [])],
+            self.board.get_objective_occupants(),
+        )
+
+        self.red_unit.set_coords(2, 3)
+        self.board.add_unit(self.blue_unit, 2, 3)
+
+        self.assertEqual(
+            [
+                (objective_one, []),
+                (objective_two, [self.red_unit, self.blue_unit]),
+            ],
+            self.board.get_objective_occupants(),
+        )
+
     def test_get_neighboring_hexes_center_hex_odd(self):
         self.board.add_unit(self.red_unit, 1, 3)
 
@@ -422,6 +456,138 @@ class TestBoard(unittest.TestCase):
         self.assertNotIn((2, 3), actual_coords)
         self.assertIn((3, 2), actual_coords)
 
+    def test_get_path_tree_uses_road_edges(self):
+        self.board.add_unit(self.red_unit, 2, 2)
+        start_hex = self.board.get_hex(2, 2)
+        forest = Terrain("forest", "#558855", move_cost=2)
+        for coords in ((2, 3), (2, 4), (3, 2)):
+            self.board.get_hex(*coords).set_terrain(forest)
+
+        self.board.set_road_types({"secondary": 0.5})
+        self.board.set_road_paths([("secondary", ((2, 2), (2, 3), (2, 4)))])
+        path_tree = self.board.get_path_tree(
+            self.red_unit, start_hex, move_points=1
+        )
+
+        self.assertEqual(0.5, path_tree.cost_to(self.board.get_hex(2, 3)))
+        self.assertEqual(1, path_tree.cost_to(self.board.get_hex(2, 4)))
+        self.assertIsNone(path_tree.cost_to(self.board.get_hex(3, 2)))
+        movement = MovementCalculator(self.board)
+        self.assertEqual(0.5, movement.move_cost(
+            self.red_unit, self.board.get_hex(2, 4), self.board.get_hex(2, 3)
+        ))
+
+        self.board.set_road_paths(None)
+        path_tree = self.board.get_path_tree(
+            self.red_unit, start_hex, move_points=1
+        )
+
+        self.assertIsNone(path_tree.cost_to(self.board.get_hex(2, 3)))
+
+    def test_get_path_trees_matches_single_searches(self):
+        second_red = Unit(
+            id=str(uuid.uuid4()), name="Second Red", faction=self.red_faction,
+            player=self.red_player,
+            type="Infantry", attack=2, defense=2, move=3
+        )
+        stacked_red = Unit(
+            id=str(uuid.uuid4()), name="Stacked Red", faction=self.red_faction,
+            player=self.red_player,
+            type="Infantry", attack=2, defense=2, move=6
+        )
+        off_board = Unit(
+            id=str(uuid.uuid4()), name="Reserve", faction=self.red_faction,
+            player=self.red_player,
+            type="Infantry", attack=2, defense=2, move=6
+        )
+        self.board.stacking_limit = 2
+        self.board.add_unit(self.red_unit, 0, 0)
+        self.board.add_unit(stacked_red, 0, 0)
+        self.board.add_unit(second_red, 4, 4)
+        self.board.add_unit(self.blue_unit, 2, 2)
+        units = [self.red_unit, second_red, off_board, stacked_red,
+                 self.blue_unit]
+
+        trees = self.board.get_path_trees(units)
+
+        self.assertIsNone(trees[2])
+        self.assertIs(trees[0], trees[3])
+        for unit, tree in zip(units, trees):
+            if tree is None:
+                continue
+            single = self.board.get_path_tree(
+                unit, self.board.get_hex(*unit.get_coords())
+            )
+            self.assertEqual(single.cost_by_id, tree.cost_by_id)
+            self.assertEqual(
+                single.predecessor_by_id, tree.predecessor_by_id
+            )
+            self.assertEqual(single.reached_ids, tree.reached_ids)
+
+        half_trees = self.board.get_path_trees(
+            [self.red_unit, stacked_red], [6, 1]
+        )
+        self.assertIsNot(half_trees[0], half_trees[1])
+        self.assertEqual(1, half_trees[1].move_points)
+
+    def test_dial_engine_matches_heap_engine(self):
+        self.board.add_unit(self.red_unit, 2, 2)
+        self.board.add_unit(self.blue_unit, 4, 1)
+        start_hex = self.board.get_hex(2, 2)
+        forest = Terrain("forest", "#558855", move_cost=2)
+        marsh = Terrain("marsh", "#445533", move_cost=1.5)
+        for coords in ((1, 2), (2, 3), (3, 3)):
+            self.board.get_hex(*coords).set_terrain(forest)
+        self.board.get_hex(2, 1).set_terrain(marsh)
+        self.board.set_road_types({"track": 0.25})
+        self.board.set_road_paths([("track", ((2, 2), (2, 3), (3, 4)))])
+
+        trees = [
+            MovementCalculator(self.board, engine).get_path_tree(
+                self.red_unit, start_hex
+            )
+            for engine in MovementCalculator.ENGINES
+        ]
+
+        heap_tree, dial_tree = trees
+        self.assertEqual(heap_tree.cost_by_id, dial_tree.cost_by_id)
+        self.assertEqual(
+            heap_tree.predecessor_by_id, dial_tree.predecessor_by_id
+        )
+        self.assertEqual(heap_tree.reached_ids, dial_tree.reached_ids)
+
+        self.board.set_movement_engine(MovementCalculator.DIAL_ENGINE)
+        self.assertEqual(
+            heap_tree.path_to(self.board.get_hex(4, 4)),
+            self.board.shortest_path(
+                self.red_unit, start_hex, self.board.get_hex(4, 4)
+            ),
+        )
+
+    def test_dial_engine_falls_back_for_fine_grained_costs(self):
+        self.board.add_unit(self.red_unit, 2, 2)
+        start_hex = self.board.get_hex(2, 2)
+        self.board.get_hex(2, 3).set_terrain(
+            Terrain("scrub", "#88AA66", move_cost=1.1)
+        )
+
+        self.assertIsNone(self.board.layers.fixed_point_edge_move_cost)
+        heap_reachable = self.board.get_reachable_hexes(
+            self.red_unit, start_hex
+        )
+        self.board.set_movement_engine(MovementCalculator.DIAL_ENGINE)
+
+        self.assertEqual(
+            heap_reachable,
+            self.board.get_reachable_hexes(self.red_unit, start_hex),
+        )
+
+    def test_set_movement_engine_rejects_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            self.board.set_movement_engine("astar")
+        with self.assertRaises(ValueError):
+            MovementCalculator(self.board, "astar")
+
     def test_shortest_path_prefers_lower_total_cost(self):
         self.board = Board(3, 4)
         self.board.add_unit(self.red_unit, 1, 0)
@@ -459,6 +625,111 @@ class TestBoard(unittest.TestCase):
         self.assertEqual(Board.hex_distance(a, b), 1)
         self.assertEqual(Board.hex_distance(a, c), 2)
 
+    def test_hex_distances_batches_hex_distance(self):
+        origin = self.board.get_hex(2, 1)
+
+        distances = Board.hex_distances(origin, self.board.hexes)
+
+        self.assertEqual(
+            [Board.hex_distance(origin, h) for h in self.board.hexes],
+            distances,
+        )
+
+    def test_unit_distance_matrix(self):
+        self.board.add_unit(self.red_unit, 0, 0)
+        self.board.add_unit(self.blue_unit, 1, 1)
+        removed = Unit(
+            id=str(uuid.uuid4()), name="Removed", faction=self.red_faction,
+            player=self.red_player,
+            type="Infantry", attack=1, defense=1, move=1
+        )
+
+        matrix = self.board.unit_distance_matrix(
+            [self.red_unit, self.blue_unit, removed]
+        )
+
+        self.assertEqual(
+            [[0, 2, None], [2, 0, None], [None, None, None]], matrix
+        )
+
+    def _red_unit(self, name):
+        return Unit(
+            id=str(uuid.uuid4()), name=name, faction=self.red_faction,
+            player=self.red_player,
+            type="Infantry", attack=1, defense=1, move=1
+        )
+
+    def test_get_nearest_units_orders_by_distance_then_board_order(self):
+        far = self._red_unit("Far")
+        near_first = self._red_unit("Near First")
+        near_second = self._red_unit("Near Second")
+        self.board.add_unit(self.red_unit, 2, 2)
+        self.board.add_unit(far, 4, 4)
+        self.board.add_unit(near_second, 3, 2)
+        self.board.add_unit(near_first, 1, 2)
+        self.board.add_unit(self.blue_unit, 2, 3)
+
+        nearest = self.board.get_nearest_units(self.red_unit, True, 3)
+
+        self.assertEqual([near_second, near_first, far], nearest)
+        self.assertIs(
+            near_second, self.board.get_nearest_friendly_unit(self.red_unit)
+        )
+        self.assertIs(
+            self.blue_unit, self.board.get_nearest_enemy_unit(self.red_unit)
+        )
+
+    def test_get_nearest_unit_without_match(self):
+        self.board.add_unit(self.red_unit, 2, 2)
+
+        self.assertIsNone(self.board.get_nearest_enemy_unit(self.red_unit))
+
+    def test_get_units_within_radius(self):
+        far = self._red_unit("Far")
+        self.board.add_unit(self.red_unit, 0, 0)
+        self.board.add_unit(self.blue_unit, 1, 0)
+        self.board.add_unit(far, 4, 4)
+
+        self.assertEqual(
+            [(self.blue_unit, 1)],
+            self.board.get_units_within(self.red_unit, 2),
+        )
+        self.assertEqual(
+            [], self.board.get_units_within(self.red_unit, 2, friend=True)
+        )
+
+    def test_get_units_for_player_follows_board_changes(self):
+        ally_faction = Faction(
+            id=str(uuid.uuid4()), name="Ally Faction", color="#FF8800"
+        )
+        self.red_player.add_faction(ally_faction)
+        ally = Unit(
+            id=str(uuid.uuid4()), name="Ally", faction=ally_faction,
+            player=self.red_player,
+            type="Infantry", attack=1, defense=1, move=1
+        )
+        second_red = self._red_unit("Second Red")
+        self.board.add_unit(self.red_unit, 0, 0)
+        self.board.add_unit(ally, 0, 1)
+        self.board.add_unit(self.blue_unit, 4, 4)
+        self.board.add_unit(second_red, 0, 2)
+
+        self.assertEqual(
+            [self.red_unit, ally, second_red],
+            self.board.get_units_for_player(self.red_player),
+        )
+
+        self.board.remove_units(ally)
+
+        self.assertEqual(
+            [self.red_unit, second_red],
+            self.board.get_units_for_player(self.red_player),
+        )
+        self.assertEqual(
+            [self.blue_unit],
+            self.board.get_units_for_player(self.blue_player),
+        )
+
     def test_path_towards_limited_steps(self):
         self.board.add_unit(self.red_unit, 2, 1)
         self.board.add_unit(self.blue_unit, 4, 1)
@@ -529,3 +800,149 @@ class TestBoard(unittest.TestCase):
             [friendly_unit],
             self.board.get_units_for_player(player),
         )
+
+    def test_get_units_at_follows_set_coords(self):
+        self.board.add_unit(self.red_unit, 0, 0)
+
+        self.red_unit.set_coords(3, 4)
+
+        self.assertEqual([], self.board.get_units_at(0, 0))
+        self.assertEqual([self.red_unit], self.board.get_units_at(3, 4))
+        self.assertIs(self.red_unit, self.board.get_unit_at(3, 4))
+
+    def test_get_units_at_drops_removed_units(self):
+        self.board.add_unit(self.red_unit, 1, 1)
+        self.board.add_unit(self.blue_unit, 1, 1)
+
+        self.board.remove_units([self.red_unit])
+
+        self.assertEqual([self.blue_unit], self.board.get_units_at(1, 1))
+        self.red_unit.set_coords(1, 1)
+        self.assertEqual([self.blue_unit], self.board.get_units_at(1, 1))
+
+    def test_get_units_at_keeps_board_order_for_stacks(self):
+        self.board.add_unit(self.red_unit, 0, 0)
+        self.board.add_unit(self.blue_unit, 2, 2)
+
+        self.red_unit.set_coords(2, 2)
+
+        self.assertEqual(
+            [self.red_unit, self.blue_unit],
+            self.board.get_units_at(2, 2),
+        )
+        self.assertEqual(
+            [self.red_unit, self.blue_unit],
+            self.board.get_units_for_hexes([self.board.get_hex(2, 2)]),
+        )
+
+    def test_enemy_adjacent_follows_enemy_movement(self):
+        self.board.add_unit(self.red_unit, 2, 2)
+        self.board.add_unit(self.blue_unit, 1, 2)
+        target_hex = self.board.get_hex(2, 2)
+
+        self.blue_unit.set_coords(4, 4)
+        self.assertFalse(self.board.enemy_adjacent(self.red_unit, target_hex))
+
+        self.blue_unit.set_coords(2, 3)
+        self.assertTrue(self.board.enemy_adjacent(self.red_unit, target_hex))
+
+        self.board.remove_units(self.blue_unit)
+        self.assertFalse(self.board.enemy_adjacent(self.red_unit, target_hex))
+
+    def test_enemy_adjacent_is_per_player(self):
+        self.board.add_unit(self.red_unit, 2, 2)
+        self.board.add_unit(self.blue_unit, 2, 3)
+
+        self.assertTrue(
+            self.board.enemy_adjacent(self.blue_unit, self.board.get_hex(1, 2))
+        )
+        self.assertFalse(
+            self.board.enemy_adjacent(self.red_unit, self.board.get_hex(1, 2))
+        )
+
+    def test_adjacent_unit_counts_total_and_per_player(self):
+        self.board.add_unit(self.red_unit, 2, 2)
+        self.board.add_unit(self.blue_unit, 2, 3)
+        hex_id = self.board.hex_id(1, 3)
+        green_player = Player(
+            name='Green Player', type=PlayerType.CPU, factions=[]
+        )
+
+        self.assertEqual(2, self.board.adjacent_unit_counts()[hex_id])
+        self.assertEqual(
+            1, self.board.adjacent_unit_counts(self.red_player)[hex_id]
+        )
+        self.assertEqual(
+            0, self.board.adjacent_unit_counts(green_player)[hex_id]
+        )
+
+        self.blue_unit.set_coords(4, 4)
+        self.assertEqual(1, self.board.adjacent_unit_counts()[hex_id])
+        self.assertEqual(
+            0, self.board.adjacent_unit_counts(self.blue_player)[hex_id]
+        )
+
+    def test_path_tree_answers_reachability_cost_and_paths(self):
+        self.board.add_unit(self.red_unit, 2, 2)
+        self.board.add_unit(self.blue_unit, 0, 4)
+        start_hex = self.board.get_hex(2, 2)
+        forest = Terrain("forest", "#558855", move_cost=2)
+        self.board.get_hex(3, 2).set_terrain(forest)
+
+        path_tree = self.board.get_path_tree(self.red_unit, start_hex)
+
+        self.assertEqual(
+            self.board.get_reachable_hexes(self.red_unit, start_hex),
+            path_tree.reachable_hexes(),
+        )
+        self.assertEqual(0, path_tree.cost_to(start_hex))
+        self.assertEqual(2, path_tree.cost_to(self.board.get_hex(3, 2)))
+        for reachable_hex in path_tree.reachable_hexes():
+            self.assertEqual(
+                self.board.shortest_path(
+                    self.red_unit, start_hex, reachable_hex
+                ),
+                path_tree.path_to(reachable_hex),
+            )
+
+    def test_path_tree_returns_empty_path_when_unreachable(self):
+        self.board.add_unit(self.red_unit, 0, 0)
+        start_hex = self.board.get_hex(0, 0)
+
+        path_tree = self.board.get_path_tree(
+            self.red_unit, start_hex, move_points=1
+        )
+        far_hex = self.board.get_hex(4, 4)
+
+        self.assertFalse(path_tree.is_reachable(far_hex))
+        self.assertIsNone(path_tree.cost_to(far_hex))
+        self.assertEqual([], path_tree.path_to(far_hex))
+
+    def test_paths_beyond_unit_allowance_keep_original_semantics(self):
+        slow_unit = Unit(
+            id=str(uuid.uuid4()), name="Slow Unit", faction=self.red_faction,
+            player=self.red_player,
+            type="Infantry", attack=2, defense=2, move=1
+        )
+        self.board.add_unit(slow_unit, 2, 2)
+        center_hex = self.board.get_hex(2, 2)
+
+        def coords(path):
+            return [(hex_tile.row, hex_tile.column) for hex_tile in path]
+
+        # The farthest hex within three points is beyond the unit's own
+        # allowance, so the unit stays put.
+        self.assertEqual(
+            [(2, 2)],
+            coords(self.board.path_away_from(slow_unit, center_hex, 3)),
+        )
+        self.assertEqual(
+            [(2, 2), (1, 2)],
+            coords(self.board.path_away_from(slow_unit, center_hex, 1)),
+        )
+        self.assertEqual(
+            [(2, 2), (1, 3)],
+            coords(self.board.path_towards(
+                slow_unit, self.board.get_hex(0, 4), 3
+            )),
+        )
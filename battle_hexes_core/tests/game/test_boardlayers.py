@@ -0,0 +1,127 @@
+import unittest
+
+from battle_hexes_core.game.board import Board
+from battle_hexes_core.game.objective import Objective
+from battle_hexes_core.game.player import PlayerType
+from battle_hexes_core.game.terrain import Terrain
+from tests.helpers import make_side, make_unit
+
+
+class TestBoardLayers(unittest.TestCase):
+    def setUp(self):
+        self.board = Board(3, 4)
+        self.red_faction, self.red_player = make_side(
+            "Red", "#FF0000", PlayerType.HUMAN
+        )
+        self.blue_faction, self.blue_player = make_side("Blue", "#0000FF")
+
+    def test_terrain_layers_follow_set_terrain(self):
+        layers = self.board.layers
+        self.assertEqual([1] * 12, layers.move_cost)
+
+        self.board.get_hex(1, 2).set_terrain(
+            Terrain("forest", "#00AA00", 2, 0.5, -1)
+        )
+
+        hex_id = self.board.hex_id(1, 2)
+        self.assertEqual(2, layers.move_cost[hex_id])
+        self.assertEqual(-1, layers.combat_odds_shift[hex_id])
+        self.assertEqual(0.5, layers.defensive_fire_modifier[hex_id])
+        self.assertEqual(1, layers.move_cost[0])
+
+    def test_edge_move_cost_combines_terrain_and_roads(self):
+        self.board.get_hex(1, 2).set_terrain(
+            Terrain("forest", "#00AA00", 2, 0.5, -1)
+        )
+        self.board.set_road_types({"highway": 0.5, "track": 3})
+        self.board.set_road_paths([
+            ("highway", ((1, 1), (1, 2))),
+            ("track", ((0, 0), (0, 1))),
+            ("unknown", ((2, 0), (2, 1))),
+        ])
+
+        geometry = self.board.geometry
+        edge_move_cost = self.board.layers.edge_move_cost
+
+        def cost(start, end):
+            start_id = self.board.hex_id(*start)
+            index = geometry.neighbor_ids[start_id].index(
+                self.board.hex_id(*end)
+            )
+            return edge_move_cost[start_id][index]
+
+        self.assertEqual(0.5, cost((1, 1), (1, 2)))
+        self.assertEqual(0.5, cost((1, 2), (1, 1)))
+        self.assertEqual(2, cost((1, 3), (1, 2)))
+        self.assertEqual(1, cost((0, 0), (0, 1)))
+        self.assertEqual(1, cost((2, 0), (2, 1)))
+
+    def test_objective_mask_follows_hex_objectives(self):
+        objective = Objective(coords=(2, 1), points=3, type="hold")
+
+        self.board.get_hex(2, 1).objectives.append(objective)
+
+        mask = self.board.layers.objective_mask
+        self.assertEqual([self.board.hex_id(2, 1)], [
+            hex_id for hex_id, flagged in enumerate(mask) if flagged
+        ])
+
+        self.board.get_hex(2, 1).objectives.clear()
+        self.assertFalse(any(self.board.layers.objective_mask))
+
+    def test_occupancy_layers_follow_units(self):
+        unit = make_unit(self.red_faction, self.red_player, "red-1")
+        self.board.add_unit(unit, 0, 0)
+        layers = self.board.layers
+
+        self.assertEqual(1, layers.unit_count[0])
+        self.assertIs(self.red_player, layers.owner[0])
+
+        unit.set_coords(1, 1)
+
+        hex_id = self.board.hex_id(1, 1)
+        self.assertEqual(0, layers.unit_count[0])
+        self.assertIsNone(layers.owner[0])
+        self.assertEqual(1, layers.unit_count[hex_id])
+        self.assertTrue(layers.occupied_mask(self.red_player)[hex_id])
+        self.assertFalse(layers.occupied_mask(self.blue_player)[hex_id])
+
+    def test_enterable_mask_matches_can_unit_enter_hex(self):
+        red = make_unit(self.red_faction, self.red_player, "red-1")
+        other_red = make_unit(self.red_faction, self.red_player, "red-2")
+        blue = make_unit(self.blue_faction, self.blue_player, "blue-1")
+        self.board.stacking_limit = 1
+        self.board.add_unit(red, 0, 0)
+        self.board.add_unit(other_red, 1, 1)
+        self.board.add_unit(blue, 2, 3)
+
+        mask = self.board.layers.enterable_mask(self.red_player)
+
+        # Hex 0 is red's own hex, where can_unit_enter_hex skips red itself.
+        self.assertEqual(
+            [
+                self.board.can_unit_enter_hex(
+                    red, hex_tile.row, hex_tile.column
+                )
+                for hex_tile in self.board.hexes
+            ][1:],
+            mask[1:],
+        )
+        self.assertFalse(mask[self.board.hex_id(1, 1)])
+        self.assertFalse(mask[self.board.hex_id(2, 3)])
+
+    def test_zone_of_control_mask_matches_enemy_adjacent(self):
+        red = make_unit(self.red_faction, self.red_player, "red-1")
+        blue = make_unit(self.blue_faction, self.blue_player, "blue-1")
+        self.board.add_unit(red, 0, 0)
+        self.board.add_unit(blue, 2, 3)
+
+        mask = self.board.layers.zone_of_control_mask(self.red_player)
+
+        self.assertEqual(
+            [
+                self.board.enemy_adjacent(red, hex_tile)
+                for hex_tile in self.board.hexes
+            ],
+            mask,
+        )
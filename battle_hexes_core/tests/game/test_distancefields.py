@@ -0,0 +1,104 @@
+import math
+import unittest
+
+from battle_hexes_core.game.board import Board
+from battle_hexes_core.game.objective import Objective
+from battle_hexes_core.game.player import PlayerType
+from battle_hexes_core.game.terrain import Terrain
+from tests.helpers import make_side, make_unit
+
+
+class TestDistanceFields(unittest.TestCase):
+    def setUp(self):
+        self.board = Board(6, 6)
+        self.red_faction, self.red_player = make_side(
+            "Red", "#FF0000", PlayerType.HUMAN
+        )
+        self.blue_faction, self.blue_player = make_side("Blue", "#0000FF")
+        self.fields = self.board.get_distance_fields()
+
+    def test_faction_field_measures_cost_to_nearest_unit(self):
+        red = make_unit(self.red_faction, self.red_player, "red-1")
+        blue_near = make_unit(self.blue_faction, self.blue_player, "blue-1")
+        blue_far = make_unit(self.blue_faction, self.blue_player, "blue-2")
+        self.board.add_unit(red, 0, 0)
+        self.board.add_unit(blue_near, 3, 0)
+        self.board.add_unit(blue_far, 5, 5)
+
+        field = self.fields.faction_field(self.blue_faction)
+
+        self.assertEqual(3, self.fields.distance_to_factions(
+            red, self.blue_faction
+        ))
+        self.assertEqual(0, field[self.board.hex_id(5, 5)])
+        self.assertEqual(
+            0, self.fields.distance_to_factions(red, [self.red_faction])
+        )
+        self.assertIs(self.fields, self.board.get_distance_fields())
+
+    def test_field_prices_terrain_and_roads(self):
+        red = make_unit(self.red_faction, self.red_player, "red-1")
+        blue = make_unit(self.blue_faction, self.blue_player, "blue-1")
+        self.board.add_unit(red, 0, 0)
+        self.board.add_unit(blue, 2, 0)
+        forest = Terrain("forest", "#558855", move_cost=3)
+        self.board.get_hex(1, 0).set_terrain(forest)
+
+        self.assertEqual(
+            3, self.fields.distance_to_factions(red, self.blue_faction)
+        )
+
+        self.board.get_hex(1, 1).set_terrain(forest)
+        self.board.get_hex(0, 1).set_terrain(forest)
+        self.assertEqual(
+            4, self.fields.distance_to_factions(red, self.blue_faction)
+        )
+
+        self.board.set_road_types({"secondary": 0.5})
+        self.board.set_road_paths([
+            ("secondary", ((0, 0), (1, 0), (2, 0))),
+        ])
+        self.assertEqual(
+            1, self.fields.distance_to_factions(red, self.blue_faction)
+        )
+
+    def test_field_is_rebuilt_only_when_its_factions_move(self):
+        red = make_unit(self.red_faction, self.red_player, "red-1")
+        blue = make_unit(self.blue_faction, self.blue_player, "blue-1")
+        self.board.add_unit(red, 0, 0)
+        self.board.add_unit(blue, 4, 0)
+        field = self.fields.faction_field(self.blue_faction)
+
+        red.set_coords(1, 0)
+        self.assertIs(field, self.fields.faction_field(self.blue_faction))
+        self.assertEqual(
+            3, self.fields.distance_to_factions(red, self.blue_faction)
+        )
+
+        blue.set_coords(2, 0)
+        self.assertEqual(
+            1, self.fields.distance_to_factions(red, self.blue_faction)
+        )
+
+        self.board.remove_units(blue)
+        self.assertTrue(all(
+            math.isinf(distance)
+            for distance in self.fields.faction_field(self.blue_faction)
+        ))
+
+    def test_objective_field_and_off_board_units(self):
+        objective = Objective(coords=(5, 2), points=1, type="hold")
+        self.board.get_hex(5, 2).objectives.append(objective)
+        red = make_unit(self.red_faction, self.red_player, "red-1")
+        self.board.add_unit(red, 2, 2)
+
+        self.assertEqual(3, self.fields.distance_to_objective(red))
+        self.assertEqual(
+            0, self.fields.objective_field()[self.board.hex_id(5, 2)]
+        )
+
+        off_board = make_unit(self.red_faction, self.red_player, "red-2")
+        self.assertIsNone(self.fields.distance_to_objective(off_board))
+        self.assertIsNone(
+            self.fields.distance_to_factions(off_board, self.red_faction)
+        )
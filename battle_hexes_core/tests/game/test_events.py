@@ -0,0 +1,156 @@
+import unittest
+
+from battle_hexes_core.game.board import Board
+from battle_hexes_core.game.events import (
+    DefensiveFireChanged,
+    DefensiveFireSpent,
+    EventBus,
+    TurnAdvanced,
+    UnitEvent,
+    UnitMoved,
+    UnitPlaced,
+    UnitRemoved,
+)
+from battle_hexes_core.game.game import Game
+from battle_hexes_core.game.player import PlayerType
+from tests.helpers import make_side, make_unit
+
+
+class TestEventBus(unittest.TestCase):
+    def test_base_class_subscribers_receive_subclass_events(self):
+        bus = EventBus()
+        received = []
+        bus.subscribe(UnitEvent, lambda event: received.append(("any", event)))
+        bus.subscribe(
+            UnitMoved, lambda event: received.append(("moved", event))
+        )
+
+        placed = UnitPlaced("unit", None, (0, 0))
+        moved = UnitMoved("unit", (0, 0), (0, 1))
+        bus.publish(placed)
+        bus.publish(moved)
+
+        self.assertEqual(
+            [("any", placed), ("any", moved), ("moved", moved)],
+            received,
+        )
+
+    def test_unsubscribe_stops_delivery(self):
+        bus = EventBus()
+        received = []
+        bus.subscribe(UnitRemoved, received.append)
+        bus.publish(UnitRemoved("unit", (0, 0), None))
+
+        bus.unsubscribe(UnitRemoved, received.append)
+        bus.publish(UnitRemoved("unit", (0, 1), None))
+
+        self.assertEqual([UnitRemoved("unit", (0, 0), None)], received)
+        with self.assertRaises(ValueError):
+            bus.unsubscribe(UnitRemoved, received.append)
+
+
+class TestBoardEvents(unittest.TestCase):
+    def setUp(self):
+        self.board = Board(5, 5)
+        self.red_faction, self.red_player = make_side(
+            "Red", "#FF0000", PlayerType.HUMAN
+        )
+        self.blue_faction, self.blue_player = make_side("Blue", "#0000FF")
+        self.events = []
+        self.board.events.subscribe(object, self.events.append)
+
+    def test_board_publishes_unit_lifecycle_events(self):
+        unit = make_unit(self.red_faction, self.red_player, "red-1")
+
+        self.board.add_unit(unit, 1, 1)
+        unit.set_coords(1, 2)
+        unit.forced_move(self.board, (1, 1), 1)
+        self.board.remove_units(unit)
+
+        self.assertEqual(
+            [
+                UnitPlaced(unit, None, (1, 1)),
+                UnitMoved(unit, (1, 1), (1, 2)),
+                UnitMoved(unit, (1, 2), (0, 3)),
+                UnitRemoved(unit, (0, 3), None),
+            ],
+            self.events,
+        )
+        self.assertEqual([], self.board.get_units_at(0, 3))
+
+    def test_replacing_a_unit_publishes_removal_then_placement(self):
+        original = make_unit(self.red_faction, self.red_player, "red-1")
+        replacement = make_unit(
+            self.red_faction, self.red_player, "red-1",
+            unit_id=original.get_id(),
+        )
+        self.board.add_unit(original, 1, 1)
+        self.events.clear()
+
+        self.board.add_unit(replacement, 2, 2)
+
+        self.assertEqual(
+            [
+                UnitRemoved(original, (1, 1), None),
+                UnitPlaced(replacement, None, (2, 2)),
+            ],
+            self.events,
+        )
+
+    def test_spending_defensive_fire_publishes_events(self):
+        unit = make_unit(self.blue_faction, self.blue_player, "blue-1")
+        self.board.add_unit(unit, 0, 0)
+        self.events.clear()
+
+        unit.spend_defensive_fire(self.red_player)
+
+        self.assertEqual(
+            [
+                DefensiveFireChanged(unit, (0, 0), (0, 0)),
+                DefensiveFireSpent(unit),
+            ],
+            self.events,
+        )
+
+    def test_defensive_fire_changed_only_when_status_changes(self):
+        unit = make_unit(self.blue_faction, self.blue_player, "blue-1")
+        self.board.add_unit(unit, 0, 0)
+        self.events.clear()
+
+        unit.update_defensive_fire_available(self.red_player)
+        unit.reset_defensive_fire_for_new_turn(self.red_player)
+        self.assertEqual([], self.events)
+
+        unit.record_forced_retreat(self.red_player)
+        unit.record_forced_retreat(self.red_player)
+        self.assertEqual(
+            [DefensiveFireChanged(unit, (0, 0), (0, 0))], self.events
+        )
+
+    def test_refreshing_unchanged_units_publishes_nothing(self):
+        red = make_unit(self.red_faction, self.red_player, "red-1")
+        blue = make_unit(self.blue_faction, self.blue_player, "blue-1")
+        self.board.add_unit(red, 0, 0)
+        self.board.add_unit(blue, 3, 3)
+        game = Game([self.red_player, self.blue_player], self.board)
+        self.events.clear()
+
+        game._refresh_defensive_fire_availability(self.board.get_units())
+
+        self.assertEqual([], self.events)
+
+    def test_next_player_publishes_turn_advanced(self):
+        game = Game([self.red_player, self.blue_player], self.board)
+        turns = []
+        self.board.events.subscribe(TurnAdvanced, turns.append)
+
+        game.next_player()
+        game.next_player()
+
+        self.assertEqual(
+            [
+                TurnAdvanced(self.red_player, self.blue_player, 1),
+                TurnAdvanced(self.blue_player, self.red_player, 2),
+            ],
+            turns,
+        )
@@ -182,6 +182,31 @@ class TestGame(unittest.TestCase):
         self.assertEqual(unit.get_coords(), (0, 1))
         self.assertFalse(unit.defensive_fire_available)
 
+    def test_apply_movement_plans_only_refreshes_changed_units(self):
+        board, player1, _, faction1, _, game = self._make_two_player_game()
+        mover = Unit("mover", "Mover", faction1, player1, "Infantry", 1, 1, 3)
+        bystander = Unit(
+            "bystander", "Bystander", faction1, player1, "Infantry", 1, 1, 3
+        )
+        board.add_unit(mover, 0, 0)
+        board.add_unit(bystander, 4, 4)
+        game.apply_movement_plans([])
+
+        with patch.object(
+            bystander,
+            "update_defensive_fire_available",
+            wraps=bystander.update_defensive_fire_available,
+        ) as bystander_update:
+            game.apply_movement_plans([
+                UnitMovementPlan(
+                    mover, [board.get_hex(0, 0), board.get_hex(0, 1)]
+                )
+            ])
+
+        bystander_update.assert_not_called()
+        self.assertEqual((0, 1), mover.get_coords())
+        self.assertTrue(mover.defensive_fire_available)
+
     def test_next_player_makes_unit_ineligible_with_one_move_remaining(self):
         board = Board(5, 5)
         faction1 = Faction(id="f1", name="f", color="#fff")
@@ -3,6 +3,7 @@ import uuid
 from unittest.mock import patch
 
 from battle_hexes_core.game.gamefactory import GameFactory
+from battle_hexes_core.game.gamerandom import GameRandom
 from battle_hexes_core.game.player import Player, PlayerType
 from battle_hexes_core.unit.faction import Faction
 from battle_hexes_core.unit.unit import Unit
@@ -67,3 +68,38 @@ class TestGameFactory(unittest.TestCase):
             game = factory.create_game()
         coords = [u.get_coords() for u in game.get_board().get_units()]
         self.assertCountEqual(coords, [(0, 2), (1, 0)])
+
+    def test_create_game_passes_random_streams_to_game(self):
+        factory = GameFactory(
+            self.board_size,
+            [self.player],
+            [self.unit1, self.unit2],
+        )
+        rng = GameRandom(3)
+        self.assertIs(rng, factory.create_game(rng=rng).get_random())
+        self.assertIsNone(factory.create_game().get_random().seed)
+
+    def test_seeded_games_place_units_reproducibly(self):
+        def placements(seed):
+            factory = GameFactory(
+                self.board_size,
+                [self.player],
+                [self.unit1, self.unit2],
+                randomize_positions=True,
+            )
+            return [
+                [
+                    unit.get_coords()
+                    for unit in factory.create_game(
+                        rng=GameRandom(seed).spawn(index)
+                    ).get_board().get_units()
+                ]
+                for index in range(5)
+            ]
+
+        with patch(
+            "battle_hexes_core.game.gamefactory.choice",
+            side_effect=AssertionError("global random used"),
+        ):
+            self.assertEqual(placements(21), placements(21))
+        self.assertNotEqual(placements(21), placements(22))
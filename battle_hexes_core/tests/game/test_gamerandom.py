@@ -0,0 +1,87 @@
+import random
+import unittest
+from unittest.mock import MagicMock
+
+from battle_hexes_core.combat.combat import Combat
+from battle_hexes_core.game.board import Board
+from battle_hexes_core.game.game import Game
+from battle_hexes_core.game.gamerandom import GameRandom
+from battle_hexes_core.game.player import PlayerType
+from battle_hexes_core.game.randomplayer import RandomPlayer
+from battle_hexes_core.training.agenttrainer import AgentTrainer
+from battle_hexes_core.unit.faction import Faction
+
+
+class TestGameRandom(unittest.TestCase):
+    def test_unseeded_streams_use_global_random(self):
+        self.assertIs(random, GameRandom().stream("combat"))
+
+    def test_seeded_streams_are_reproducible_and_independent(self):
+        first = GameRandom(7)
+        second = GameRandom(7)
+
+        self.assertIs(first.stream("combat"), first.stream("combat"))
+        combat_rolls = [first.stream("combat").random() for _ in range(5)]
+        first.stream("defensive_fire").random()
+
+        self.assertEqual(
+            combat_rolls,
+            [second.stream("combat").random() for _ in range(5)],
+        )
+        self.assertNotEqual(
+            combat_rolls[0], GameRandom(7).stream("defensive_fire").random()
+        )
+
+    def test_spawned_games_differ_but_are_reproducible(self):
+        base = GameRandom(7)
+
+        self.assertEqual(base.spawn(3).seed, GameRandom(7).spawn(3).seed)
+        self.assertNotEqual(base.spawn(3).seed, base.spawn(4).seed)
+        self.assertIsNone(GameRandom().spawn(3).seed)
+
+    def test_game_hands_streams_to_solver_resolver_and_players(self):
+        def roll_game(seed):
+            board = Board(3, 3)
+            player = RandomPlayer(
+                name="Random",
+                type=PlayerType.CPU,
+                factions=[Faction(id="f", name="F", color="red")],
+                board=board,
+            )
+            game = Game([player], board, rng=GameRandom(seed))
+            solver = Combat(game).combat_solver
+            return (
+                [solver._roll_die() for _ in range(5)],
+                game.defensive_fire_resolver.random.random(),
+                player.random_hex(set(board.hexes)),
+            )
+
+        self.assertEqual(roll_game(11), roll_game(11))
+        self.assertNotEqual(roll_game(11), roll_game(12))
+
+    def test_reused_player_is_rebound_for_every_game(self):
+        board = Board(3, 3)
+        player = RandomPlayer(
+            name="Random",
+            type=PlayerType.CPU,
+            factions=[Faction(id="f", name="F", color="red")],
+            board=board,
+        )
+
+        seeded = GameRandom(5)
+        Game([player], board, rng=seeded)
+        self.assertIs(seeded.stream("player:0"), player._random)
+
+        Game([player], board)
+        self.assertIs(random, player._random)
+
+    def test_trainer_seeds_each_episode_through_the_factory(self):
+        factory = MagicMock()
+        factory.create_game.side_effect = RuntimeError("stop")
+        trainer = AgentTrainer(factory, episodes=1, rng=GameRandom(7))
+
+        with self.assertRaises(RuntimeError):
+            trainer.train()
+
+        rng = factory.create_game.call_args.kwargs["rng"]
+        self.assertEqual(GameRandom(7).spawn(0).seed, rng.seed)
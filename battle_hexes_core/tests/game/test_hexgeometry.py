@@ -0,0 +1,91 @@
+import unittest
+
+from battle_hexes_core.game.board import Board
+from battle_hexes_core.game.hexgeometry import (
+    HexGeometry,
+    are_adjacent,
+    to_cube,
+    to_offset,
+)
+
+
+class TestHexGeometry(unittest.TestCase):
+    def test_for_shape_is_shared_between_boards(self):
+        self.assertIs(Board(4, 6).geometry, Board(4, 6).geometry)
+        self.assertIsNot(Board(4, 6).geometry, Board(6, 4).geometry)
+
+    def test_neighbor_ids_match_board_neighbors(self):
+        board = Board(5, 7)
+        geometry = HexGeometry.for_shape(5, 7)
+
+        for hex_id, hex_tile in enumerate(board.hexes):
+            expected = [
+                (neighbor.row, neighbor.column)
+                for neighbor in board.get_neighboring_hexes(hex_tile)
+            ]
+            actual = [
+                divmod(neighbor_id, 7)
+                for neighbor_id in geometry.neighbor_ids[hex_id]
+            ]
+            self.assertEqual(expected, actual)
+
+    def test_corner_has_two_neighbors(self):
+        geometry = HexGeometry.for_shape(3, 3)
+
+        self.assertEqual((1, 3), geometry.neighbor_ids[0])
+
+    def test_cube_round_trip(self):
+        for row in range(4):
+            for column in range(5):
+                cube = to_cube(row, column)
+                self.assertEqual((row, column), to_offset(*cube))
+
+    def test_neighbors_are_at_distance_one(self):
+        geometry = HexGeometry.for_shape(5, 6)
+
+        for hex_id, neighbor_ids in enumerate(geometry.neighbor_ids):
+            for neighbor_id in neighbor_ids:
+                self.assertEqual(1, geometry.distance(hex_id, neighbor_id))
+                self.assertTrue(
+                    are_adjacent(
+                        geometry.coords(hex_id), geometry.coords(neighbor_id)
+                    )
+                )
+
+    def test_distance_across_board(self):
+        geometry = HexGeometry.for_shape(5, 6)
+
+        self.assertEqual(
+            Board.hex_distance(Board(5, 6).get_hex(0, 0),
+                               Board(5, 6).get_hex(4, 5)),
+            geometry.distance(geometry.hex_id(0, 0), geometry.hex_id(4, 5)),
+        )
+        self.assertIsNone(geometry.hex_id(5, 0))
+
+    def test_distance_matrix_matches_pairwise_distance(self):
+        geometry = HexGeometry.for_shape(4, 5)
+        row_ids = [0, 7, 19]
+        column_ids = [3, 12, 0, 18]
+
+        matrix = geometry.distance_matrix(row_ids, column_ids)
+
+        self.assertEqual(
+            [
+                [geometry.distance(a, b) for b in column_ids]
+                for a in row_ids
+            ],
+            matrix,
+        )
+
+    def test_ring_ids_are_at_radius(self):
+        geometry = HexGeometry.for_shape(5, 6)
+        center = geometry.hex_id(2, 3)
+
+        for radius in range(4):
+            self.assertEqual(
+                sorted(
+                    hex_id for hex_id in range(geometry.size)
+                    if geometry.distance(center, hex_id) == radius
+                ),
+                sorted(geometry.ring_ids(center, radius)),
+            )
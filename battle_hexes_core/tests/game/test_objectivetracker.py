@@ -0,0 +1,139 @@
+import unittest
+from unittest.mock import patch
+
+from battle_hexes_core.combat.combat import Combat
+from battle_hexes_core.game.board import Board
+from battle_hexes_core.game.game import Game
+from battle_hexes_core.game.objective import Objective
+from battle_hexes_core.game.objectivetracker import ObjectiveTracker
+from battle_hexes_core.game.player import PlayerType
+from tests.helpers import make_side, make_unit
+
+
+class TestObjectiveTracker(unittest.TestCase):
+    def setUp(self):
+        self.board = Board(5, 5)
+        self.red_faction, self.red_player = make_side(
+            "Red", "#FF0000", PlayerType.HUMAN
+        )
+        self.blue_faction, self.blue_player = make_side("Blue", "#0000FF")
+        self.hold = Objective(coords=(1, 1), points=2, type="hold")
+        self.other = Objective(coords=(3, 3), points=5, type="capture")
+        self.board.get_hex(1, 1).objectives.append(self.hold)
+        self.board.get_hex(3, 3).objectives.append(self.other)
+        self.tracker = ObjectiveTracker(self.board)
+
+    def test_counts_objectives_held_by_each_player(self):
+        red = make_unit(self.red_faction, self.red_player, "red-1")
+        blue = make_unit(self.blue_faction, self.blue_player, "blue-1")
+        self.board.add_unit(red, 1, 1)
+        self.board.add_unit(blue, 3, 3)
+
+        self.assertEqual(2, self.tracker.objective_count)
+        self.assertEqual(1, self.tracker.held_count(self.red_player))
+        self.assertEqual(1, self.tracker.held_count(self.blue_player))
+        self.assertEqual(2, self.tracker.hold_points(self.red_player))
+        self.assertEqual(0, self.tracker.hold_points(self.blue_player))
+
+        red.set_coords(3, 3)
+
+        self.assertEqual(1, self.tracker.held_count(self.red_player))
+        self.assertEqual(0, self.tracker.hold_points(self.red_player))
+
+        self.board.remove_units(red)
+
+        self.assertEqual(0, self.tracker.held_count(self.red_player))
+        self.assertEqual(1, self.tracker.held_count(self.blue_player))
+
+    def test_engaged_units_do_not_hold_objectives(self):
+        red = make_unit(self.red_faction, self.red_player, "red-1")
+        blue = make_unit(self.blue_faction, self.blue_player, "blue-1")
+        self.board.add_unit(red, 1, 1)
+        self.board.add_unit(blue, 4, 4)
+        self.assertEqual([self.hold], self.tracker.held_hold_objectives(
+            self.red_player
+        ))
+
+        blue.set_coords(1, 2)
+
+        self.assertTrue(self.tracker.is_engaged(red))
+        self.assertEqual(1, self.tracker.held_count(self.red_player))
+        self.assertEqual(0, self.tracker.hold_points(self.red_player))
+        self.assertEqual(
+            [], self.tracker.held_hold_objectives(self.red_player)
+        )
+
+        blue.set_coords(4, 4)
+
+        self.assertFalse(self.tracker.is_engaged(red))
+        self.assertEqual(2, self.tracker.hold_points(self.red_player))
+
+    def test_engaged_units_match_find_combat_in_two_player_games(self):
+        positions = [(0, 0), (1, 1), (1, 2), (3, 3), (4, 4), (3, 0)]
+        units = []
+        for index, coords in enumerate(positions):
+            faction, player = (
+                (self.red_faction, self.red_player)
+                if index % 2 == 0
+                else (self.blue_faction, self.blue_player)
+            )
+            unit = make_unit(faction, player, f"unit-{index}")
+            self.board.add_unit(unit, *coords)
+            units.append(unit)
+        game = Game([self.red_player, self.blue_player], self.board)
+
+        in_battle = {
+            unit.get_id()
+            for attackers, defenders in Combat(game).find_combat()
+            for unit in attackers + defenders
+        }
+
+        self.assertEqual(
+            in_battle,
+            {
+                unit.get_id() for unit in units
+                if self.tracker.is_engaged(unit)
+            },
+        )
+        self.assertTrue(in_battle)
+
+    def test_units_facing_a_third_player_count_as_engaged(self):
+        green_faction, green_player = make_side("Green", "#00FF00")
+        blue = make_unit(self.blue_faction, self.blue_player, "blue-1")
+        green = make_unit(green_faction, green_player, "green-1")
+        self.board.add_unit(blue, 1, 1)
+        self.board.add_unit(green, 1, 2)
+        game = Game(
+            [self.red_player, self.blue_player, green_player], self.board
+        )
+
+        self.assertEqual([], Combat(game).find_combat())
+        self.assertTrue(self.tracker.is_engaged(blue))
+
+    def test_defensive_fire_changes_do_not_refresh_objectives(self):
+        blue = make_unit(self.blue_faction, self.blue_player, "blue-1")
+        self.board.add_unit(blue, 1, 1)
+        self.assertEqual(1, self.tracker.held_count(self.blue_player))
+
+        with patch.object(self.tracker, "_refresh") as refresh:
+            blue.spend_defensive_fire(self.red_player)
+            blue.record_forced_retreat(self.red_player)
+
+        refresh.assert_not_called()
+
+    def test_follows_objective_changes(self):
+        red = make_unit(self.red_faction, self.red_player, "red-1")
+        self.board.add_unit(red, 0, 0)
+        self.assertEqual(0, self.tracker.held_count(self.red_player))
+
+        extra = Objective(coords=(0, 0), points=3, type="hold")
+        self.board.get_hex(0, 0).objectives.append(extra)
+
+        self.assertEqual(3, self.tracker.objective_count)
+        self.assertEqual(1, self.tracker.held_count(self.red_player))
+        self.assertEqual(3, self.tracker.hold_points(self.red_player))
+
+        self.board.get_hex(0, 0).objectives.remove(extra)
+
+        self.assertEqual(2, self.tracker.objective_count)
+        self.assertEqual(0, self.tracker.held_count(self.red_player))
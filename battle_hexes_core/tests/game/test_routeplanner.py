@@ -0,0 +1,126 @@
+import unittest
+
+from battle_hexes_core.game.board import Board
+from battle_hexes_core.game.player import PlayerType
+from battle_hexes_core.game.terrain import Terrain
+from tests.helpers import make_side, make_unit
+
+
+class TestRoutePlanner(unittest.TestCase):
+    def setUp(self):
+        self.board = Board(8, 8)
+        self.red_faction, self.red_player = make_side(
+            "Red", "#FF0000", PlayerType.HUMAN
+        )
+        self.blue_faction, self.blue_player = make_side("Blue", "#0000FF")
+        self.planner = self.board.get_route_planner()
+
+    def _coords(self, hexes):
+        return [(hex_tile.row, hex_tile.column) for hex_tile in hexes]
+
+    def test_plans_route_beyond_one_turn_and_splits_legs(self):
+        unit = make_unit(self.red_faction, self.red_player, "red-1", move=2)
+        self.board.add_unit(unit, 0, 0)
+
+        route = self.planner.plan_route(unit, self.board.get_hex(5, 0))
+
+        self.assertEqual(
+            [(0, 0), (1, 0), (2, 0), (3, 0), (4, 0), (5, 0)],
+            self._coords(route.path),
+        )
+        self.assertEqual(5, route.cost)
+        self.assertEqual(3, route.turns)
+        self.assertEqual(
+            [
+                [(0, 0), (1, 0), (2, 0)],
+                [(2, 0), (3, 0), (4, 0)],
+                [(4, 0), (5, 0)],
+            ],
+            [self._coords(leg) for leg in route.legs],
+        )
+        self.assertIs(self.planner, self.board.get_route_planner())
+
+    def test_route_prefers_roads_and_avoids_costly_terrain(self):
+        unit = make_unit(self.red_faction, self.red_player, "red-1", move=2)
+        self.board.add_unit(unit, 0, 0)
+        forest = Terrain("forest", "#558855", move_cost=3)
+        for row in range(1, 4):
+            self.board.get_hex(row, 0).set_terrain(forest)
+        self.board.set_road_types({"secondary": 0.5})
+        self.board.set_road_paths([
+            ("secondary", ((0, 0), (1, 0), (2, 0), (3, 0), (4, 0))),
+        ])
+
+        route = self.planner.plan_route(unit, self.board.get_hex(4, 0))
+
+        self.assertEqual(2, route.cost)
+        self.assertEqual(1, route.turns)
+
+        self.board.set_road_paths(None)
+        route = self.planner.plan_route(unit, self.board.get_hex(4, 0))
+
+        self.assertNotIn((2, 0), self._coords(route.path))
+        self.assertEqual(5, route.cost)
+
+    def test_route_to_unit_stops_next_to_target_and_avoids_zoc(self):
+        unit = make_unit(self.red_faction, self.red_player, "red-1", move=2)
+        blocker = make_unit(
+            self.blue_faction, self.blue_player, "blue-1", move=2
+        )
+        target = make_unit(
+            self.blue_faction, self.blue_player, "blue-2", move=2
+        )
+        self.board.add_unit(unit, 0, 2)
+        self.board.add_unit(blocker, 2, 2)
+        self.board.add_unit(target, 6, 2)
+
+        route = self.planner.plan_route_to_unit(unit, target)
+
+        path_ids = [
+            self.board.hex_id(hex_tile.row, hex_tile.column)
+            for hex_tile in route.path
+        ]
+        self.assertIn(
+            path_ids[-1],
+            self.board.geometry.neighbor_ids[self.board.hex_id(6, 2)],
+        )
+        for hex_id in path_ids[:-1]:
+            self.assertFalse(self.board.enemy_adjacent_id(unit, hex_id))
+
+    def test_unreachable_destination_returns_none(self):
+        unit = make_unit(self.red_faction, self.red_player, "red-1", move=2)
+        self.board.add_unit(unit, 0, 0)
+        mountain = Terrain("mountain", "#777777", move_cost=3)
+        for neighbor in self.board.get_neighboring_hexes(
+            self.board.get_hex(0, 0)
+        ):
+            neighbor.set_terrain(mountain)
+
+        self.assertIsNone(
+            self.planner.plan_route(unit, self.board.get_hex(4, 4))
+        )
+
+    def test_cached_route_is_reused_until_board_changes_along_it(self):
+        unit = make_unit(self.red_faction, self.red_player, "red-1", move=2)
+        enemy = make_unit(
+            self.blue_faction, self.blue_player, "blue-1", move=2
+        )
+        self.board.add_unit(unit, 0, 0)
+        self.board.add_unit(enemy, 0, 7)
+        destination = self.board.get_hex(5, 0)
+        route = self.planner.plan_route(unit, destination)
+
+        leg_end = route.legs[0][-1]
+        unit.set_coords(leg_end.row, leg_end.column)
+        enemy.set_coords(0, 6)
+        remaining = self.planner.plan_route(unit, destination)
+
+        self.assertEqual(route.path[2:], remaining.path)
+        self.assertEqual(route.legs[1:], remaining.legs)
+
+        enemy.set_coords(4, 1)
+        replanned = self.planner.plan_route(unit, destination)
+
+        for hex_tile in replanned.path[:-1]:
+            self.assertFalse(self.board.enemy_adjacent(unit, hex_tile))
+        self.assertNotEqual(remaining.path, replanned.path)
@@ -0,0 +1,42 @@
+"""Builders for the factions, players and units used across tests."""
+
+import uuid
+
+from battle_hexes_core.game.player import Player, PlayerType
+from battle_hexes_core.unit.faction import Faction
+from battle_hexes_core.unit.unit import Unit
+
+
+def make_side(
+    name: str,
+    color: str,
+    player_type: PlayerType = PlayerType.CPU,
+) -> tuple[Faction, Player]:
+    """Return a new faction and the player that owns it."""
+    faction = Faction(
+        id=str(uuid.uuid4()), name=f"{name} Faction", color=color
+    )
+    player = Player(
+        name=f"{name} Player", type=player_type, factions=[faction]
+    )
+    return faction, player
+
+
+def make_unit(
+    faction: Faction,
+    player: Player,
+    name: str = "Infantry",
+    move: int = 4,
+    unit_id: str | None = None,
+) -> Unit:
+    """Return a 2-2 infantry unit with a random ID unless one is given."""
+    return Unit(
+        id=unit_id if unit_id is not None else str(uuid.uuid4()),
+        name=name,
+        faction=faction,
+        player=player,
+        type="Infantry",
+        attack=2,
+        defense=2,
+        move=move,
+    )
@@ -221,3 +221,13 @@ class TestUnit(unittest.TestCase):
         self.unit1.reset_defensive_fire_for_new_turn(self.player1)
         self.assertFalse(self.unit1.has_defensive_fire(self.player1))
         self.assertTrue(self.unit1.has_defensive_fire(self.player2))
+
+    def test_forced_move_updates_board_occupancy(self):
+        board = Board(6, 6)
+        board.add_unit(self.unit1, 2, 2)
+        board.add_unit(self.unit3, 2, 3)
+
+        self.unit1.forced_move(board, self.unit3.get_coords(), 2)
+
+        self.assertEqual([], board.get_units_at(2, 2))
+        self.assertEqual([self.unit1], board.get_units_at(1, 0))